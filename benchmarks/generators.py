@@ -0,0 +1,113 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "GENERATORS",
+    "generate"
+]
+
+from typing import Callable, Iterator
+
+# Declarations every program starts with
+PRELUDE = [
+    "const SYS_EXIT: int = 60;\n",
+    "const SYS_WRITE: int = 1;\n",
+    "const STDOUT: int = 1;\n",
+    "var ERRNO: int;\n",
+]
+
+# Statements every program ends with
+EPILOGUE = [
+    "syscall SYS_EXIT, ERRNO, ERRNO;\n",
+]
+
+def many_consts(lines: int) -> Iterator[str]:
+    """
+    Constant, variable and pointer declarations.
+    """
+    for i in range(lines):
+        match i % 4:
+            case 0 | 1:
+                yield f"const c{i}: int = {i};\n"
+            case 2:
+                yield f"var v{i}: int;\n"
+            case 3:
+                yield f"ptr p{i}: str = \"text {i}\";\n"
+
+def long_syscalls(lines: int) -> Iterator[str]:
+    """
+    Syscalls with every argument register used, over a few constants.
+    """
+    yield from ("const a: int = 1;\n", "const b: int = 2;\n", "const c: int = 3;\n")
+
+    for _ in range(lines - 3):
+        yield "syscall SYS_WRITE, STDOUT, a, b, c, a, b, ERRNO;\n"
+
+def deep_if_else(lines: int, depth: int = 32) -> Iterator[str]:
+    """
+    If-else blocks nested 'depth' deep, repeated until the size is reached.
+    """
+    yield from ("const x: int = 1;\n", "const y: int = 2;\n")
+
+    emitted = 2
+    block_lines = 5 * depth
+
+    while emitted + block_lines <= lines:
+        for _ in range(depth):
+            yield "if (x == y){\n"
+
+        for _ in range(depth):
+            yield "syscall SYS_EXIT, x, ERRNO;\n"
+            yield "} else {\n"
+            yield "syscall SYS_EXIT, y, ERRNO;\n"
+            yield "}\n"
+
+        emitted += block_lines
+
+    for _ in range(lines - emitted):
+        yield "syscall SYS_EXIT, x, ERRNO;\n"
+
+def arithmetic_chains(lines: int) -> Iterator[str]:
+    """
+    Chains of operations, each one using the result of the previous one.
+    """
+    yield from ("const a: int = 3;\n", "const b: int = 4;\n", "var r: int;\n")
+
+    operations = ("add", "mul", "sub", "div")
+
+    for i in range(lines - 3):
+        yield f"{operations[i % 4]} (r, b) into r;\n" if i % 16 else "add (a, b) into r;\n"
+
+GENERATORS: dict[str, Callable[[int], Iterator[str]]] = {
+    "consts": many_consts,
+    "syscalls": long_syscalls,
+    "if_else": deep_if_else,
+    "arithmetic": arithmetic_chains,
+}
+
+def generate(shape: str, lines: int) -> list[str]:
+    """
+    A program of the shape with about 'lines' lines.
+    """
+    body = max(lines - len(PRELUDE) - len(EPILOGUE), 4)
+
+    return [*PRELUDE, *GENERATORS[shape](body), *EPILOGUE]
@@ -0,0 +1,237 @@
+#!/usr/bin/python3
+
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Benchmark the compiler over generated programs of several shapes and
+sizes, and compare the results to a stored baseline.
+
+Each case (shape and size) runs in its own process, so its peak RSS is
+its own. Run from the repository root:
+
+    python -m benchmarks.run                          # Compare to the baseline
+    python -m benchmarks.run --save                   # Store the baseline
+    python -m benchmarks.run --sizes 1000 --shapes consts,if_else
+"""
+
+import sys
+import json
+import time
+import argparse
+import platform
+import resource
+import tempfile
+import subprocess
+
+from rich import print
+from rich.table import Table
+from pathlib import Path
+
+# Program generators
+from benchmarks.generators import GENERATORS, generate
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+SIZES = [1_000, 100_000, 1_000_000]
+
+# Time metrics are the best of the repeats, in seconds
+TIME_METRICS = ["lex", "parse", "codegen", "compile"]
+MEMORY_METRICS = ["peak_rss"]
+
+# A metric regresses when it grows by more than this fraction of the baseline
+THRESHOLD = 0.10
+
+def measure(shape: str, lines: int, repeat: int) -> dict[str, float]:
+    """
+    Measure a case in the current process.
+    """
+    # Front end
+    from manv.src.lexer.lexer import Lexer
+    from manv.src.parser.parser import Parser
+    from manv.src.codegen.codegen import Codegen
+
+    # Compiler
+    from manv.compiler import compile_file
+    from manv.toolchain import Toolchain
+
+    # Logs
+    from manv.log import configure
+
+    configure(level="error")
+
+    source = generate(shape=shape, lines=lines)
+    results = {metric: float("inf") for metric in TIME_METRICS}
+
+    with tempfile.TemporaryDirectory(prefix="manv-bench-") as tmp_dir:
+        file_path = Path(tmp_dir) / f"{shape}.mv"
+        file_path.write_text("".join(source))
+
+        for _ in range(repeat):
+            start = time.perf_counter()
+            tokens = Lexer().generate_tokens(data=source)
+            lexed = time.perf_counter()
+            program = Parser().parse(tokens=tokens)
+            parsed = time.perf_counter()
+            Codegen().codegen(program=program)
+            generated = time.perf_counter()
+
+            results["lex"] = min(results["lex"], lexed - start)
+            results["parse"] = min(results["parse"], parsed - lexed)
+            results["codegen"] = min(results["codegen"], generated - parsed)
+
+            del tokens, program
+
+            start = time.perf_counter()
+            compile_file(
+                file_path=file_path,
+                output_path=Path(tmp_dir) / shape,
+                toolchain=Toolchain(libs_dir_path=Path(tmp_dir) / "libs")
+            )
+            results["compile"] = min(results["compile"], time.perf_counter() - start)
+
+    # ru_maxrss is in KiB on Linux
+    results["peak_rss"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    return results
+
+def run_case(shape: str, lines: int, repeat: int) -> dict[str, float]:
+    """
+    Measure a case in a new process.
+    """
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.run", "--case", f"{shape}:{lines}", "--repeat", str(repeat)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=Path(__file__).parent.parent
+    )
+
+    if out.returncode != 0:
+        print(f"[bold red][ERROR][reset]: Caught the following error while running '{shape}:{lines}' \n{out.stderr.decode()}")
+        sys.exit(1)
+
+    return json.loads(out.stdout.decode().splitlines()[-1])
+
+def compare(results: dict, baseline: dict, threshold: float = THRESHOLD) -> list[str]:
+    """
+    The regressions of the results against the baseline, as
+    'case metric' descriptions.
+    """
+    regressions = []
+
+    for case, metrics in results.items():
+        if case not in baseline:
+            continue
+
+        for metric, value in metrics.items():
+            base = baseline[case].get(metric)
+
+            if base and value > base * (1 + threshold):
+                regressions.append(f"{case} {metric}: {format_metric(metric, base)} -> {format_metric(metric, value)} (+{(value / base - 1) * 100:.1f}%)")
+
+    return regressions
+
+def format_metric(metric: str, value: float) -> str:
+    """
+    A metric for humans.
+    """
+    if metric in MEMORY_METRICS:
+        return f"{value / (1 << 20):.1f} MiB"
+
+    return f"{value * 1000:.2f} ms"
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the compiler over generated programs.")
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="Comma separated numbers of lines.")
+    parser.add_argument("--shapes", default=",".join(GENERATORS), help="Comma separated program shapes.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs of each case, the best one is kept.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="The baseline to compare to.")
+    parser.add_argument("--save", action="store_true", help="Store the results as the baseline.")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="Allowed growth of a metric, as a fraction.")
+    parser.add_argument("--output", type=Path, default=None, help="Also write the results as JSON to this file.")
+    parser.add_argument("--case", default=None, help=argparse.SUPPRESS)   # Run by run_case
+    args = parser.parse_args()
+
+    if args.case is not None:
+        shape, lines = args.case.split(":")
+        sys.stdout.write(json.dumps(measure(shape=shape, lines=int(lines), repeat=args.repeat)) + "\n")
+        return
+
+    shapes = args.shapes.split(",")
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    for shape in shapes:
+        if shape not in GENERATORS:
+            print(f"[bold red][ERROR][reset]: Unknown shape '{shape}', expected one of: {', '.join(GENERATORS)}")
+            sys.exit(1)
+
+    results = {}
+
+    for shape in shapes:
+        for lines in sizes:
+            case = f"{shape}/{lines}"
+            print(f"[bold green][INFO][reset]: Running [cyan]'{case}'[reset]...")
+
+            results[case] = run_case(shape=shape, lines=lines, repeat=args.repeat)
+
+    table = Table("case", *TIME_METRICS, *MEMORY_METRICS)
+
+    for case, metrics in results.items():
+        table.add_row(case, *[format_metric(metric, metrics[metric]) for metric in TIME_METRICS + MEMORY_METRICS])
+
+    print(table)
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=4) + "\n")
+
+    if args.save:
+        args.baseline.write_text(json.dumps(report, indent=4) + "\n")
+        print(f"[bold green][INFO][reset]: Stored the baseline in '{args.baseline}'")
+        return
+
+    if not args.baseline.exists():
+        print(f"[bold yellow][WARNING][reset]: No baseline at '{args.baseline}', store one with '--save'.")
+        return
+
+    baseline = json.loads(args.baseline.read_text())
+
+    if baseline["python"] != report["python"] or baseline["machine"] != report["machine"]:
+        print(f"[bold yellow][WARNING][reset]: The baseline was measured with Python {baseline['python']} on {baseline['machine']}.")
+
+    regressions = compare(results=results, baseline=baseline["results"], threshold=args.threshold)
+
+    for regression in regressions:
+        print(f"[bold red][REGRESSION][reset]: {regression}")
+
+    if regressions:
+        sys.exit(1)
+
+    print(f"[bold green][INFO][reset]: No regression over {args.threshold * 100:.0f}% against the baseline")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,167 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "compile_many",
+    "expand_sources",
+    "BatchOptions"
+]
+
+import io
+import os
+import glob
+import time
+import multiprocessing
+
+from pathlib import Path
+from dataclasses import dataclass
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
+
+# Compiler
+from manv.compiler import compile_file
+
+# Toolchain
+from manv.toolchain import Toolchain, ToolchainError
+
+# Build cache
+from manv.cache import BuildCache
+
+@dataclass
+class BatchOptions:
+    """
+    Options shared by every compilation of a batch.
+    """
+    libs_dir_path: Path
+    output_dir_path: Path | None = None     # Next to the sources when None
+    use_nasm: bool = False
+    use_ld: bool = False
+    dbg: bool = False
+    use_cache: bool = True
+
+# Limit on the nasm and ld processes running at once, shared by the workers
+tools_semaphore = None
+
+def init_worker(semaphore) -> None:
+    """
+    Set up a worker process of the pool.
+    """
+    global tools_semaphore
+    tools_semaphore = semaphore
+
+def expand_sources(patterns: list[str]) -> list[Path]:
+    """
+    Expand the glob patterns of a list of sources, in order and without
+    duplicates.
+    """
+    paths = []
+
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        paths.extend(Path(match) for match in matches)
+
+    return list(dict.fromkeys(paths))
+
+def compile_task(file_path: Path, options: BatchOptions) -> dict:
+    """
+    Compile a single source in a worker, returns its status, timings and
+    diagnostics.
+    """
+    output_dir_path = options.output_dir_path or file_path.parent
+    output_path = output_dir_path / file_path.name.replace(".mv", "")
+
+    toolchain = Toolchain(
+        libs_dir_path=options.libs_dir_path,
+        use_nasm=options.use_nasm,
+        use_ld=options.use_ld,
+        dbg=options.dbg,
+        tools_limit=tools_semaphore
+    )
+
+    diagnostics = io.StringIO()
+    status = "ok"
+    error = None
+
+    start = time.perf_counter()
+
+    # The front end reports its errors on stdout and exits
+    with redirect_stdout(diagnostics):
+        try:
+            if not file_path.exists():
+                raise ToolchainError(f"The provided file path '{file_path}' doesn't exists.")
+
+            compile_file(
+                file_path=file_path,
+                output_path=output_path,
+                toolchain=toolchain,
+                cache=BuildCache() if options.use_cache else None
+            )
+        except ToolchainError as exception:
+            status, error = "error", str(exception)
+        except SystemExit:
+            status = "error"
+        except Exception as exception:
+            # A crash on one source must not abort the whole batch
+            status, error = "error", f"{type(exception).__name__}: {exception}"
+
+    return {
+        "source": str(file_path),
+        "output": str(output_path) if status == "ok" else None,
+        "status": status,
+        "error": error,
+        "seconds": time.perf_counter() - start,
+        "timings": toolchain.timings,
+        "diagnostics": diagnostics.getvalue()
+    }
+
+def compile_many(file_paths: list[Path], options: BatchOptions, jobs: int | None = None, tools_jobs: int | None = None) -> dict:
+    """
+    Compile many sources over a pool of processes, at most 'tools_jobs'
+    nasm or ld processes run at once.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    tools_jobs = tools_jobs or jobs
+
+    if options.output_dir_path is not None:
+        options.output_dir_path.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+
+    if jobs == 1:
+        init_worker(semaphore=None)
+        results = [compile_task(file_path=file_path, options=options) for file_path in file_paths]
+    else:
+        semaphore = multiprocessing.BoundedSemaphore(tools_jobs)
+
+        # Big chunks keep the scheduling overhead low with many small programs
+        chunksize = max(1, len(file_paths) // (jobs * 4))
+
+        with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker, initargs=(semaphore,)) as executor:
+            results = list(executor.map(compile_task, file_paths, [options] * len(file_paths), chunksize=chunksize))
+
+    return {
+        "jobs": jobs,
+        "seconds": time.perf_counter() - start,
+        "compiled": sum(result["status"] == "ok" for result in results),
+        "failed": sum(result["status"] != "ok" for result in results),
+        "results": results
+    }
@@ -0,0 +1,256 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "benchmark",
+    "run_once",
+    "open_instructions_counter",
+    "read_instructions_counter",
+    "measure_peak_rss",
+    "percentile"
+]
+
+import os
+import time
+import ctypes
+import platform
+import statistics
+
+from pathlib import Path
+
+# perf_event_open(2)
+PERF_EVENT_OPEN_SYSCALLS = {"x86_64": 298, "aarch64": 241}
+PERF_TYPE_HARDWARE = 0
+PERF_COUNT_HW_INSTRUCTIONS = 1
+
+# Bits of perf_event_attr.flags
+PERF_FLAG_DISABLED = 1 << 0
+PERF_FLAG_INHERIT = 1 << 1
+PERF_FLAG_EXCLUDE_KERNEL = 1 << 5
+PERF_FLAG_EXCLUDE_HV = 1 << 6
+PERF_FLAG_ENABLE_ON_EXEC = 1 << 12
+PERF_FLAG_FD_CLOEXEC = 1 << 3
+
+# ptrace(2)
+PTRACE_TRACEME = 0
+PTRACE_CONT = 7
+PTRACE_SETOPTIONS = 0x4200
+PTRACE_O_TRACEEXIT = 0x40
+PTRACE_EVENT_EXIT = 6
+
+class PerfEventAttr(ctypes.Structure):
+    """
+    The first version of 'struct perf_event_attr' (PERF_ATTR_SIZE_VER0),
+    the kernel fills in the newer fields with zeros.
+    """
+    _fields_ = [
+        ("type", ctypes.c_uint32),
+        ("size", ctypes.c_uint32),
+        ("config", ctypes.c_uint64),
+        ("sample_period", ctypes.c_uint64),
+        ("sample_type", ctypes.c_uint64),
+        ("read_format", ctypes.c_uint64),
+        ("flags", ctypes.c_uint64),
+        ("wakeup_events", ctypes.c_uint32),
+        ("bp_type", ctypes.c_uint32),
+        ("config1", ctypes.c_uint64),
+    ]
+
+def get_libc() -> ctypes.CDLL:
+    """
+    The C library, for the system calls Python doesn't wrap.
+    """
+    libc = ctypes.CDLL(None, use_errno=True)
+    libc.syscall.restype = ctypes.c_long
+    libc.ptrace.restype = ctypes.c_long
+
+    return libc
+
+def open_instructions_counter() -> int | None:
+    """
+    Open a counter of the user space instructions retired by the children
+    spawned from now on: it's inherited by them, enabled when they call
+    exec and their counts add up into it when they exit. None when perf
+    events aren't allowed (perf_event_paranoid, containers) or supported
+    (no hardware counters in most VMs).
+    """
+    number = PERF_EVENT_OPEN_SYSCALLS.get(platform.machine())
+
+    if number is None:
+        return None
+
+    attr = PerfEventAttr(
+        type=PERF_TYPE_HARDWARE,
+        size=ctypes.sizeof(PerfEventAttr),
+        config=PERF_COUNT_HW_INSTRUCTIONS,
+        flags=PERF_FLAG_DISABLED | PERF_FLAG_INHERIT | PERF_FLAG_EXCLUDE_KERNEL | PERF_FLAG_EXCLUDE_HV | PERF_FLAG_ENABLE_ON_EXEC
+    )
+
+    fd = get_libc().syscall(
+        ctypes.c_long(number),
+        ctypes.byref(attr),
+        ctypes.c_int(0),        # This process, and its children through 'inherit'
+        ctypes.c_int(-1),       # Any CPU
+        ctypes.c_int(-1),       # No group
+        ctypes.c_ulong(PERF_FLAG_FD_CLOEXEC)
+    )
+
+    return fd if fd >= 0 else None
+
+def read_instructions_counter(fd: int) -> int:
+    """
+    Read and close a counter opened by open_instructions_counter.
+    """
+    try:
+        return int.from_bytes(os.read(fd, 8), "little")
+    finally:
+        os.close(fd)
+
+def run_once(executable_path: Path, count_instructions: bool = True) -> dict:
+    """
+    Run an executable once, with its output discarded, and measure it.
+
+    It's spawned without copying this process (vfork), so its time is its
+    own. Its max RSS isn't: the kernel carries the parent's peak over exec,
+    see measure_peak_rss.
+    """
+    counter_fd = open_instructions_counter() if count_instructions else None
+
+    null_fd = os.open(os.devnull, os.O_RDWR)
+
+    try:
+        start = time.perf_counter()
+        pid = os.posix_spawn(
+            executable_path,
+            [str(executable_path)],
+            os.environ,
+            file_actions=[(os.POSIX_SPAWN_DUP2, null_fd, fd) for fd in (0, 1, 2)]
+        )
+        _, status, usage = os.wait4(pid, 0)
+        wall = time.perf_counter() - start
+    finally:
+        os.close(null_fd)
+
+    instructions = read_instructions_counter(counter_fd) if counter_fd is not None else None
+
+    return {
+        "wall": wall,
+        "user": usage.ru_utime,
+        "sys": usage.ru_stime,
+        "instructions": instructions,
+        "status": os.waitstatus_to_exitcode(status),
+    }
+
+def measure_peak_rss(executable_path: Path) -> int | None:
+    """
+    Peak RSS of an executable in bytes, read from /proc when it stops
+    on its way out under ptrace. None when ptrace isn't allowed.
+    """
+    libc = get_libc()
+    pid = os.fork()
+
+    if pid == 0:
+        try:
+            null_fd = os.open(os.devnull, os.O_RDWR)
+
+            for fd in (0, 1, 2):
+                os.dup2(null_fd, fd)
+
+            if libc.ptrace(PTRACE_TRACEME, 0, None, None) == 0:
+                os.execv(executable_path, [str(executable_path)])
+        finally:
+            os._exit(127)
+
+    peak_rss = None
+
+    _, status = os.waitpid(pid, 0)
+
+    if os.WIFSTOPPED(status):
+        # Stopped after exec
+        libc.ptrace(PTRACE_SETOPTIONS, pid, None, ctypes.c_void_p(PTRACE_O_TRACEEXIT))
+        libc.ptrace(PTRACE_CONT, pid, None, None)
+
+        while True:
+            _, status = os.waitpid(pid, 0)
+
+            if not os.WIFSTOPPED(status):
+                break
+
+            signal = 0
+
+            if status >> 8 == (PTRACE_EVENT_EXIT << 8) | 5:    # SIGTRAP
+                peak_rss = read_peak_rss(pid)
+            elif os.WSTOPSIG(status) != 5:
+                signal = os.WSTOPSIG(status)    # Deliver it
+
+            libc.ptrace(PTRACE_CONT, pid, None, ctypes.c_void_p(signal))
+
+    return peak_rss
+
+def read_peak_rss(pid: int) -> int | None:
+    """
+    The peak RSS (VmHWM) of a live process, in bytes.
+    """
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+
+    return None
+
+def percentile(values: list[float], fraction: float) -> float:
+    """
+    The nearest-rank percentile of the values.
+    """
+    ordered = sorted(values)
+
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+def benchmark(executable_path: Path, runs: int = 10, warmup: int = 2) -> dict:
+    """
+    Run an executable 'warmup' times, then 'runs' measured times, and
+    summarize the measures.
+    """
+    for _ in range(warmup):
+        run_once(executable_path=executable_path, count_instructions=False)
+
+    samples = [run_once(executable_path=executable_path) for _ in range(runs)]
+    peak_rss = measure_peak_rss(executable_path=executable_path)
+    walls = [sample["wall"] for sample in samples]
+    instructions = [sample["instructions"] for sample in samples if sample["instructions"] is not None]
+
+    return {
+        "runs": runs,
+        "warmup": warmup,
+        "wall": {
+            "median": statistics.median(walls),
+            "p90": percentile(walls, 0.90),
+            "p99": percentile(walls, 0.99),
+            "min": min(walls),
+            "max": max(walls),
+        },
+        "user": statistics.median(sample["user"] for sample in samples),
+        "sys": statistics.median(sample["sys"] for sample in samples),
+        "max_rss": peak_rss,
+        "instructions": statistics.median(instructions) if instructions else None,
+        "exit_codes": sorted({sample["status"] for sample in samples}),
+    }
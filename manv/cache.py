@@ -0,0 +1,315 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "BuildCache",
+    "CACHE_DIR_PATH",
+    "CACHE_MAX_SIZE",
+    "compiler_hash",
+    "tool_hash",
+    "hash_files"
+]
+
+import os
+import json
+import fcntl
+import shutil
+import hashlib
+import tempfile
+
+from pathlib import Path
+from functools import lru_cache
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+
+# Where the cache lives, '$MANV_CACHE_DIR' or '~/.cache/manv'
+CACHE_DIR_PATH = Path(
+    os.environ.get("MANV_CACHE_DIR")
+    or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "manv"
+)
+
+# Size cap in bytes, '$MANV_CACHE_SIZE' or 512 MiB
+CACHE_MAX_SIZE = int(os.environ.get("MANV_CACHE_SIZE") or 512 * 1024 * 1024)
+
+# Once over the cap, evict down to this fraction of it
+CACHE_EVICT_RATIO = 0.9
+
+STATS_FILE_NAME = "stats.json"
+
+# Serializes the updates of the statistics between concurrent builds
+LOCK_FILE_NAME = "lock"
+
+@lru_cache(maxsize=None)
+def compiler_hash() -> str:
+    """
+    Hash of the compiler itself: every source file of the manv package, so
+    editing the compiler invalidates its cached outputs.
+    """
+    package_path = Path(__file__).parent
+
+    return hash_files(sorted(package_path.rglob("*.py")), root=package_path)
+
+@lru_cache(maxsize=None)
+def tool_hash(name: str) -> str:
+    """
+    Identify an external tool (nasm, ld) by its path, size and mtime.
+    """
+    path = shutil.which(name)
+
+    if path is None:
+        return f"{name}:missing"
+
+    stat = os.stat(path)
+
+    return f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+def hash_files(paths: Iterable[Path], root: Path | None = None) -> str:
+    """
+    Hash the names and contents of a list of files.
+    """
+    digest = hashlib.sha256()
+
+    for path in paths:
+        name = str(path.relative_to(root) if root is not None else path.name)
+        data = path.read_bytes()
+
+        digest.update(f"{name}:{len(data)}\0".encode())
+        digest.update(data)
+
+    return digest.hexdigest()
+
+class BuildCache:
+    """
+    A content-addressed cache of build artifacts, in the style of ccache.
+
+    Each stage (asm, obj, bin) is keyed on a hash of its inputs and the
+    compiler itself, entries live at '<stage>/<xx>/<hash>' and their mtime
+    is their last use, so the least recently used ones are evicted first
+    once the cache grows over its size cap.
+
+    The size of the cache is tracked in its statistics as entries are
+    stored, it is only rescanned once that estimate crosses the cap.
+    """
+    def __init__(self, path: Path = CACHE_DIR_PATH, max_size: int = CACHE_MAX_SIZE) -> None:
+        self.path = path
+        self.max_size = max_size
+
+    def key(self, stage: str, *inputs: bytes | str) -> str:
+        """
+        The key of a stage's output, from its inputs.
+        """
+        digest = hashlib.sha256(f"{stage}\0{compiler_hash()}\0".encode())
+
+        for data in inputs:
+            if isinstance(data, str):
+                data = data.encode()
+
+            digest.update(f"{len(data)}\0".encode())
+            digest.update(data)
+
+        return f"{stage}/{digest.hexdigest()}"
+
+    def entry_path(self, key: str) -> Path:
+        """
+        The path of a cache entry.
+        """
+        stage, digest = key.split("/")
+
+        return self.path / stage / digest[:2] / digest
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Look up an entry, returns None on a miss.
+        """
+        path = self.entry_path(key)
+
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            data = None
+
+        self.record(stage=key.split("/")[0], hit=data is not None)
+
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Store an entry, evicting old ones when over the size cap.
+        """
+        path = self.entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            replaced_size = path.stat().st_size
+        except FileNotFoundError:
+            replaced_size = 0
+
+        self.write_atomic(path=path, data=data)
+
+        with self.locked():
+            stats = self.read_stats()
+
+            if "size" in stats:
+                stats["size"] += len(data) - replaced_size
+            else:
+                # Cache written before the size was tracked
+                stats["size"] = sum(entry.stat().st_size for entry in self.entries())
+
+            if stats["size"] > self.max_size:
+                stats["size"] = self.evict()
+
+            self.write_stats(stats=stats)
+
+    def restore(self, key: str, output_path: Path, mode: int = 0o755) -> bool:
+        """
+        Copy an entry to a file, returns False on a miss.
+        """
+        data = self.get(key)
+
+        if data is None:
+            return False
+
+        self.write_atomic(path=output_path, data=data)
+        os.chmod(output_path, mode)
+
+        return True
+
+    def store(self, key: str, path: Path) -> None:
+        """
+        Store a file as an entry.
+        """
+        self.put(key=key, data=path.read_bytes())
+
+    def entries(self) -> list[os.DirEntry]:
+        """
+        All the entries in the cache.
+        """
+        entries = []
+
+        if not self.path.is_dir():
+            return entries
+
+        for stage in os.scandir(self.path):
+            if not stage.is_dir():
+                continue
+
+            for bucket in os.scandir(stage.path):
+                if bucket.is_dir():
+                    entries.extend(entry for entry in os.scandir(bucket.path) if entry.is_file())
+
+        return entries
+
+    def evict(self) -> int:
+        """
+        Remove the least recently used entries until the cache fits in its
+        size cap, returns the size left.
+        """
+        entries = [(entry.stat(), entry.path) for entry in self.entries()]
+        size = sum(stat.st_size for stat, _ in entries)
+
+        if size <= self.max_size:
+            return size
+
+        for stat, path in sorted(entries, key=lambda entry: entry[0].st_mtime_ns):
+            if size <= self.max_size * CACHE_EVICT_RATIO:
+                break
+
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass    # Evicted by a concurrent build
+
+            size -= stat.st_size
+
+        return size
+
+    def stats(self) -> dict:
+        """
+        The hits and misses per stage, and the size of the cache.
+        """
+        entries = self.entries()
+
+        return {
+            **self.read_stats(),
+            "entries": len(entries),
+            "size": sum(entry.stat().st_size for entry in entries),
+            "max_size": self.max_size
+        }
+
+    def clear(self) -> None:
+        """
+        Remove every entry and reset the statistics.
+        """
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def record(self, stage: str, hit: bool) -> None:
+        """
+        Count a hit or a miss of a stage.
+        """
+        with self.locked():
+            stats = self.read_stats()
+            counter = stats["hits" if hit else "misses"]
+            counter[stage] = counter.get(stage, 0) + 1
+
+            self.write_stats(stats=stats)
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """
+        Hold the cache's lock while reading and rewriting its statistics.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        with open(self.path / LOCK_FILE_NAME, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def read_stats(self) -> dict:
+        """
+        Read the hits and misses counters.
+        """
+        try:
+            return json.loads((self.path / STATS_FILE_NAME).read_bytes())
+        except (FileNotFoundError, ValueError):
+            return {"hits": {}, "misses": {}}
+
+    def write_stats(self, stats: dict) -> None:
+        """
+        Write the statistics, the cache's lock must be held.
+        """
+        self.write_atomic(path=self.path / STATS_FILE_NAME, data=json.dumps(stats).encode())
+
+    @staticmethod
+    def write_atomic(path: Path, data: bytes) -> None:
+        """
+        Write a file through a temporary one renamed over it, so concurrent
+        builds never read a partial file.
+        """
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", delete=False) as output:
+            try:
+                output.write(data)
+            except BaseException:
+                os.unlink(output.name)
+                raise
+
+        os.replace(output.name, path)
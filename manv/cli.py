@@ -21,35 +21,33 @@
 # SOFTWARE.
 
 import sys
+import time
 import typer
-import shutil
-import subprocess
 
 from rich import print
-from pathlib import Path, PosixPath
-from typing import Literal
-
-# Parser
-from manv.src.parser.parser import Parser
-
-# Lexer
-from manv.src.lexer.lexer import Lexer
-
-# Gencode
-from manv.src.codegen.codegen import Codegen
-
-# File handler
-from manv.file_handler import FileHandler
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Literal, Iterator, TYPE_CHECKING
 
 # Platform type
-from manv.common import PLATFORM, PL_LINUX
+from manv.common import PLATFORM, PL_LINUX, BUILD_DIR_PATH
+
+# The subsystems are imported by the commands using them, so the
+# startup of a command only pays for what it runs.
+if TYPE_CHECKING:
+    from manv.toolchain import Toolchain
+    from manv.emit import Emitter
 
 # Init cli
-cli = typer.Typer()
+cli = typer.Typer(rich_markup_mode=None, pretty_exceptions_enable=False)
+
+cache_cli = typer.Typer(help="Manage the build cache.")
+cli.add_typer(cache_cli, name="cache")
 
 @cli.command()
 def compile(
     file_path: Path = typer.Argument(help="The path to the manv script file"),
+    modules_paths: list[Path] = typer.Argument(None, help="The other modules of the program, each compiled into its own object."),
     libs_dir_path: Path = typer.Option(
         Path("./stdlib/libs"), "-L", help=(
             "Specifies a directory to be added to the linker’s library search paths."
@@ -60,135 +58,515 @@ def compile(
     run_exec: bool = typer.Option(False, "-r", help="Run the compiled executable binary file."),
     dbg: bool = typer.Option(False, "-dbg", help="Add debug info to the output binary file."),
     threads: int = typer.Option(3, "--threads", help="The number of threads to use."),
-    no_clean: bool = typer.Option(False, "--no-clean", help="Don't delete the generated assembly and object files.")
+    no_clean: bool = typer.Option(False, "--no-clean", help="Don't delete the generated assembly and object files."),
+    use_nasm: bool = typer.Option(False, "--nasm", help="Assemble with nasm instead of the built-in assembler."),
+    use_ld: bool = typer.Option(False, "--ld", help="Link with ld instead of the built-in linker."),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Don't use the build cache."),
+    no_gc_sections: bool = typer.Option(False, "--no-gc-sections", help="Link every section, even the functions and data that are never reached."),
+    optimize_size: bool = typer.Option(False, "-Os", help="Optimize for size: shorter encodings, 'main' inlined in '_start', identical constants merged, and a stripped and compact executable."),
+    size_report: bool = typer.Option(False, "--size-report", help="Compare the size of the executable with the one of the default build and the '-Os' one."),
+    build_dir_path: Path = typer.Option(BUILD_DIR_PATH, "--build-dir", help="Where the objects of the modules are kept between builds."),
+    emit: str = typer.Option(None, "--emit", help="Write intermediate representations next to the executable, a comma separated list of: tokens, ast, ir, asm, obj."),
+    timings: bool = typer.Option(False, "--timings", help="Show the wall time, CPU time and peak RSS of each phase of the compilation."),
+    profile_path: Path = typer.Option(None, "--profile", help="Profile the compiler and write collapsed stacks for the flamegraph tools to this file."),
+    log_format: str = typer.Option("text", "--log-format", help="Format of the logs: 'text', or 'json' lines on stderr."),
+    log_level: str = typer.Option("info", "--log-level", help="Minimum level of the logs: debug, info, warning or error.")
 ) -> None:
     """
     Compile a manv program source.
     """
-    # Check for file existance
-    if not file_path.exists():
+    # Logs
+    from manv.log import logger, configure, LOG_FORMATS, LOG_LEVELS
+
+    if log_format not in LOG_FORMATS or log_level not in LOG_LEVELS:
         print(
-            f"[bold red][ERROR][reset]: The provided file path '{file_path}' doesn't exists."
+            f"[bold red][ERROR][reset]: Expected '--log-format' in {', '.join(LOG_FORMATS)} and '--log-level' in {', '.join(LOG_LEVELS)}."
         )
         sys.exit(1)
 
-    file_name = file_path.name
+    configure(level=log_level, fmt=log_format)
 
-    file = FileHandler(file_path)
-    file_content = file.read(threads=threads)
+    # Check for file existance
+    if not file_path.exists():
+        logger.error("The provided file path '%s' doesn't exists.", file_path)
+        sys.exit(1)
 
-    # Generate tokens
-    lexer = Lexer()
+    # Toolchain
+    from manv.toolchain import Toolchain
 
-    print(
-        f"[bold green][INFO][reset]: Generating tokens..."
-    )
+    # Intermediate representations
+    from manv.emit import Emitter, EMIT_KINDS
 
-    tokens = lexer.generate_tokens(data=file_content, file_path=file_path)
+    # Phases timings
+    from manv.timings import PhaseTimer
 
-    # Build an AST
-    parser = Parser()
+    output_binary_file_name = file_path.name.replace(".mv", "")
 
-    print(
-        f"[bold green][INFO][reset]: Generating an AST tree..."
-    )
+    if dbg and not use_nasm:
+        logger.warning("The built-in assembler doesn't emit debug info, use '--nasm' to get it.")
 
-    program = parser.parse(tokens=tokens)
+    emitter = None
 
-    # Generate assembly
-    codegen = Codegen()
+    if emit is not None:
+        kinds = {kind.strip() for kind in emit.split(",") if kind.strip()}
 
-    print(
-        f"[bold green][INFO][reset]: Generating assembly code..."
-    )
+        if not kinds or not kinds <= set(EMIT_KINDS):
+            logger.error("Unknown '--emit' kind in '%s', expected a comma separated list of: %s", emit, ", ".join(EMIT_KINDS))
+            sys.exit(1)
+
+        if modules_paths:
+            logger.warning("'--emit' only applies to single file programs, ignoring it.")
+        else:
+            emitter = Emitter(output_path=Path(output_binary_file_name), kinds=kinds)
+
+    timer = PhaseTimer()
 
-    generated_asm_code = codegen.codegen(
-        program=program
+    toolchain = Toolchain(
+        libs_dir_path=libs_dir_path,
+        use_nasm=use_nasm,
+        use_ld=use_ld,
+        dbg=dbg,
+        keep_files=no_clean,
+        timer=timer,
+        gc_sections=not no_gc_sections,
+        optimize_size=optimize_size
     )
-    generated_asm_code = generated_asm_code.get_assembly()
 
-    output_asm_file_name = file_name.replace(".mv", ".asm")
-    output_object_file_name = file_name.replace(".mv", ".o")
-    output_binary_file_name = file_name.replace(".mv", "")
+    with profile(output_path=profile_path):
+        build_program(
+            file_path=file_path,
+            modules_paths=modules_paths,
+            output_path=Path(output_binary_file_name),
+            toolchain=toolchain,
+            build_dir_path=build_dir_path,
+            use_cache=not no_cache,
+            threads=threads,
+            emitter=emitter
+        )
 
-    # Save the generated assembly
-    with open(output_asm_file_name, "w") as output:
-        output.write(generated_asm_code)
+    if emitter is not None:
+        for kind in EMIT_KINDS:
+            if kind in emitter.kinds:
+                logger.info("Wrote the %s to [cyan]'%s'[reset]", kind, emitter.get_path(kind))
+
+    if timings:
+        for phase in timer.phases.values():
+            logger.info(
+                f"Phase [cyan]'{phase.name}'[reset]: "
+                f"wall {phase.wall * 1000:.2f} ms, cpu {phase.cpu * 1000:.2f} ms, peak RSS {phase.peak_rss / (1 << 20):.1f} MiB",
+                extra={"fields": {"phase": phase.name, "wall": phase.wall, "cpu": phase.cpu, "peak_rss": phase.peak_rss}}
+            )
+
+    if size_report:
+        show_size_report(
+            file_path=file_path,
+            modules_paths=modules_paths,
+            output_path=Path(output_binary_file_name),
+            toolchain=toolchain,
+            log_level=log_level,
+            log_format=log_format
+        )
 
-    # Compile the generated assembly
-    print(
-        f"[bold green][INFO][reset]: Compiling generated assembly [cyan]'{output_asm_file_name}'[reset]..."
-    )
+    # Run the executable
+    if run_exec:
+        run_executable(name=output_binary_file_name)
+
+def build_program(
+    file_path: Path,
+    modules_paths: list[Path] | None,
+    output_path: Path,
+    toolchain: "Toolchain",
+    build_dir_path: Path = BUILD_DIR_PATH,
+    use_cache: bool = True,
+    threads: int = 3,
+    emitter: "Emitter | None" = None
+) -> None:
+    """
+    Compile a program and its modules into an executable.
+    """
+    # Logs
+    from manv.log import logger, log_counters
+
+    # Compiler
+    from manv.compiler import compile_file
+    from manv.toolchain import ToolchainError
+
+    # Build cache
+    from manv.cache import BuildCache
+
+    # Multi-module projects
+    from manv.project import Project, ProjectError
+
+    try:
+        if modules_paths:
+            project = Project(
+                entry_path=file_path,
+                module_paths=modules_paths,
+                toolchain=toolchain,
+                build_dir_path=build_dir_path
+            )
+
+            rebuilt = project.build(output_path=output_path)
+
+            logger.info(f"Recompiled {len(rebuilt)} of {len(modules_paths) + 1} modules")
+        else:
+            compile_file(
+                file_path=file_path,
+                output_path=output_path,
+                toolchain=toolchain,
+                cache=BuildCache() if use_cache else None,
+                threads=threads,
+                timer=toolchain.timer,
+                emitter=emitter
+            )
+    except (ToolchainError, ProjectError) as error:
+        logger.error("%s", error)
+        sys.exit(1)
 
-    # Commands
-    compile_cmd = [
-        "nasm",
-        "-f",
-        "elf64",
-        output_asm_file_name,
-        "-o", output_object_file_name
-    ]
-    link_cmd = [
-        "ld",
-        "-L",
-        libs_dir_path.__str__(),
-        "-o",
-        output_binary_file_name,
-        output_object_file_name
-    ]
-
-    # Preserve debug info
-    if dbg:
-        link_cmd.append("-g")
-        compile_cmd.append("-g")
-    
-    print(f"[bold cyan][CMD][reset]: [white]{' '.join(compile_cmd)}")
-
-    compile_out = subprocess.run(
-        compile_cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    for tool, seconds in toolchain.timings.items():
+        logger.info(f"Time spent in [cyan]'{tool}'[reset]: {seconds * 1000:.2f} ms", extra={"fields": {"tool": tool, "seconds": seconds}})
+
+    log_counters()
 
-    print(f"[bold cyan][CMD][reset]: [white]{' '.join([i if not isinstance(i, PosixPath) else i.__str__() for i in link_cmd])}")
+@contextmanager
+def profile(output_path: Path | None) -> Iterator[None]:
+    """
+    Profile the code run inside the context when an output path is given.
+    """
+    if output_path is None:
+        yield
+        return
 
-    link_out = subprocess.run(
-        link_cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
+    # Logs
+    from manv.log import logger
+
+    # Profiler
+    from manv.profiler import Profiler
+
+    profiler = Profiler(output_path=output_path)
+
+    with profiler:
+        yield
+
+    unit = "samples" if profiler.mode == "sampling" else "us"
+
+    logger.info("Wrote the profile (%s, %s %s) to [cyan]'%s'[reset]", profiler.mode, profiler.total, unit, output_path)
+
+def show_size_report(
+    file_path: Path,
+    modules_paths: list[Path] | None,
+    output_path: Path,
+    toolchain: "Toolchain",
+    log_level: str,
+    log_format: str
+) -> None:
+    """
+    Build the program again with the other of the default and '-Os'
+    options, and compare the sizes of both executables.
+    """
+    import tempfile
+
+    from rich.table import Table
+
+    # Toolchain
+    from manv.toolchain import Toolchain
+
+    # Size metrics
+    from manv.metrics import executable_size_metrics
+
+    # Logs
+    from manv.log import configure
+
+    with tempfile.TemporaryDirectory(prefix="manv-size-") as tmp_dir:
+        reference_path = Path(tmp_dir) / output_path.name
+
+        configure(level="warning", fmt=log_format)
+
+        build_program(
+            file_path=file_path,
+            modules_paths=modules_paths,
+            output_path=reference_path,
+            toolchain=Toolchain(
+                libs_dir_path=toolchain.libs_dir_path,
+                use_nasm=toolchain.use_nasm,
+                use_ld=toolchain.use_ld,
+                dbg=toolchain.dbg,
+                gc_sections=toolchain.gc_sections,
+                optimize_size=not toolchain.optimize_size
+            ),
+            build_dir_path=Path(tmp_dir) / "build"
+        )
+
+        configure(level=log_level, fmt=log_format)
+
+        reference = executable_size_metrics(path=reference_path)
+
+    metrics = executable_size_metrics(path=output_path)
+    default, size = (reference, metrics) if toolchain.optimize_size else (metrics, reference)
+
+    table = Table("bytes", "default", "-Os", "change")
+
+    for name in default:
+        change = f"{(size[name] - default[name]) / default[name] * 100:+.1f}%" if default[name] else "-"
+        table.add_row(name, str(default[name]), str(size[name]), change)
+
+    print(table)
+
+def run_executable(name: str) -> None:
+    """
+    Run a compiled executable and show its output.
+    """
+    import subprocess
+
+    print(f"[bold green][INFO][reset]: Running the compiled executable...")
+    print(f"[bold cyan][CMD][reset]: ./{name}")
+
+    run_out = subprocess.run(
+        [
+            f"./{name}"
+        ],
+        stderr=subprocess.PIPE,
+        stdout=subprocess.PIPE
     )
-    if link_out.stderr != b'' or compile_out.stderr != b'':
-        error = link_out.stderr if link_out.stderr != b'' else compile_out.stderr
-        print(f"[bold red][ERROR][reset]: Caught the following error when compiling assembly.\n{error.decode()}")
+
+    print(f"\n[bold white]" + 20 * "-" + "[bold blue] STDOUT [bold white]" + 20 * "-" +"[reset]")
+    print(run_out.stdout.decode())
+
+    if run_out.stderr.decode() != '':
+        print(f"\n\n[bold white]" + 20 * "-" + "[bold red] STDERR [bold white]" + 20 * "-" +"[reset]", end="\n\n")
+        print(run_out.stderr.decode(), end="\n\n")
+
+@cli.command()
+def watch(
+    file_path: Path = typer.Argument(help="The path to the manv script file"),
+    modules_paths: list[Path] = typer.Argument(None, help="The other modules of the program, each compiled into its own object."),
+    libs_dir_path: Path = typer.Option(Path("./stdlib/libs"), "-L", help="Directory of the libraries to link with."),
+    run_exec: bool = typer.Option(False, "-r", help="Run the executable after each build."),
+    use_nasm: bool = typer.Option(False, "--nasm", help="Assemble with nasm instead of the built-in assembler."),
+    use_ld: bool = typer.Option(False, "--ld", help="Link with ld instead of the built-in linker."),
+    debounce: float = typer.Option(30, "--debounce", help="Milliseconds without changes before rebuilding."),
+    polling: bool = typer.Option(False, "--poll", help="Check the files periodically instead of using inotify."),
+    build_dir_path: Path = typer.Option(BUILD_DIR_PATH, "--build-dir", help="Where the objects of the modules are kept between builds.")
+) -> None:
+    """
+    Rebuild a program each time its source or one of its modules is saved.
+    """
+    # Toolchain
+    from manv.toolchain import Toolchain
+
+    # Watch mode
+    from manv.watch import watch as watch_files
+
+    if not file_path.exists():
+        print(
+            f"[bold red][ERROR][reset]: The provided file path '{file_path}' doesn't exists."
+        )
         sys.exit(1)
 
-    # Cleaning up
-    if not no_clean:
-        print("[bold green][INFO][reset]: Cleaning up...")
-        
-        subprocess.run(
-            ["rm", output_asm_file_name, output_object_file_name]
+    output_binary_file_name = file_path.name.replace(".mv", "")
+
+    def rebuild(changed: set[Path]) -> None:
+        start = time.perf_counter()
+
+        try:
+            build_program(
+                file_path=file_path,
+                modules_paths=modules_paths,
+                output_path=Path(output_binary_file_name),
+                toolchain=Toolchain(libs_dir_path=libs_dir_path, use_nasm=use_nasm, use_ld=use_ld),
+                build_dir_path=build_dir_path
+            )
+        except SystemExit:
+            print(f"[bold red][ERROR][reset]: Build failed, waiting for changes...")
+            return
+
+        print(f"[bold green][INFO][reset]: Built [cyan]'{output_binary_file_name}'[reset] in {(time.perf_counter() - start) * 1000:.2f} ms")
+
+        if run_exec:
+            run_executable(name=output_binary_file_name)
+
+    rebuild(changed=set())
+
+    print(f"[bold green][INFO][reset]: Watching for changes, press Ctrl+C to stop...")
+
+    try:
+        watch_files(
+            paths=[file_path, *(modules_paths or [])],
+            on_change=rebuild,
+            debounce=debounce / 1000,
+            polling=polling
         )
-    
-    # Run the executable
-    if run_exec:
-        print(f"[bold green][INFO][reset]: Running the compiled executable...")
-        print(f"[bold cyan][CMD][reset]: ./{output_binary_file_name}")
-        
-        run_out = subprocess.run(
-            [
-                f"./{output_binary_file_name}"
-            ],
-            stderr=subprocess.PIPE,
-            stdout=subprocess.PIPE
+    except KeyboardInterrupt:
+        pass
+
+@cli.command()
+def compile_many(
+    sources: list[str] = typer.Argument(help="The manv script files, or glob patterns of them."),
+    output_dir_path: Path = typer.Option(None, "-o", "--output-dir", help="Where to write the executables, next to their sources by default."),
+    libs_dir_path: Path = typer.Option(Path("./stdlib/libs"), "-L", help="Directory of the libraries to link with."),
+    jobs: int = typer.Option(None, "-j", "--jobs", help="The number of worker processes, the number of CPUs by default."),
+    tools_jobs: int = typer.Option(None, "--tools-jobs", help="The maximum number of nasm and ld processes running at once."),
+    dbg: bool = typer.Option(False, "-dbg", help="Add debug info to the output binary files."),
+    use_nasm: bool = typer.Option(False, "--nasm", help="Assemble with nasm instead of the built-in assembler."),
+    use_ld: bool = typer.Option(False, "--ld", help="Link with ld instead of the built-in linker."),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Don't use the build cache.")
+) -> None:
+    """
+    Compile many manv programs in parallel, and report the status and
+    timings of each one as JSON.
+    """
+    import json
+
+    # Batch compilation
+    from manv.batch import compile_many as compile_batch, expand_sources, BatchOptions
+
+    file_paths = expand_sources(patterns=sources)
+
+    report = compile_batch(
+        file_paths=file_paths,
+        options=BatchOptions(
+            libs_dir_path=libs_dir_path,
+            output_dir_path=output_dir_path,
+            use_nasm=use_nasm,
+            use_ld=use_ld,
+            dbg=dbg,
+            use_cache=not no_cache
+        ),
+        jobs=jobs,
+        tools_jobs=tools_jobs
+    )
+
+    # Plain JSON on stdout, to be read by other tools
+    sys.stdout.write(json.dumps(report, indent=4) + "\n")
+
+    if report["failed"]:
+        sys.exit(1)
+
+@cli.command()
+def bench(
+    sources: list[str] = typer.Argument(help="The manv script files, or glob patterns of them."),
+    runs: int = typer.Option(10, "-n", "--runs", min=1, help="The number of measured runs of each executable."),
+    warmup: int = typer.Option(2, "--warmup", min=0, help="The number of runs before measuring."),
+    libs_dir_path: Path = typer.Option(Path("./stdlib/libs"), "-L", help="Directory of the libraries to link with."),
+    use_nasm: bool = typer.Option(False, "--nasm", help="Assemble with nasm instead of the built-in assembler."),
+    use_ld: bool = typer.Option(False, "--ld", help="Link with ld instead of the built-in linker."),
+    optimize_size: bool = typer.Option(False, "-Os", help="Benchmark the executables optimized for size."),
+    json_path: Path = typer.Option(None, "--json", help="Write the results as JSON to this file.")
+) -> None:
+    """
+    Compile manv programs and measure how fast their executables run.
+    """
+    import json
+    import platform
+    import tempfile
+
+    from rich.table import Table
+
+    # Toolchain
+    from manv.toolchain import Toolchain
+
+    # Runtime benchmarks
+    from manv.bench import benchmark
+
+    # Build cache
+    from manv.cache import compiler_hash
+
+    # Batch compilation
+    from manv.batch import expand_sources
+
+    # Logs
+    from manv.log import configure
+
+    configure(level="warning")
+
+    try:
+        from importlib.metadata import version
+        compiler_version = version("manv")
+    except Exception:
+        compiler_version = "unknown"
+
+    results = {}
+
+    with tempfile.TemporaryDirectory(prefix="manv-bench-") as tmp_dir:
+        for file_path in expand_sources(patterns=sources):
+            if not file_path.exists():
+                print(f"[bold red][ERROR][reset]: The provided file path '{file_path}' doesn't exists.")
+                sys.exit(1)
+
+            executable_path = Path(tmp_dir) / file_path.stem
+
+            build_program(
+                file_path=file_path,
+                modules_paths=None,
+                output_path=executable_path,
+                toolchain=Toolchain(libs_dir_path=libs_dir_path, use_nasm=use_nasm, use_ld=use_ld, optimize_size=optimize_size)
+            )
+
+            print(f"[bold green][INFO][reset]: Running [cyan]'{file_path}'[reset] {warmup} + {runs} times...")
+
+            results[str(file_path)] = benchmark(executable_path=executable_path, runs=runs, warmup=warmup)
+
+    table = Table("program", "median ms", "p90 ms", "p99 ms", "user ms", "sys ms", "max RSS KiB", "instructions", "exit")
+
+    for name, result in results.items():
+        table.add_row(
+            name,
+            *[f"{result['wall'][key] * 1000:.3f}" for key in ("median", "p90", "p99")],
+            f"{result['user'] * 1000:.3f}",
+            f"{result['sys'] * 1000:.3f}",
+            f"{result['max_rss'] / 1024:.0f}" if result["max_rss"] is not None else "-",
+            f"{result['instructions']:.0f}" if result["instructions"] is not None else "-",
+            ",".join(map(str, result["exit_codes"]))
         )
 
-        print(f"\n[bold white]" + 20 * "-" + "[bold blue] STDOUT [bold white]" + 20 * "-" +"[reset]")
-        print(run_out.stdout.decode())
-        
-        if run_out.stderr.decode() != '':
-            print(f"\n\n[bold white]" + 20 * "-" + "[bold red] STDERR [bold white]" + 20 * "-" +"[reset]", end="\n\n")
-            print(run_out.stderr.decode(), end="\n\n")
+    print(table)
+
+    if json_path is not None:
+        report = {
+            "compiler": {"version": compiler_version, "hash": compiler_hash()},
+            "options": {"use_nasm": use_nasm, "use_ld": use_ld, "optimize_size": optimize_size},
+            "machine": platform.machine(),
+            "results": results,
+        }
+
+        json_path.write_text(json.dumps(report, indent=4) + "\n")
+
+        print(f"[bold green][INFO][reset]: Wrote the results to [cyan]'{json_path}'[reset]")
+
+@cli.command()
+def daemon(
+    socket_path: Path = typer.Option(None, "--socket", show_default="$MANV_DAEMON_SOCKET or manv-<uid>.sock in the runtime directory", help="The Unix socket to listen on."),
+    stop: bool = typer.Option(False, "--stop", help="Stop the running daemon.")
+) -> None:
+    """
+    Keep a warm compiler running, 'manv compile' forwards to it while it
+    runs (set MANV_NO_DAEMON=1 to compile locally).
+    """
+    # Compile daemon
+    from manv.daemon import CompileServer, SOCKET_PATH, stop as stop_daemon
+
+    socket_path = socket_path or SOCKET_PATH
+
+    if stop:
+        if not stop_daemon(socket_path=socket_path):
+            print(f"[bold red][ERROR][reset]: No daemon is listening on [cyan]'{socket_path}'[reset].")
+            sys.exit(1)
+
+        print(f"[bold green][INFO][reset]: Stopped the daemon listening on [cyan]'{socket_path}'[reset]")
+        return
+
+    try:
+        server = CompileServer(socket_path=socket_path)
+    except OSError as error:
+        print(f"[bold red][ERROR][reset]: {error}")
+        sys.exit(1)
+
+    print(f"[bold green][INFO][reset]: Listening on [cyan]'{socket_path}'[reset]")
+
+    try:
+        server.serve()
+    except KeyboardInterrupt:
+        pass
 
 @cli.command()
 def build_lexer(
@@ -198,6 +576,12 @@ def build_lexer(
     """
     Build the lexer tree.
     """
+    # Lexer
+    from manv.src.lexer.lexer import Lexer
+
+    # File handler
+    from manv.file_handler import FileHandler
+
     # Check for file existance
     if not file_path.exists():
         print(
@@ -221,6 +605,39 @@ def build_lexer(
             f"[bold green][INFO][reset]: line '{token.line.line_number}': \n\t{'\n\t'.join([str(i) for i in token.tokens])}"
         )
 
+@cache_cli.command("stats")
+def cache_stats() -> None:
+    """
+    Show the build cache statistics.
+    """
+    from manv.cache import BuildCache
+
+    cache = BuildCache()
+    stats = cache.stats()
+
+    print(f"[bold green][INFO][reset]: Cache directory: [cyan]'{cache.path}'[reset]")
+    print(f"[bold green][INFO][reset]: Entries: {stats['entries']}")
+    print(f"[bold green][INFO][reset]: Size: {stats['size'] / 1024 / 1024:.2f} MiB / {stats['max_size'] / 1024 / 1024:.2f} MiB")
+
+    for stage in ("asm", "obj", "bin"):
+        hits = stats["hits"].get(stage, 0)
+        misses = stats["misses"].get(stage, 0)
+        rate = hits / (hits + misses) * 100 if hits + misses else 0
+
+        print(f"[bold green][INFO][reset]: Stage [cyan]'{stage}'[reset]: {hits} hits, {misses} misses ({rate:.1f}% hit rate)")
+
+@cache_cli.command("clear")
+def cache_clear() -> None:
+    """
+    Remove every entry from the build cache.
+    """
+    from manv.cache import BuildCache
+
+    cache = BuildCache()
+    cache.clear()
+
+    print(f"[bold green][INFO][reset]: Cleared the build cache at [cyan]'{cache.path}'[reset]")
+
 def run():
     # Check if the platform is not Linux.
     # NOTE: there is currently no plan of making ManV
@@ -233,14 +650,5 @@ def run():
         )
         sys.exit(1)
 
-    # Check for `nasm`
-    if not shutil.which("nasm"):
-        print(f"[bold red][ERROR][reset]: nasm was not found, please make sure that you have it installed on your system.")
-        sys.exit(1)
-    
-    # Check for `ld`
-    if not shutil.which("ld"):
-        print(f"[bold red][ERROR][reset]: Linker `ld` was not found.")
-        sys.exit(1)
-    
+    # nasm and ld are looked up by the toolchain when it runs them
     cli()
@@ -24,11 +24,14 @@ __all__ = [
     "PLATFORM",
     "SLASH",
     "BY_LINE",
-    "BY_CHUNKS"
+    "BY_CHUNKS",
+    "BUILD_DIR_PATH"
 ]
 
 import os
 
+from pathlib import Path
+
 # Utils
 from manv.utils import (
     get_platform,
@@ -42,3 +45,6 @@ SLASH = "/" if PLATFORM == PL_LINUX else "\\"
 # Reading modes
 BY_LINE     : int = 0x01
 BY_CHUNKS   : int = 0x02
+
+# Objects and state of the incremental builds
+BUILD_DIR_PATH = Path(".manv-build")
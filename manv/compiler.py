@@ -0,0 +1,150 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "generate_assembly",
+    "compile_file"
+]
+
+from pathlib import Path
+
+# Logs
+from manv.log import logger
+
+# Lexer
+from manv.src.lexer.lexer import Lexer
+
+# Parser
+from manv.src.parser.parser import Parser
+
+# Codegen
+from manv.src.codegen.asm import ASM
+from manv.src.codegen.codegen import Codegen
+
+# Toolchain
+from manv.toolchain import Toolchain
+
+# Build cache
+from manv.cache import BuildCache
+
+# Intermediate representations
+from manv.emit import Emitter
+
+# Phases timings
+from manv.timings import PhaseTimer
+
+# File handler
+from manv.file_handler import FileHandler
+
+def generate_assembly(
+    file_path: Path,
+    threads: int = 3,
+    timer: PhaseTimer | None = None,
+    emitter: Emitter | None = None,
+    optimize_size: bool = False
+) -> ASM:
+    """
+    Run the front end (lexer, parser and codegen) over a source file.
+    """
+    timer = timer or PhaseTimer()
+
+    file = FileHandler(file_path)
+    file_content = file.read(threads=threads)
+
+    # Generate tokens
+    lexer = Lexer()
+
+    logger.info("Generating tokens...")
+
+    with timer.phase("lexing"):
+        tokens = lexer.generate_tokens(data=file_content, file_path=file_path)
+
+    # Build an AST
+    parser = Parser()
+
+    logger.info("Generating an AST tree...")
+
+    with timer.phase("parsing"):
+        program = parser.parse(tokens=tokens)
+
+    # Generate assembly
+    codegen = Codegen(optimize_size=optimize_size)
+
+    logger.info("Generating assembly code...")
+
+    with timer.phase("codegen"):
+        asm = codegen.codegen(
+            program=program
+        )
+
+    if emitter is not None:
+        emitter.emit_tokens(tokens=tokens)
+        emitter.emit_ast(program=program)
+        emitter.emit_ir(asm=asm)
+        emitter.emit_asm(asm=asm)
+
+    return asm
+
+def compile_file(
+    file_path: Path,
+    output_path: Path,
+    toolchain: Toolchain,
+    cache: BuildCache | None = None,
+    threads: int = 3,
+    timer: PhaseTimer | None = None,
+    emitter: Emitter | None = None
+) -> None:
+    """
+    Compile a source file into an executable, skipping the stages whose
+    output is in the build cache.
+
+    Emitting the intermediate representations runs every stage, without
+    the cache.
+    """
+    name = output_path.name
+
+    if emitter is not None:
+        cache = None
+
+    if cache is None:
+        asm = generate_assembly(file_path=file_path, threads=threads, timer=timer, emitter=emitter, optimize_size=toolchain.optimize_size)
+    else:
+        asm_key = cache.key("asm", file_path.read_bytes(), *(["Os"] if toolchain.optimize_size else []))
+        asm_data = cache.get(asm_key)
+
+        if asm_data is None:
+            asm = generate_assembly(file_path=file_path, threads=threads, timer=timer, optimize_size=toolchain.optimize_size).get_assembly()
+            cache.put(asm_key, asm.encode())
+        else:
+            logger.info("Restored [cyan]'%s.asm'[reset] from the build cache", name)
+            asm = asm_data.decode()
+
+    # Compile the generated assembly
+    logger.info("Compiling generated assembly...")
+
+    toolchain.build(
+        asm=asm,
+        name=name,
+        output_path=output_path,
+        cache=cache,
+        object_output_path=emitter.object_path if emitter is not None else None
+    )
@@ -0,0 +1,224 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "CompileServer",
+    "forward",
+    "stop",
+    "SOCKET_PATH"
+]
+
+# Only the standard library is imported here: the client side runs before
+# the compiler is loaded, that's the startup time it saves.
+import io
+import os
+import sys
+import json
+import socket
+import struct
+import tempfile
+import traceback
+import socketserver
+
+from pathlib import Path
+from contextlib import redirect_stdout, redirect_stderr
+
+# Build cache
+from manv.cache import compiler_hash
+
+# Socket of the daemon, '$MANV_DAEMON_SOCKET' or one per user in the runtime directory
+SOCKET_PATH = Path(
+    os.environ.get("MANV_DAEMON_SOCKET")
+    or Path(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()) / f"manv-{os.getuid()}.sock"
+)
+
+def request(message: dict, socket_path: Path = SOCKET_PATH) -> dict | None:
+    """
+    Send a message to the daemon, returns its response or None when it
+    isn't running.
+    """
+    if not socket_path.exists():
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(socket_path))
+            client.sendall(json.dumps(message).encode() + b"\n")
+            client.shutdown(socket.SHUT_WR)
+
+            response = b""
+            while chunk := client.recv(65536):
+                response += chunk
+    except OSError:
+        return None     # Not running anymore, a stale socket
+
+    try:
+        return json.loads(response)
+    except ValueError:
+        return None
+
+def forward(argv: list[str], socket_path: Path = SOCKET_PATH) -> int | None:
+    """
+    Run a command in the daemon, prints its output and returns its exit
+    code, or None when it has to run locally.
+    """
+    # Hashing the compiler reads all of its sources, not worth it without a daemon
+    if not socket_path.exists():
+        return None
+
+    response = request(
+        message={"command": "run", "argv": argv, "cwd": os.getcwd(), "compiler": compiler_hash(), "tty": sys.stdout.isatty()},
+        socket_path=socket_path
+    )
+
+    if response is None:
+        return None
+
+    if response["status"] == "stale":
+        sys.stderr.write("manv: the daemon runs an outdated compiler, compiling locally. Restart it with 'manv daemon'.\n")
+        return None
+
+    sys.stdout.write(response["output"])
+    sys.stdout.flush()
+
+    return response["exit_code"]
+
+def stop(socket_path: Path = SOCKET_PATH) -> bool:
+    """
+    Stop the daemon, returns False when it isn't running.
+    """
+    return request(message={"command": "stop"}, socket_path=socket_path) is not None
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handle a single request: one JSON message per connection.
+    """
+    def handle(self) -> None:
+        message = json.loads(self.rfile.readline())
+
+        if message["command"] == "stop":
+            response = {"status": "ok"}
+            self.server.stopping = True
+        elif message["command"] == "ping":
+            response = {"status": "ok", "pid": os.getpid()}
+        elif message["compiler"] != compiler_hash():
+            response = {"status": "stale"}
+        else:
+            exit_code, output = self.server.run_command(argv=message["argv"], cwd=message["cwd"], tty=message["tty"])
+            response = {"status": "ok", "exit_code": exit_code, "output": output}
+
+        self.wfile.write(json.dumps(response).encode())
+
+class CompileServer(socketserver.UnixStreamServer):
+    """
+    A warm compiler behind a Unix socket: the compiler is imported and its
+    caches (compiler hash, stdlib objects) are filled once, and each
+    request runs a manv command as if it was run in the client's directory.
+
+    Requests are handled one at a time, each one changes the current
+    directory and captures the output. Only the user running the daemon
+    can connect to it.
+    """
+    def __init__(self, socket_path: Path = SOCKET_PATH) -> None:
+        self.socket_path = socket_path
+        self.stopping = False
+        self.uid = os.getuid()
+
+        if request(message={"command": "ping"}, socket_path=socket_path) is not None:
+            raise OSError(f"A daemon is already listening on '{socket_path}'.")
+
+        socket_path.unlink(missing_ok=True)     # Left by a daemon that was killed
+
+        super().__init__(str(socket_path), RequestHandler)
+
+        # Warm up, the commands import the compiler lazily
+        from manv.cli import cli
+        from manv import compiler, project, toolchain
+
+        self.cli = cli
+        compiler_hash()
+
+    def server_bind(self) -> None:
+        """
+        Bind the socket, created readable and writable by its owner only.
+        """
+        # Through the umask, a chmod after bind() leaves a window where others can connect
+        previous_umask = os.umask(0o177)
+
+        try:
+            super().server_bind()
+        finally:
+            os.umask(previous_umask)
+
+    def verify_request(self, request: socket.socket, client_address) -> bool:
+        """
+        Accept the connections of processes of the daemon's user only.
+        """
+        credentials = request.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+        _, uid, _ = struct.unpack("3i", credentials)
+
+        return uid == self.uid
+
+    def serve(self) -> None:
+        """
+        Handle requests until stopped.
+        """
+        try:
+            while not self.stopping:
+                self.handle_request()
+        finally:
+            self.server_close()
+            self.socket_path.unlink(missing_ok=True)
+
+    def run_command(self, argv: list[str], cwd: str, tty: bool) -> tuple[int, str]:
+        """
+        Run a manv command in a directory, returns its exit code and output.
+        """
+        import rich
+
+        output = io.StringIO()
+        previous_cwd = os.getcwd()
+
+        rich.reconfigure(file=output, force_terminal=tty)
+
+        try:
+            os.chdir(cwd)
+
+            with redirect_stdout(output), redirect_stderr(output):
+                try:
+                    self.cli(args=argv, prog_name="manv", standalone_mode=False)
+                    exit_code = 0
+                except SystemExit as error:
+                    exit_code = error.code if isinstance(error.code, int) else int(error.code is not None)
+                except Exception as error:
+                    # Usage errors, or a crash which must not take the daemon down
+                    if hasattr(error, "show"):
+                        error.show()
+                        exit_code = getattr(error, "exit_code", 1)
+                    else:
+                        traceback.print_exc()
+                        exit_code = 1
+        finally:
+            os.chdir(previous_cwd)
+            rich.reconfigure()
+
+        return exit_code, output.getvalue()
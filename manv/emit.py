@@ -0,0 +1,156 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "Emitter",
+    "EMIT_KINDS",
+    "to_json"
+]
+
+import json
+import dataclasses
+
+from pathlib import Path
+from typing import Any
+
+# Models
+from manv.models.line_model import LineModel
+
+# Intermediate representations that can be written, in pipeline order
+EMIT_KINDS = ("tokens", "ast", "ir", "asm", "obj")
+
+def to_json(value: Any) -> Any:
+    """
+    Convert an AST node (or anything in it) to JSON values, a node is an
+    object with its class name in 'node'.
+    """
+    if isinstance(value, LineModel):
+        return value.line_number    # It links to the other lines
+
+    if isinstance(value, (list, tuple)):
+        return [to_json(item) for item in value]
+
+    if isinstance(value, dict):
+        return {str(key): to_json(item) for key, item in value.items()}
+
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            "node": type(value).__name__,
+            **{field.name: to_json(getattr(value, field.name)) for field in dataclasses.fields(value)}
+        }
+
+    if hasattr(value, "__dict__") and not isinstance(value, type):
+        return {"node": type(value).__name__, **{key: to_json(item) for key, item in vars(value).items()}}
+
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+
+    return str(value)
+
+class Emitter:
+    """
+    Write the intermediate representations of a compilation next to the
+    executable, as '<name>.<kind>' files in compact machine-readable
+    formats:
+
+    - tokens: JSON lines, the tokens of a source line per line
+    - ast: JSON, the program's statements
+    - ir: JSON, the generated code by section and label
+    - asm: the assembly source
+    - obj: the ELF64 object
+    """
+    def __init__(self, output_path: Path, kinds: set[str]) -> None:
+        self.output_path = output_path
+        self.kinds = kinds
+
+    def get_path(self, kind: str) -> Path:
+        """
+        Path of a representation.
+        """
+        suffix = {"tokens": ".tokens.jsonl", "ast": ".ast.json", "ir": ".ir.json", "asm": ".asm", "obj": ".o"}[kind]
+
+        return self.output_path.with_name(self.output_path.name + suffix)
+
+    @property
+    def object_path(self) -> Path | None:
+        """
+        Where to write the object, if it's emitted.
+        """
+        return self.get_path("obj") if "obj" in self.kinds else None
+
+    def emit_tokens(self, tokens) -> None:
+        """
+        Write the tokens, if they're emitted.
+        """
+        if "tokens" not in self.kinds:
+            return
+
+        with open(self.get_path("tokens"), "w") as output:
+            for token in tokens.tokens:
+                if token.tokens:
+                    output.write(self.dumps({"line": token.line.line_number, "tokens": token.tokens}) + "\n")
+
+    def emit_ast(self, program) -> None:
+        """
+        Write the AST, if it's emitted.
+        """
+        if "ast" in self.kinds:
+            self.get_path("ast").write_text(self.dumps({"statements": program.statements}) + "\n")
+
+    def emit_ir(self, asm) -> None:
+        """
+        Write the generated code by section, if it's emitted.
+        """
+        if "ir" not in self.kinds:
+            return
+
+        ir = {
+            "alignment": asm.section_alignment,
+            "sections": {
+                "data": asm.section_data,
+                "rodata": asm.section_rodata,
+                "bss": asm.section_bss,
+                "text": asm.section_text
+            }
+        }
+
+        self.get_path("ir").write_text(self.dumps(ir) + "\n")
+
+    def emit_asm(self, asm) -> None:
+        """
+        Write the assembly, if it's emitted.
+        """
+        if "asm" not in self.kinds:
+            return
+
+        with open(self.get_path("asm"), "w") as output:
+            if isinstance(asm, str):
+                output.write(asm)
+            else:
+                asm.write(output=output)
+
+    @staticmethod
+    def dumps(value: Any) -> str:
+        """
+        Compact JSON of a value.
+        """
+        return json.dumps(to_json(value), separators=(",", ":"))
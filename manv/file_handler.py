@@ -27,7 +27,7 @@ __all__ = [
 ]
 
 from pathlib import Path
-from typing import Generator
+from typing import Iterator
 
 # File reading modes
 from manv.common import (
@@ -49,7 +49,7 @@ class FileHandler:
     def __init__(self, file_path: str) -> None:
         self.file_path = file_path
 
-    def read(self, threads: int | None = 3, mode: int | None = BY_LINE, chunks: int | None = None) -> Generator[bytes]:
+    def read(self, threads: int | None = 3, mode: int | None = BY_LINE, chunks: int | None = None) -> Iterator[bytes]:
         """
         Read the file data.
         """
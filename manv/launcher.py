@@ -0,0 +1,103 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "main"
+]
+
+import os
+import sys
+
+# Commands run by the daemon when it's running
+DAEMON_COMMANDS = ("compile",)
+
+STARTUP_PROFILE_OPTION = "--startup-profile"
+STARTUP_PROFILE_TOP = 25    # Slowest imports shown
+
+def startup_profile(argv: list[str]) -> int:
+    """
+    Run a command under 'python -X importtime' and report the import time
+    of each module, returns the command's exit code.
+    """
+    import time
+    import subprocess
+
+    start = time.perf_counter()
+
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "from manv.launcher import main; main()", *argv],
+        stderr=subprocess.PIPE
+    )
+
+    total = time.perf_counter() - start
+
+    # Lines of: 'import time: <self us> | <cumulative us> | <indented module name>'
+    imports = []
+    other_stderr = []
+
+    for line in out.stderr.decode().splitlines():
+        if not line.startswith("import time:"):
+            other_stderr.append(line)
+            continue
+
+        fields = line.removeprefix("import time:").split("|")
+
+        if not fields[0].strip().isdigit():
+            continue    # Header
+
+        imports.append((int(fields[0]), int(fields[1]), fields[2].rstrip()))
+
+    if other_stderr:
+        sys.stderr.write("\n".join(other_stderr) + "\n")
+
+    sys.stderr.write(
+        f"\nStartup profile of 'manv {' '.join(argv)}'\n"
+        f"  Total: {total * 1000:.1f} ms, imports: {sum(own for own, _, _ in imports) / 1000:.1f} ms ({len(imports)} modules)\n\n"
+        f"  {'self (ms)':>10} {'cumulative (ms)':>16}  module\n"
+    )
+
+    for own, cumulative, name in sorted(imports, key=lambda entry: entry[0], reverse=True)[:STARTUP_PROFILE_TOP]:
+        sys.stderr.write(f"  {own / 1000:>10.2f} {cumulative / 1000:>16.2f}  {name.strip()}\n")
+
+    return out.returncode
+
+def main() -> None:
+    """
+    Entry point of the 'manv' command: forward the compilations to the
+    daemon when it's running, before importing the compiler, otherwise
+    run the command in this process.
+    """
+    if STARTUP_PROFILE_OPTION in sys.argv:
+        sys.exit(startup_profile(argv=[arg for arg in sys.argv[1:] if arg != STARTUP_PROFILE_OPTION]))
+
+    if len(sys.argv) > 1 and sys.argv[1] in DAEMON_COMMANDS and not os.environ.get("MANV_NO_DAEMON"):
+        # Daemon client
+        from manv.daemon import forward
+
+        exit_code = forward(argv=sys.argv[1:])
+
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    from manv.cli import run
+
+    run()
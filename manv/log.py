@@ -0,0 +1,151 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "logger",
+    "counters",
+    "configure",
+    "count",
+    "log_counters",
+    "LOG_FORMATS",
+    "LOG_LEVELS"
+]
+
+import sys
+import json
+import logging
+
+from rich import print
+from collections import Counter
+
+LOG_FORMATS = ("text", "json")
+LOG_LEVELS = ("debug", "info", "warning", "error")
+
+# Markup of the level in the text format, a record's 'tag' overrides it (ex: CMD)
+TAG_STYLES = {
+    "DEBUG": "[bold blue][DEBUG][reset]",
+    "INFO": "[bold green][INFO][reset]",
+    "WARNING": "[bold yellow][WARNING][reset]",
+    "ERROR": "[bold red][ERROR][reset]",
+    "CMD": "[bold cyan][CMD][reset]",
+}
+
+logger = logging.getLogger("manv")
+
+# Work done by the compiler, ex: lines lexed, tokens made, instructions emitted
+counters: Counter[str] = Counter()
+
+class EscapedArg:
+    """
+    An argument of a record, its markup is escaped when it's formatted in
+    the message (a path or source line with '[...]' is printed as is).
+    """
+    def __init__(self, value: object) -> None:
+        self.value = value
+
+    def __str__(self) -> str:
+        from rich.markup import escape
+
+        return escape(str(self.value))
+
+    def __repr__(self) -> str:
+        from rich.markup import escape
+
+        return escape(repr(self.value))
+
+def escape_arg(arg: object) -> object:
+    """
+    Escape an argument of a record, the numbers are kept for '%d' and '%f'.
+    """
+    return arg if isinstance(arg, (int, float)) else EscapedArg(arg)
+
+def get_markup(record: logging.LogRecord) -> str:
+    """
+    The message of a record as rich markup: the message itself is markup,
+    its arguments are user data and are escaped.
+    """
+    if not record.args:
+        return str(record.msg)
+
+    if isinstance(record.args, dict):
+        return str(record.msg) % {key: escape_arg(value) for key, value in record.args.items()}
+
+    return str(record.msg) % tuple(escape_arg(arg) for arg in record.args)
+
+class TextHandler(logging.Handler):
+    """
+    Print the records with rich markup, to the current stdout so that
+    redirecting it (batch workers, the daemon) captures them.
+    """
+    def emit(self, record: logging.LogRecord) -> None:
+        tag = getattr(record, "tag", record.levelname)
+
+        print(f"{TAG_STYLES.get(tag, tag)}: {get_markup(record)}")
+
+class JsonHandler(logging.Handler):
+    """
+    Write the records as JSON lines to stderr, with the markup stripped
+    and the record's 'fields' merged in.
+    """
+    def emit(self, record: logging.LogRecord) -> None:
+        from rich.text import Text
+
+        entry = {
+            "time": round(record.created, 6),
+            "level": getattr(record, "tag", record.levelname).lower(),
+            "logger": record.name,
+            "message": Text.from_markup(get_markup(record)).plain,
+            **getattr(record, "fields", {})
+        }
+
+        sys.stderr.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+def configure(level: str = "info", fmt: str = "text") -> None:
+    """
+    Set the level and the format of the compiler's logs.
+    """
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+
+    logger.addHandler(JsonHandler() if fmt == "json" else TextHandler())
+    logger.setLevel(level.upper())
+    logger.propagate = False
+
+def count(**amounts: int) -> None:
+    """
+    Add to the counters.
+    """
+    counters.update(amounts)
+
+def log_counters() -> None:
+    """
+    Log the counters, then reset them for the next compilation.
+    """
+    if counters and logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Counters: " + ", ".join(f"{name}={value}" for name, value in sorted(counters.items())),
+            extra={"fields": {"counters": dict(counters)}}
+        )
+
+    counters.clear()
+
+configure()
@@ -0,0 +1,181 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "codegen_metrics",
+    "compare_metrics",
+    "count_memory_accesses",
+    "executable_size_metrics"
+]
+
+from pathlib import Path
+
+# ASM
+from manv.src.codegen.asm import ASM
+
+# Assembler
+from manv.src.assembler.assembler import Assembler, LINE_REGEX, LINE_DIRECTIVES, DATA_DIRECTIVES, RESERVE_DIRECTIVES
+from manv.src.assembler.encoder import is_mnemonic
+from manv.src.assembler.elf import ELF_HEADER
+
+# Linker
+from manv.src.linker.linker import PROGRAM_HEADER, PT_LOAD, PF_W
+
+# Instructions with a memory operand that don't access memory
+NO_ACCESS_MNEMONICS = {"lea", "nop", "prefetcht0", "prefetcht1", "prefetcht2", "prefetchnta"}
+
+# Instructions that only write their memory destination
+STORE_ONLY_PREFIXES = ("mov", "vmov", "set", "pop", "stos")
+
+def count_memory_accesses(mnemonic: str, operands: list[str]) -> tuple[int, int]:
+    """
+    Explicit memory (loads, stores) of an instruction: a memory destination
+    is a store, and also a load unless the instruction only writes it (mov,
+    setcc...), any other memory operand is a load.
+    """
+    if mnemonic in NO_ACCESS_MNEMONICS or not operands:
+        return 0, 0
+
+    loads = sum("[" in operand for operand in operands[1:])
+    stores = 0
+
+    if "[" in operands[0]:
+        stores = 1
+
+        if not mnemonic.startswith(STORE_ONLY_PREFIXES):
+            loads += 1
+
+    return loads, stores
+
+def codegen_metrics(asm: ASM | str) -> dict[str, int]:
+    """
+    Static metrics of generated code:
+
+    - instructions.<section>: instructions in a section
+    - data.<section>: data and reserve directives in a section
+    - size.<section>: bytes of a section once assembled
+
+    The '.<section>.<name>' sections count in their '<section>'.
+    - loads, stores: explicit memory accesses of the instructions
+    """
+    source = asm if isinstance(asm, str) else asm.get_assembly()
+    assembler = Assembler()
+
+    metrics: dict[str, int] = {"loads": 0, "stores": 0}
+    section = "text"
+
+    for line in source.splitlines():
+        line = assembler.strip_comment(line).strip()
+
+        if line.startswith("[") and line.endswith("]"):
+            line = line[1:-1].strip()
+
+        match = LINE_REGEX.fullmatch(line)
+
+        if not line or match is None:
+            continue
+
+        word, rest = match.group("word").lower(), match.group("rest")
+
+        if word in ("section", "segment"):
+            # The functions sections count in their section ('.text.main' in 'text')
+            section = rest.split()[0].lstrip(".").split(".")[0]
+            continue
+
+        if word in LINE_DIRECTIVES:
+            continue
+
+        # A label, alone or followed by a statement
+        if match.group("colon") or (rest and not is_mnemonic(word) and word not in DATA_DIRECTIVES and word not in RESERVE_DIRECTIVES):
+            if not rest:
+                continue
+
+            word, _, rest = rest.partition(" ")
+            word = word.lower()
+
+        if word in DATA_DIRECTIVES or word in RESERVE_DIRECTIVES or word == "times":
+            metrics[f"data.{section}"] = metrics.get(f"data.{section}", 0) + 1
+        elif is_mnemonic(word):
+            metrics[f"instructions.{section}"] = metrics.get(f"instructions.{section}", 0) + 1
+
+            loads, stores = count_memory_accesses(word, assembler.split_operands(rest))
+            metrics["loads"] += loads
+            metrics["stores"] += stores
+
+    obj = Assembler().assemble(lines=source.splitlines(keepends=True), source_name="metrics.asm")
+
+    for output_section in obj.sections:
+        if output_section.name.startswith(".") and not output_section.name.startswith((".rela", ".symtab", ".strtab", ".shstrtab")):
+            name = f"size.{output_section.name.lstrip('.').split('.')[0]}"
+            metrics[name] = metrics.get(name, 0) + output_section.length
+
+    return dict(sorted(metrics.items()))
+
+def executable_size_metrics(path: Path) -> dict[str, int]:
+    """
+    Size metrics of an executable, from its program headers:
+
+    - file: bytes of the file
+    - headers: bytes of the ELF and program headers
+    - code: bytes of the code and read only data segments
+    - data: bytes of the writable segments in the file
+    - bss: bytes of the writable segments only in memory
+    - other: bytes that aren't loaded (symbols, section headers, padding)
+    """
+    image = path.read_bytes()
+    fields = ELF_HEADER.unpack_from(image)
+    program_headers_offset, program_headers_count = fields[5], fields[10]
+
+    headers_size = ELF_HEADER.size + program_headers_count * PROGRAM_HEADER.size
+    metrics = {"file": len(image), "headers": headers_size, "code": 0, "data": 0, "bss": 0}
+
+    for i in range(program_headers_count):
+        typ, flags, offset, _, _, file_size, memory_size, _ = PROGRAM_HEADER.unpack_from(image, program_headers_offset + i * PROGRAM_HEADER.size)
+
+        if typ != PT_LOAD:
+            continue
+
+        if flags & PF_W:
+            metrics["data"] += file_size
+            metrics["bss"] += memory_size - file_size
+        else:
+            # The first segment holds the headers
+            metrics["code"] += file_size - (headers_size if offset == 0 else 0)
+
+    metrics["other"] = len(image) - headers_size - metrics["code"] - metrics["data"]
+
+    return metrics
+
+def compare_metrics(metrics: dict[str, int], baseline: dict[str, int], tolerance: float = 0.0) -> list[str]:
+    """
+    The metrics grown past the tolerance (a fraction of the baseline), a
+    metric missing from the baseline counts from zero.
+    """
+    regressions = []
+
+    for name, value in metrics.items():
+        base = baseline.get(name, 0)
+
+        if value > base * (1 + tolerance):
+            regressions.append(f"{name}: {base} -> {value}")
+
+    return regressions
@@ -0,0 +1,184 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "Profiler",
+    "profile_phase",
+    "SAMPLE_INTERVAL"
+]
+
+import signal
+import threading
+
+from pathlib import Path
+from collections import Counter
+from types import FrameType, CodeType
+from typing import Callable
+
+# Seconds of CPU time between two samples
+SAMPLE_INTERVAL = 0.001
+
+# Code of the functions annotated as phases -> name of the phase
+PHASES: dict[CodeType, str] = {}
+
+def profile_phase(name: str) -> Callable:
+    """
+    Annotate a function as a named phase of the compiler, it shows up as a
+    '[name]' frame above the function in the profiles.
+
+    The function is returned as-is, so the annotation costs nothing when
+    not profiling.
+    """
+    def decorator(function: Callable) -> Callable:
+        PHASES[function.__code__] = name
+        return function
+
+    return decorator
+
+def get_frame_names(code: CodeType, module: str) -> list[str]:
+    """
+    Frames of a function in the collapsed stacks, with its phase first.
+    """
+    name = f"{module}:{code.co_qualname}"
+
+    if code in PHASES:
+        return [f"[{PHASES[code]}]", name]
+
+    return [name]
+
+class Profiler:
+    """
+    Profile the code run inside the context, and write it as collapsed
+    stacks ('frame;frame;frame count' lines) for the flamegraph tools.
+
+    It samples the stack on SIGPROF when it can (main thread of a Unix
+    process), with a count per sample. Otherwise it falls back to cProfile,
+    the stacks are then rebuilt from the caller/callee times and counted in
+    microseconds.
+    """
+    def __init__(self, output_path: Path, interval: float = SAMPLE_INTERVAL) -> None:
+        self.output_path = output_path
+        self.interval = interval
+
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self.mode = "sampling" if self.can_sample() else "cprofile"
+
+        self._profile = None
+        self._previous_handler = None
+
+    @staticmethod
+    def can_sample() -> bool:
+        """
+        Whether the stack can be sampled on a timer signal.
+        """
+        return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+    def __enter__(self) -> "Profiler":
+        if self.mode == "sampling":
+            self._previous_handler = signal.signal(signal.SIGPROF, self.sample)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        else:
+            import cProfile
+
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self.mode == "sampling":
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler)
+        else:
+            self._profile.disable()
+            self.collapse_stats(self._profile)
+
+        self.write()
+
+    def sample(self, signum: int, frame: FrameType | None) -> None:
+        """
+        Record the stack interrupted by the timer.
+        """
+        stack = []
+
+        while frame is not None:
+            stack.extend(reversed(get_frame_names(frame.f_code, frame.f_globals.get("__name__", "?"))))
+            frame = frame.f_back
+
+        self.stacks[tuple(reversed(stack))] += 1
+
+    def collapse_stats(self, profile) -> None:
+        """
+        Rebuild the stacks from cProfile's stats, the time of a function is
+        split between its callers in proportion to what each one spent in it.
+        """
+        import pstats
+
+        stats = pstats.Stats(profile).stats
+
+        callees: dict[tuple, list[tuple]] = {}
+        for function, (_, _, _, _, callers) in stats.items():
+            for caller in callers:
+                callees.setdefault(caller, []).append(function)
+
+        names = {}
+        for function in stats:
+            filename, line, name = function
+            names[function] = f"{Path(filename).stem}:{name}" if line else name
+
+            for code in PHASES:
+                if (code.co_filename, code.co_firstlineno, code.co_name) == function:
+                    names[function] = f"[{PHASES[code]}];{names[function]}"
+
+        def walk(function: tuple, stack: tuple[str, ...], share: float, active: set) -> None:
+            _, _, total_time, cumulative_time, _ = stats[function]
+            stack = stack + (names[function],)
+
+            self.stacks[stack] += round(total_time * share * 1_000_000)
+
+            for callee in callees.get(function, []):
+                if callee in active or stats[callee][3] == 0:
+                    continue
+
+                edge_time = stats[callee][4][function][3]
+
+                walk(callee, stack, share * edge_time / stats[callee][3], active | {callee})
+
+        for function, (_, _, _, _, callers) in stats.items():
+            if not callers:
+                walk(function, (), 1.0, {function})
+
+    def write(self) -> None:
+        """
+        Write the collapsed stacks.
+        """
+        with open(self.output_path, "w") as output:
+            for stack, count in sorted(self.stacks.items()):
+                if count > 0:
+                    output.write(f"{';'.join(stack)} {count}\n")
+
+    @property
+    def total(self) -> int:
+        """
+        Number of samples (or microseconds, with cProfile).
+        """
+        return sum(self.stacks.values())
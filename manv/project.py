@@ -0,0 +1,327 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "Project",
+    "Module",
+    "ProjectError",
+    "BUILD_DIR_PATH"
+]
+
+import os
+import re
+import json
+import hashlib
+
+from pathlib import Path
+from dataclasses import dataclass, field
+
+# Logs
+from manv.log import logger
+
+# Lexer
+from manv.src.lexer.lexer import Lexer, Tokens
+
+# Parser
+from manv.src.parser.parser import Parser
+
+# AST
+from manv.src.ast.base import ASTNode
+from manv.src.ast.nodes import Constant, Variable, Pointer
+
+# Codegen
+from manv.src.codegen.codegen import Codegen
+
+# Assembler
+from manv.src.assembler.elf import write_object
+
+# Toolchain
+from manv.toolchain import Toolchain
+
+# Build cache
+from manv.cache import BuildCache, compiler_hash
+
+# Build directory
+from manv.common import BUILD_DIR_PATH
+
+MANIFEST_FILE_NAME = "manifest.json"
+
+# Lines declaring a module's exported symbols
+DECLARATION_KEYWORDS = ("const", "var", "ptr")
+
+IDENTIFIER_REGEX = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+IGNORED_REGEX = re.compile(r'//.*|"[^"\n]*"')    # Comments and strings
+
+class ProjectError(Exception): ...    # The modules of a project don't fit together
+
+@dataclass
+class Module:
+    """
+    A source file of a project, compiled into its own object.
+
+    Its interface is the constants, variables and pointers it declares,
+    which other modules can use and see as extern symbols.
+    """
+    path: Path
+    source: str
+    entry: bool = False
+    declarations: list[ASTNode] = field(default_factory=list)   # Exported
+    imports: list[ASTNode] = field(default_factory=list)        # Used from other modules
+    dependencies: list["Module"] = field(default_factory=list)  # Modules declaring the imports
+
+    @property
+    def name(self) -> str:
+        return str(self.path)
+
+    @property
+    def object_name(self) -> str:
+        """
+        Name of the module's object, unique across directories.
+        """
+        return f"{self.path.stem}-{hashlib.sha256(str(self.path.resolve()).encode()).hexdigest()[:8]}.o"
+
+    @property
+    def source_hash(self) -> str:
+        return hashlib.sha256(self.source.encode()).hexdigest()
+
+    @property
+    def interface_hash(self) -> str:
+        """
+        Hash of what other modules can depend on.
+        """
+        return interface_hash(declarations=self.declarations)
+
+def interface_hash(declarations: list[ASTNode]) -> str:
+    """
+    Hash of the names, kinds, types and sizes of declarations, not their
+    values which don't change the code of the modules using them.
+    """
+    interface = [
+        (
+            type(declaration).__name__,
+            declaration.identifier.name,
+            type(declaration.typ).__name__,
+            str(declaration.size.value) if isinstance(declaration, (Constant, Variable)) else None,
+            getattr(declaration, "is_array", False)
+        )
+        for declaration in declarations
+    ]
+
+    return hashlib.sha256(json.dumps(sorted(interface)).encode()).hexdigest()
+
+class Project:
+    """
+    Build a program made of several modules, each compiled separately.
+
+    A module is recompiled only when its source, the declarations it uses
+    from the modules it depends on or the compiler changed, the objects of the others are
+    reused from the build directory and everything is always relinked.
+    """
+    def __init__(
+        self,
+        entry_path: Path,
+        module_paths: list[Path],
+        toolchain: Toolchain,
+        build_dir_path: Path = BUILD_DIR_PATH
+    ) -> None:
+        self.entry_path = entry_path
+        self.module_paths = module_paths
+        self.toolchain = toolchain
+        self.build_dir_path = build_dir_path
+
+    def build(self, output_path: Path) -> list[Module]:
+        """
+        Build the executable, returns the recompiled modules.
+        """
+        modules = self.load()
+
+        self.build_dir_path.mkdir(parents=True, exist_ok=True)
+
+        manifest = self.read_manifest()
+        records = manifest["modules"] if manifest.get("toolchain") == self.toolchain_hash() else {}
+
+        rebuilt = []
+        new_records = {}
+
+        for module in modules:
+            record = {
+                "source": module.source_hash,
+                "entry": module.entry,
+                "dependencies": [dependency.name for dependency in module.dependencies],
+                "imports": interface_hash(declarations=module.imports)
+            }
+
+            object_path = self.build_dir_path / module.object_name
+
+            if records.get(module.name) != record or not object_path.exists():
+                logger.info("Compiling module [cyan]'%s'[reset]...", module.name)
+
+                self.compile_module(module=module, object_path=object_path)
+                rebuilt.append(module)
+
+            new_records[module.name] = record
+
+        # Saved before linking, the objects are valid even if the link fails
+        BuildCache.write_atomic(
+            path=self.build_dir_path / MANIFEST_FILE_NAME,
+            data=json.dumps({"toolchain": self.toolchain_hash(), "modules": new_records}, indent=4).encode()
+        )
+
+        self.toolchain.link(
+            objects=[None] * len(modules),
+            object_paths=[self.build_dir_path / module.object_name for module in modules],
+            output_path=output_path
+        )
+
+        return rebuilt
+
+    def load(self) -> list[Module]:
+        """
+        Read the modules, their interfaces and the dependencies between them.
+        """
+        modules: list[Module] = []
+        seen = set()
+
+        for i, path in enumerate([self.entry_path, *self.module_paths]):
+            if path.resolve() in seen:
+                continue
+
+            seen.add(path.resolve())
+
+            if not path.exists():
+                raise ProjectError(f"The module '{path}' doesn't exists.")
+
+            modules.append(Module(path=path, source=path.read_text(), entry=i == 0))
+
+        # Exported symbols
+        exporters: dict[str, Module] = {}
+
+        for module in modules:
+            module.declarations = self.read_interface(module=module)
+
+            for declaration in module.declarations:
+                name = declaration.identifier.name
+
+                if name in exporters and exporters[name] is not module:
+                    raise ProjectError(f"'{name}' is declared in both '{exporters[name].name}' and '{module.name}'.")
+
+                exporters[name] = module
+
+        # Imported symbols, every identifier declared by another module
+        for module in modules:
+            declared = {declaration.identifier.name for declaration in module.declarations}
+            words = set(IDENTIFIER_REGEX.findall(IGNORED_REGEX.sub("", module.source)))
+
+            for name in sorted(words - declared):
+                if name not in exporters:
+                    continue
+
+                exporter = exporters[name]
+                module.imports.extend(
+                    declaration for declaration in exporter.declarations
+                    if declaration.identifier.name == name
+                )
+
+                if exporter not in module.dependencies:
+                    module.dependencies.append(exporter)
+
+        return modules
+
+    def read_interface(self, module: Module) -> list[ASTNode]:
+        """
+        The declarations of a module, only its declaration lines are parsed
+        since the other ones may use identifiers from other modules.
+        """
+        lines = [
+            line if line.split(maxsplit=1)[:1] and line.split(maxsplit=1)[0] in DECLARATION_KEYWORDS else "\n"
+            for line in module.source.splitlines(keepends=True)
+        ]
+
+        tokens = Lexer().generate_tokens(data=lines, file_path=module.path)
+        program = Parser().parse(tokens=tokens)
+
+        declarations = []
+
+        for statement in program.statements:
+            if isinstance(statement, (Constant, Variable, Pointer)) and statement.identifier.name not in [
+                declaration.identifier.name for declaration in declarations
+            ]:
+                declarations.append(statement)
+
+        return declarations
+
+    def compile_module(self, module: Module, object_path: Path) -> None:
+        """
+        Compile a module into its object.
+        """
+        imports = Tokens(file_path=module.path)
+
+        for declaration in module.imports:
+            if isinstance(declaration, Constant):
+                imports.const_identifiers.append(declaration.identifier.name)
+            elif isinstance(declaration, Variable):
+                imports.var_identifiers.append(declaration.identifier.name)
+            else:
+                imports.ptr_identifiers.append(declaration.identifier.name)
+
+        timer = self.toolchain.timer
+
+        with timer.phase("lexing"):
+            tokens = Lexer().generate_tokens(
+                data=module.source.splitlines(keepends=True),
+                file_path=module.path,
+                imports=imports
+            )
+
+        with timer.phase("parsing"):
+            program = Parser().parse(tokens=tokens)
+
+        with timer.phase("codegen"):
+            asm = Codegen(optimize_size=self.toolchain.optimize_size).codegen(program=program, imports=module.imports, entry=module.entry)
+
+        asm_path = object_path.with_suffix(".asm")
+
+        if self.toolchain.use_nasm or self.toolchain.keep_files:
+            with open(asm_path, "w") as output:
+                asm.write(output=output)
+
+        obj = self.toolchain.assemble(asm=asm, asm_path=asm_path, object_path=object_path)
+
+        if obj is not None:
+            with open(object_path, "wb") as output:
+                write_object(obj=obj, output=output)
+
+    def read_manifest(self) -> dict:
+        """
+        The state of the last build.
+        """
+        try:
+            return json.loads((self.build_dir_path / MANIFEST_FILE_NAME).read_bytes())
+        except (FileNotFoundError, ValueError):
+            return {"modules": {}}
+
+    def toolchain_hash(self) -> str:
+        """
+        Hash of the compiler, its options and the assembler, the objects
+        are rebuilt when it changes.
+        """
+        return hashlib.sha256(json.dumps([compiler_hash(), self.toolchain.optimize_size, *self.toolchain.assembler_flags()]).encode()).hexdigest()
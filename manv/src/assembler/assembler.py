@@ -0,0 +1,760 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "Assembler",
+]
+
+import re
+import struct
+
+from dataclasses import dataclass, field
+from typing import Iterable
+
+# Encoder
+from manv.src.assembler.encoder import *
+
+# ELF
+from manv.src.assembler.elf import *
+
+# Exceptions
+from manv.src.assembler.exceptions import AssemblerError
+
+# Data directives and the size of their unit
+DATA_DIRECTIVES = {
+    "db": 1,
+    "dw": 2,
+    "dd": 4,
+    "dq": 8,
+}
+
+RESERVE_DIRECTIVES = {
+    "resb": 1,
+    "resw": 2,
+    "resd": 4,
+    "resq": 8,
+}
+
+# Directives that take a whole line
+LINE_DIRECTIVES = {"section", "segment", "global", "extern", "default", "bits"}
+
+# Directives that can follow a label on the same line
+LABELED_DIRECTIVES = {*DATA_DIRECTIVES, *RESERVE_DIRECTIVES, "times", "equ"}
+
+# Relocation of each fixup kind, when the fixup can't be resolved in place
+FIXUP_RELOCATIONS = {
+    FIXUP_ABS32: R_X86_64_32,
+    FIXUP_ABS32S: R_X86_64_32S,
+    FIXUP_ABS64: R_X86_64_64,
+    FIXUP_REL32: R_X86_64_PC32,
+}
+
+NOP = 0x90
+
+SYMBOL_REGEX = re.compile(r"[A-Za-z_.?$@#~][\w.?$@#~]*")
+LINE_REGEX = re.compile(r"(?P<word>[A-Za-z_.?$@#~][\w.?$@#~]*)\s*(?P<colon>:)?\s*(?P<rest>.*)")
+FLOAT_REGEX = re.compile(r"[+-]?(\d+\.\d*|\.\d+|\d+(?=e))(e[+-]?\d+)?", re.IGNORECASE)
+
+@dataclass
+class Item:
+    """
+    One statement of a section: a label, encoded code or data, a jump
+    (whose size is picked at layout), an alignment or reserved space.
+    """
+    kind: str
+    line_number: int
+    name: str | None = None
+    encoding: Encoding | None = None
+    mnemonic: str | None = None
+    target: Immediate | None = None
+    short: bool = False
+    alignment: int = 0
+    fill: int | None = None     # None for reserved (uninitialized) space
+    size: int = 0
+    offset: int = 0
+
+@dataclass
+class SectionState:
+    name: str
+    alignment: int
+    items: list[Item] = field(default_factory=list)
+
+class Assembler:
+    """
+    Assemble the NASM subset generated by the codegen (and used by the
+    stdlib) into an ELF64 relocatable object, without running nasm.
+    """
+    def __init__(self) -> None:
+        self.sections: dict[str, SectionState] = {}
+        self.current_section: SectionState | None = None
+
+        self.constants: dict[str, int] = {}             # equ
+        self.symbol_sections: dict[str, str] = {}       # label -> section
+        self.label_offsets: dict[str, int] = {}
+        self.globals: list[str] = []
+        self.externs: list[str] = []
+
+        self.last_label: str | None = None
+        self.line_number = 0
+
+    def assemble(self, lines: Iterable[str], source_name: str) -> ObjectFile:
+        """
+        Assemble source lines into an object file.
+        """
+        source_lines = [
+            line
+            for chunk in lines
+            for line in chunk.splitlines()
+        ]
+
+        obj = ObjectFile(source_name=source_name)
+
+        try:
+            self.collect_constants(source_lines)
+
+            for self.line_number, line in enumerate(source_lines, start=1):
+                self.process_line(line)
+
+            for section in self.sections.values():
+                obj.sections.append(self.layout_section(section))
+
+            for section in self.sections.values():
+                self.emit_section(section, obj)
+        except AssemblerError as error:
+            raise AssemblerError(f"{source_name}:{self.line_number}: {error}") from None
+
+        for name, value in self.constants.items():
+            obj.symbols.append(Symbol(name=name, section=SECTION_ABSOLUTE, value=value))
+
+        for name, section in self.symbol_sections.items():
+            obj.symbols.append(
+                Symbol(
+                    name=name,
+                    section=section,
+                    value=self.label_offsets[name],
+                    binding=STB_GLOBAL if name in self.globals else STB_LOCAL
+                )
+            )
+
+        for name in self.globals + self.externs:
+            if name not in self.symbol_sections:
+                obj.symbols.append(Symbol(name=name, section=None, value=0, binding=STB_GLOBAL))
+
+        return obj
+
+    def collect_constants(self, source_lines: list[str]) -> None:
+        """
+        Collect the 'equ' constants first, so they can be used before their definition.
+        """
+        for self.line_number, line in enumerate(source_lines, start=1):
+            match = LINE_REGEX.fullmatch(self.strip_comment(line).strip())
+
+            if match is None:
+                continue
+
+            rest = match.group("rest").split(None, 1)
+
+            if len(rest) == 2 and rest[0].lower() == "equ":
+                value, symbol = self.parse_expression(rest[1])
+
+                if symbol is not None:
+                    raise AssemblerError("'equ' only supports constant values")
+
+                self.constants[match.group("word")] = value
+
+    def strip_comment(self, line: str) -> str:
+        """
+        Remove the comment of a line, ignoring ';' inside strings.
+        """
+        quote = None
+
+        for i, char in enumerate(line):
+            if quote is not None:
+                if char == quote:
+                    quote = None
+            elif char in "'\"`":
+                quote = char
+            elif char == ";":
+                return line[:i]
+
+        return line
+
+    def split_operands(self, text: str) -> list[str]:
+        """
+        Split on the commas outside of strings and brackets.
+        """
+        operands = []
+        current = ""
+        quote = None
+        depth = 0
+
+        for char in text:
+            if quote is not None:
+                if char == quote:
+                    quote = None
+            elif char in "'\"`":
+                quote = char
+            elif char in "[(":
+                depth += 1
+            elif char in "])":
+                depth -= 1
+            elif char == "," and depth == 0:
+                operands.append(current.strip())
+                current = ""
+                continue
+
+            current += char
+
+        if current.strip() or operands:
+            operands.append(current.strip())
+
+        return operands
+
+    def process_line(self, line: str) -> None:
+        line = self.strip_comment(line).strip()
+
+        if not line:
+            return
+
+        # [section .text], [bits 64] ...
+        if line.startswith("[") and line.endswith("]"):
+            line = line[1:-1].strip()
+
+        match = LINE_REGEX.fullmatch(line)
+
+        if match is None:
+            raise AssemblerError(f"parser: instruction expected, got '{line}'")
+
+        word, rest = match.group("word"), match.group("rest")
+        next_word = rest.split(None, 1)[0].lower() if rest else None
+
+        if match.group("colon"):
+            self.define_label(word)
+
+            if rest:
+                self.process_statement(rest)
+
+            return
+
+        if next_word == "equ":
+            return      # Already collected
+
+        if word.lower() in LINE_DIRECTIVES:
+            self.process_directive(word.lower(), rest)
+            return
+
+        # 'x dq 1', even if the label looks like a mnemonic
+        if next_word in LABELED_DIRECTIVES and word.lower() != "times":
+            self.define_label(word)
+            self.process_statement(rest)
+            return
+
+        if self.is_statement(word):
+            self.process_statement(line)
+            return
+
+        if next_word is not None and is_mnemonic(next_word):
+            self.define_label(word)
+            self.process_statement(rest)
+            return
+
+        if not rest:
+            self.define_label(word)
+            return
+
+        raise AssemblerError(f"parser: instruction expected, got '{word}'")
+
+    def is_statement(self, word: str) -> bool:
+        word = word.lower()
+
+        return (
+            is_mnemonic(word)
+            or word in DATA_DIRECTIVES
+            or word in RESERVE_DIRECTIVES
+            or word in ("times", "align", "alignb")
+        )
+
+    def process_directive(self, directive: str, arguments: str) -> None:
+        if directive in ("section", "segment"):
+            name, *attributes = arguments.split()
+            _, _, alignment = get_section_attributes(name)
+
+            for attribute in attributes:
+                key, _, value = attribute.partition("=")
+
+                if key.lower() == "align":
+                    alignment = self.parse_constant(value)
+                elif key.lower() not in ("progbits", "nobits", "alloc", "noalloc", "exec", "noexec", "write", "nowrite"):
+                    raise AssemblerError(f"unsupported section attribute '{attribute}'")
+
+            if name not in self.sections:
+                self.sections[name] = SectionState(name=name, alignment=alignment)
+            else:
+                self.sections[name].alignment = max(self.sections[name].alignment, alignment)
+
+            self.current_section = self.sections[name]
+        elif directive in ("global", "extern"):
+            for name in self.split_operands(arguments):
+                # 'global main:function' - the symbol type is ignored
+                name = name.split(":")[0].strip()
+                target = self.globals if directive == "global" else self.externs
+
+                if name not in target:
+                    target.append(name)
+        elif directive == "default":
+            if arguments.strip().lower() != "abs":
+                raise AssemblerError(f"unsupported 'default {arguments.strip()}', only absolute addressing is supported")
+        elif directive == "bits":
+            if self.parse_constant(arguments) != 64:
+                raise AssemblerError("only 'bits 64' is supported")
+
+    def get_section(self) -> SectionState:
+        """
+        The current section, NASM starts in '.text'.
+        """
+        if self.current_section is None:
+            self.process_directive("section", ".text")
+
+        return self.current_section
+
+    def add_item(self, item: Item) -> None:
+        self.get_section().items.append(item)
+
+    def define_label(self, name: str) -> None:
+        # Local labels are attached to the last non-local label
+        if name.startswith(".") and not name.startswith(".."):
+            if self.last_label is None:
+                raise AssemblerError(f"local label '{name}' without a preceding label")
+
+            name = self.last_label + name
+        else:
+            self.last_label = name
+
+        if name in self.symbol_sections or name in self.constants:
+            raise AssemblerError(f"label '{name}' inconsistently redefined")
+
+        if name in REGISTERS:
+            raise AssemblerError(f"'{name}' is a register, not a label")
+
+        self.symbol_sections[name] = self.get_section().name
+
+        self.add_item(Item(kind="label", line_number=self.line_number, name=name))
+
+    def process_statement(self, statement: str) -> None:
+        word, rest = self.split_statement(statement)
+
+        if word == "times":
+            count_text, statement = self.split_statement(rest)
+            count = self.parse_constant(count_text)
+
+            if count < 0:
+                raise AssemblerError(f"invalid 'times' count '{count}'")
+
+            for item in self.parse_statement(*self.split_statement(statement)):
+                if item.kind == "jump":
+                    raise AssemblerError("jumps can't be repeated with 'times'")
+
+                if item.kind == "code":
+                    item.encoding = Encoding(
+                        code=item.encoding.code * count,
+                        fixups=[
+                            Fixup(offset=fixup.offset + i * len(item.encoding.code), kind=fixup.kind, symbol=fixup.symbol, addend=fixup.addend)
+                            for i in range(count)
+                            for fixup in item.encoding.fixups
+                        ]
+                    )
+                elif item.kind == "reserve":
+                    item.size *= count
+
+                self.add_item(item)
+
+            return
+
+        for item in self.parse_statement(word, rest):
+            self.add_item(item)
+
+    def split_statement(self, statement: str) -> tuple[str, str]:
+        """
+        Split a statement into its first word (lowered) and the rest.
+        """
+        word, *rest = statement.strip().split(None, 1)
+
+        return word.lower(), rest[0].strip() if rest else ""
+
+    def parse_statement(self, word: str, rest: str) -> list[Item]:
+        if word in DATA_DIRECTIVES:
+            return [Item(kind="code", line_number=self.line_number, encoding=self.parse_data(word, rest))]
+
+        if word in RESERVE_DIRECTIVES:
+            size = self.parse_constant(rest) * RESERVE_DIRECTIVES[word]
+
+            return [Item(kind="reserve", line_number=self.line_number, size=size)]
+
+        if word in ("align", "alignb"):
+            alignment = self.parse_constant(rest)
+
+            if alignment <= 0 or alignment & (alignment - 1):
+                raise AssemblerError(f"alignment '{alignment}' isn't a power of 2")
+
+            section = self.get_section()
+            section.alignment = max(section.alignment, alignment)
+            fill = NOP if word == "align" and get_section_attributes(section.name)[0] != SHT_NOBITS else None
+
+            return [Item(kind="align", line_number=self.line_number, alignment=alignment, fill=fill)]
+
+        if not is_mnemonic(word):
+            raise AssemblerError(f"unsupported instruction '{word}'")
+
+        operands = [self.parse_operand(operand) for operand in self.split_operands(rest)]
+
+        if is_jump(word) and len(operands) == 1 and isinstance(operands[0], Immediate):
+            return [Item(kind="jump", line_number=self.line_number, mnemonic=word, target=operands[0])]
+
+        return [Item(kind="code", line_number=self.line_number, encoding=encode_instruction(word, operands))]
+
+    def parse_data(self, directive: str, arguments: str) -> Encoding:
+        """
+        Encode the values of a db/dw/dd/dq directive.
+        """
+        unit = DATA_DIRECTIVES[directive]
+        code = bytearray()
+        fixups = []
+
+        for value in self.split_operands(arguments):
+            if value[:1] in ("'", '"', "`"):
+                if len(value) < 2 or value[-1] != value[0]:
+                    raise AssemblerError(f"unterminated string {value}")
+
+                string = self.parse_string(value)
+                code += string + bytes(-len(string) % unit)
+            elif FLOAT_REGEX.fullmatch(value) and not value.lower().startswith(("0x", "-0x", "+0x")):
+                if unit not in (4, 8):
+                    raise AssemblerError(f"floating-point constant in '{directive}'")
+
+                code += struct.pack("<f" if unit == 4 else "<d", float(value))
+            else:
+                number, symbol = self.parse_expression(value)
+
+                if symbol is not None:
+                    if unit not in (4, 8):
+                        raise AssemblerError(f"relocation of '{symbol}' doesn't fit in '{directive}'")
+
+                    fixups.append(
+                        Fixup(offset=len(code), kind=FIXUP_ABS64 if unit == 8 else FIXUP_ABS32, symbol=symbol, addend=number)
+                    )
+                    number = 0
+
+                code += pack_immediate(number, unit)
+
+        return Encoding(code=bytes(code), fixups=fixups)
+
+    def parse_string(self, value: str) -> bytes:
+        """
+        Decode a string literal, backquoted strings support C escapes.
+        """
+        body = value[1:-1]
+
+        if value[0] == "`":
+            return body.encode("utf-8").decode("unicode_escape").encode("latin-1")
+
+        return body.encode("utf-8")
+
+    def parse_operand(self, text: str) -> Register | Memory | Immediate:
+        size = None
+        words = text.split(None, 1)
+
+        if words and words[0].lower() in SIZE_KEYWORDS:
+            size = SIZE_KEYWORDS[words[0].lower()]
+            text = words[1] if len(words) == 2 else ""
+        elif "[" in text and text.split("[", 1)[0].strip().lower() in SIZE_KEYWORDS:
+            prefix, _, text = text.partition("[")
+            size = SIZE_KEYWORDS[prefix.strip().lower()]
+            text = "[" + text
+
+        text = text.strip()
+
+        if text.startswith("[") and text.endswith("]"):
+            return self.parse_memory(text[1:-1], size)
+
+        if text.lower() in REGISTERS:
+            return REGISTERS[text.lower()]
+
+        value, symbol = self.parse_expression(text)
+
+        return Immediate(value=value, symbol=symbol)
+
+    def parse_memory(self, text: str, size: int | None) -> Memory:
+        """
+        Parse an effective address: [base + index*scale + displacement].
+        """
+        memory = Memory(size=size)
+        registers: list[tuple[Register, int | None]] = []
+
+        for sign, term in self.split_terms(text):
+            factors = [factor.strip() for factor in term.split("*")]
+            factor_registers = [factor for factor in factors if factor.lower() in REGISTERS]
+
+            if factor_registers:
+                if sign < 0 or len(factor_registers) > 1:
+                    raise AssemblerError(f"invalid effective address '{text}'")
+
+                scale = None
+
+                if len(factors) > 1:
+                    scale = 1
+                    for factor in factors:
+                        if factor not in factor_registers:
+                            scale *= self.parse_constant(factor)
+
+                registers.append((REGISTERS[factor_registers[0].lower()], scale))
+                continue
+
+            value, symbol = self.parse_term(term)
+
+            if symbol is not None:
+                if sign < 0 or memory.symbol is not None:
+                    raise AssemblerError(f"invalid effective address '{text}'")
+
+                memory.symbol = symbol
+
+            memory.displacement += sign * value
+
+        # Scaled registers are indexes, the first other register is the base
+        for register, scale in registers:
+            if scale is not None and memory.index is None:
+                memory.index, memory.scale = register, scale
+            elif scale is None and memory.base is None:
+                memory.base = register
+            elif scale is None and memory.index is None:
+                memory.index = register
+            else:
+                raise AssemblerError(f"invalid effective address '{text}'")
+
+        # rsp can only be a base
+        if memory.index is not None and memory.index.code == 4 and memory.scale == 1 and memory.base is not None:
+            memory.base, memory.index = memory.index, memory.base
+
+        return memory
+
+    def split_terms(self, text: str) -> list[tuple[int, str]]:
+        """
+        Split an expression on its '+' and '-' operators.
+        """
+        terms = []
+
+        for sign, term in re.findall(r"([+-]?)\s*([^+-]+)", text.replace(" ", "")):
+            terms.append((-1 if sign == "-" else 1, term))
+
+        if not terms:
+            raise AssemblerError(f"expression expected, got '{text}'")
+
+        return terms
+
+    def parse_expression(self, text: str) -> tuple[int, str | None]:
+        """
+        Evaluate a '+'/'-' expression of numbers, constants and at most
+        one symbol, returns its constant part and its symbol.
+        """
+        value = 0
+        symbol = None
+
+        for sign, term in self.split_terms(text):
+            product = 1
+
+            for factor in term.split("*"):
+                factor_value, factor_symbol = self.parse_term(factor)
+
+                if factor_symbol is not None:
+                    if sign < 0 or symbol is not None or "*" in term:
+                        raise AssemblerError(f"invalid relocatable expression '{text}'")
+
+                    symbol = factor_symbol
+
+                product *= factor_value
+
+            value += sign * product
+
+        return value, symbol
+
+    def parse_constant(self, text: str) -> int:
+        value, symbol = self.parse_expression(text)
+
+        if symbol is not None:
+            raise AssemblerError(f"non-constant value '{text}'")
+
+        return value
+
+    def parse_term(self, term: str) -> tuple[int, str | None]:
+        """
+        Parse a number, a character, an 'equ' constant or a symbol.
+        """
+        term = term.strip()
+        lowered = term.lower().replace("_", "")
+
+        if not term:
+            raise AssemblerError("expression expected")
+
+        if term[0] in ("'", '"', "`") and len(term) >= 2 and term[-1] == term[0]:
+            return int.from_bytes(self.parse_string(term), "little"), None
+
+        if term[0].isdigit():
+            try:
+                if lowered.startswith(("0x", "0h")):
+                    return int(lowered[2:], 16), None
+                if lowered.startswith(("0b", "0y")):
+                    return int(lowered[2:], 2), None
+                if lowered.startswith(("0o", "0q")):
+                    return int(lowered[2:], 8), None
+                if lowered.endswith(("h", "x")):
+                    return int(lowered[:-1], 16), None
+                if lowered.endswith(("b", "y")):
+                    return int(lowered[:-1], 2), None
+                if lowered.endswith(("o", "q")):
+                    return int(lowered[:-1], 8), None
+                if lowered.endswith(("d", "t")):
+                    return int(lowered[:-1], 10), None
+
+                return int(lowered, 10), None
+            except ValueError:
+                raise AssemblerError(f"invalid number '{term}'") from None
+
+        if term in self.constants:
+            return self.constants[term], None
+
+        if SYMBOL_REGEX.fullmatch(term) and term.lower() not in REGISTERS:
+            # Local label reference
+            if term.startswith(".") and not term.startswith("..") and self.last_label is not None:
+                term = self.last_label + term
+
+            return 0, term
+
+        raise AssemblerError(f"invalid expression '{term}'")
+
+    def layout_section(self, section: SectionState) -> Section:
+        """
+        Assign an offset to every item, starting with short jumps and
+        growing the ones whose target is out of range until nothing changes.
+        """
+        # Only the jumps inside the section can be short
+        for item in section.items:
+            if item.kind == "jump":
+                item.short = self.symbol_sections.get(item.target.symbol) == section.name
+
+        while True:
+            offset = 0
+            labels = {}
+
+            for item in section.items:
+                item.offset = offset
+
+                if item.kind == "label":
+                    labels[item.name] = offset
+                elif item.kind == "align":
+                    item.size = -offset % item.alignment
+                elif item.kind == "code":
+                    item.size = len(item.encoding.code)
+                elif item.kind == "jump":
+                    item.encoding = encode_instruction(item.mnemonic, [item.target], short=item.short)
+                    item.size = len(item.encoding.code)
+
+                offset += item.size
+
+            changed = False
+
+            for item in section.items:
+                if item.kind != "jump" or not item.short:
+                    continue
+
+                displacement = labels[item.target.symbol] + item.target.value - (item.offset + item.size)
+
+                if not fits_int8(displacement):
+                    item.short = False
+                    changed = True
+
+            if not changed:
+                break
+
+        self.label_offsets.update(labels)
+
+        typ, flags, _ = get_section_attributes(section.name)
+
+        return Section(name=section.name, type=typ, flags=flags, alignment=section.alignment, size=offset)
+
+    def emit_section(self, section: SectionState, obj: ObjectFile) -> None:
+        """
+        Write the section's bytes, resolving the fixups local to the
+        section and emitting relocations for the others.
+        """
+        output = next(s for s in obj.sections if s.name == section.name)
+
+        for item in section.items:
+            self.line_number = item.line_number
+
+            if item.kind == "align" and item.fill is not None:
+                data = bytes([item.fill]) * item.size
+            elif item.kind in ("code", "jump"):
+                data = bytearray(item.encoding.code)
+
+                for fixup in item.encoding.fixups:
+                    self.apply_fixup(section, item, fixup, data, output)
+            else:
+                data = bytes(item.size)     # Labels, reserved space
+
+            if output.type == SHT_NOBITS:
+                if any(data):
+                    raise AssemblerError(f"attempt to initialize memory in the nobits section '{section.name}'")
+                continue
+
+            output.data += data
+
+    def apply_fixup(self, section: SectionState, item: Item, fixup: Fixup, data: bytearray, output: Section) -> None:
+        symbol_section = self.symbol_sections.get(fixup.symbol)
+
+        if symbol_section is None and fixup.symbol not in self.externs and fixup.symbol not in self.globals:
+            raise AssemblerError(f"symbol '{fixup.symbol}' not defined")
+
+        # A relative reference inside the section is resolved in place
+        if fixup.kind in (FIXUP_REL8, FIXUP_REL32) and symbol_section == section.name:
+            size = 1 if fixup.kind == FIXUP_REL8 else 4
+            value = self.label_offsets[fixup.symbol] + fixup.addend - (item.offset + fixup.offset)
+
+            data[fixup.offset:fixup.offset + size] = pack_immediate(value, size)
+            return
+
+        if fixup.kind == FIXUP_REL8:
+            raise AssemblerError(f"short jump to '{fixup.symbol}' is out of range")
+
+        # Relocations against local symbols go through their section symbol,
+        # as nasm does
+        if symbol_section is not None and fixup.symbol not in self.globals:
+            symbol, addend = symbol_section, fixup.addend + self.label_offsets[fixup.symbol]
+        else:
+            symbol, addend = fixup.symbol, fixup.addend
+
+        output.relocations.append(
+            Relocation(
+                offset=item.offset + fixup.offset,
+                type=FIXUP_RELOCATIONS[fixup.kind],
+                symbol=symbol,
+                addend=addend
+            )
+        )
@@ -0,0 +1,390 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "Section",
+    "Symbol",
+    "Relocation",
+    "ObjectFile",
+    "get_section_attributes",
+    "write_object",
+    "read_object",
+    "StringTable",
+    "align",
+    "SECTION_ABSOLUTE",
+    "SHT_PROGBITS",
+    "SHT_NOBITS",
+    "SHF_WRITE",
+    "SHF_ALLOC",
+    "SHF_EXECINSTR",
+    "STB_LOCAL",
+    "STB_GLOBAL",
+    "STB_WEAK",
+    "R_X86_64_64",
+    "R_X86_64_PC32",
+    "R_X86_64_PLT32",
+    "R_X86_64_32",
+    "R_X86_64_32S",
+]
+
+import struct
+
+from dataclasses import dataclass, field
+from typing import BinaryIO
+
+# Exceptions
+from manv.src.assembler.exceptions import ElfError
+
+# ELF constants
+ELFCLASS64 = 2
+ELFDATA2LSB = 1
+EV_CURRENT = 1
+ET_REL = 1
+ET_EXEC = 2
+EM_X86_64 = 62
+
+SHT_NULL = 0
+SHT_PROGBITS = 1
+SHT_SYMTAB = 2
+SHT_STRTAB = 3
+SHT_RELA = 4
+SHT_NOBITS = 8
+
+SHF_WRITE = 0x1
+SHF_ALLOC = 0x2
+SHF_EXECINSTR = 0x4
+SHF_INFO_LINK = 0x40
+
+SHN_UNDEF = 0
+SHN_ABS = 0xFFF1
+SHN_COMMON = 0xFFF2
+
+STB_LOCAL = 0
+STB_GLOBAL = 1
+STB_WEAK = 2
+
+STT_NOTYPE = 0
+STT_SECTION = 3
+STT_FILE = 4
+
+R_X86_64_64 = 1
+R_X86_64_PC32 = 2
+R_X86_64_PLT32 = 4
+R_X86_64_32 = 10
+R_X86_64_32S = 11
+
+# Structures layout
+ELF_HEADER = struct.Struct("<16sHHIQQQIHHHHHH")
+SECTION_HEADER = struct.Struct("<IIQQQQIIQQ")
+SYMBOL = struct.Struct("<IBBHQQ")
+RELA = struct.Struct("<QQq")
+
+# Section of the absolute symbols (equ constants)
+SECTION_ABSOLUTE = "*ABS*"
+
+# Type, flags and alignment of the known sections, as set by nasm
+SECTIONS_ATTRIBUTES = {
+    ".text": (SHT_PROGBITS, SHF_ALLOC | SHF_EXECINSTR, 16),
+    ".data": (SHT_PROGBITS, SHF_ALLOC | SHF_WRITE, 4),
+    ".rodata": (SHT_PROGBITS, SHF_ALLOC, 4),
+    ".bss": (SHT_NOBITS, SHF_ALLOC | SHF_WRITE, 4),
+}
+
+@dataclass
+class Relocation:
+    offset: int
+    type: int
+    symbol: str     # A symbol name, or a section name for a section relative relocation
+    addend: int
+
+@dataclass
+class Section:
+    name: str
+    type: int
+    flags: int
+    alignment: int
+    data: bytearray = field(default_factory=bytearray)
+    size: int = 0       # Only used by SHT_NOBITS sections
+    relocations: list[Relocation] = field(default_factory=list)
+
+    @property
+    def length(self) -> int:
+        return self.size if self.type == SHT_NOBITS else len(self.data)
+
+@dataclass
+class Symbol:
+    name: str
+    section: str | None     # None if undefined (extern)
+    value: int
+    binding: int = STB_LOCAL
+
+@dataclass
+class ObjectFile:
+    source_name: str
+    sections: list[Section] = field(default_factory=list)
+    symbols: list[Symbol] = field(default_factory=list)
+
+def get_section_attributes(name: str) -> tuple[int, int, int]:
+    """
+    Type, flags and default alignment of a section from its name,
+    '.text.main' gets the attributes of '.text'.
+    """
+    for prefix, attributes in SECTIONS_ATTRIBUTES.items():
+        if name == prefix or name.startswith(prefix + "."):
+            return attributes
+
+    return SHT_PROGBITS, SHF_ALLOC, 1
+
+class StringTable:
+    """
+    ELF string table, each string is stored once.
+    """
+    def __init__(self) -> None:
+        self.data = bytearray(b"\x00")
+        self.offsets: dict[str, int] = {"": 0}
+
+    def add(self, string: str) -> int:
+        if string not in self.offsets:
+            self.offsets[string] = len(self.data)
+            self.data += string.encode() + b"\x00"
+
+        return self.offsets[string]
+
+def align(value: int, alignment: int) -> int:
+    return (value + alignment - 1) // alignment * alignment if alignment > 1 else value
+
+def write_object(obj: ObjectFile, output: BinaryIO) -> None:
+    """
+    Write an ELF64 relocatable object file.
+
+    Sections layout: the object's sections, their '.rela' sections,
+    then '.symtab', '.strtab' and '.shstrtab'.
+    """
+    section_names = StringTable()
+    symbol_names = StringTable()
+
+    section_indexes = {section.name: index for index, section in enumerate(obj.sections, start=1)}
+
+    # Symbol table: locals first (file, sections, labels), then globals
+    symbols = [SYMBOL.pack(0, 0, 0, SHN_UNDEF, 0, 0)]
+    symbol_indexes: dict[str, int] = {}
+
+    symbols.append(SYMBOL.pack(symbol_names.add(obj.source_name), (STB_LOCAL << 4) | STT_FILE, 0, SHN_ABS, 0, 0))
+
+    for section in obj.sections:
+        symbol_indexes[section.name] = len(symbols)
+        symbols.append(SYMBOL.pack(0, (STB_LOCAL << 4) | STT_SECTION, 0, section_indexes[section.name], 0, 0))
+
+    first_global_index = None
+
+    for is_global in (False, True):
+        if is_global:
+            first_global_index = len(symbols)
+
+        for symbol in obj.symbols:
+            if (symbol.binding != STB_LOCAL) != is_global:
+                continue
+
+            if symbol.section is None:
+                shndx = SHN_UNDEF
+            elif symbol.section == SECTION_ABSOLUTE:
+                shndx = SHN_ABS
+            else:
+                shndx = section_indexes[symbol.section]
+
+            symbol_indexes[symbol.name] = len(symbols)
+            symbols.append(
+                SYMBOL.pack(symbol_names.add(symbol.name), (symbol.binding << 4) | STT_NOTYPE, 0, shndx, symbol.value, 0)
+            )
+
+    # Sections contents
+    headers = [SECTION_HEADER.pack(0, SHT_NULL, 0, 0, 0, 0, 0, 0, 0, 0)]
+    contents: list[tuple[int, bytes]] = []
+    offset = ELF_HEADER.size
+
+    def add_section(name: str, typ: int, flags: int, data: bytes, size: int, link: int = 0, info: int = 0, alignment: int = 1, entry_size: int = 0) -> None:
+        nonlocal offset
+
+        offset = align(offset, alignment)
+        headers.append(
+            SECTION_HEADER.pack(section_names.add(name), typ, flags, 0, offset, size, link, info, alignment, entry_size)
+        )
+
+        if typ != SHT_NOBITS:
+            contents.append((offset, data))
+            offset += len(data)
+
+    symtab_index = len(obj.sections) + sum(1 for section in obj.sections if section.relocations) + 1
+
+    for section in obj.sections:
+        add_section(section.name, section.type, section.flags, bytes(section.data), section.length, alignment=section.alignment)
+
+    for section in obj.sections:
+        if not section.relocations:
+            continue
+
+        relocations = b"".join(
+            RELA.pack(relocation.offset, (symbol_indexes[relocation.symbol] << 32) | relocation.type, relocation.addend)
+            for relocation in section.relocations
+        )
+
+        add_section(
+            ".rela" + section.name, SHT_RELA, SHF_INFO_LINK, relocations, len(relocations),
+            link=symtab_index, info=section_indexes[section.name], alignment=8, entry_size=RELA.size
+        )
+
+    symtab = b"".join(symbols)
+
+    add_section(".symtab", SHT_SYMTAB, 0, symtab, len(symtab), link=symtab_index + 1, info=first_global_index, alignment=8, entry_size=SYMBOL.size)
+    add_section(".strtab", SHT_STRTAB, 0, bytes(symbol_names.data), len(symbol_names.data))
+
+    # '.shstrtab' has to name itself before being written
+    section_names.add(".shstrtab")
+    add_section(".shstrtab", SHT_STRTAB, 0, bytes(section_names.data), len(section_names.data))
+
+    section_headers_offset = align(offset, 8)
+
+    output.write(
+        ELF_HEADER.pack(
+            b"\x7fELF" + bytes([ELFCLASS64, ELFDATA2LSB, EV_CURRENT]) + bytes(9),
+            ET_REL, EM_X86_64, EV_CURRENT,
+            0, 0, section_headers_offset,
+            0, ELF_HEADER.size, 0, 0,
+            SECTION_HEADER.size, len(headers), len(headers) - 1
+        )
+    )
+
+    position = ELF_HEADER.size
+
+    for content_offset, data in contents:
+        output.write(bytes(content_offset - position))
+        output.write(data)
+        position = content_offset + len(data)
+
+    output.write(bytes(section_headers_offset - position))
+    output.write(b"".join(headers))
+
+def read_object(data: bytes, source_name: str) -> ObjectFile:
+    """
+    Read an ELF64 relocatable object file (as written by nasm or by
+    'write_object'), keeping its allocated sections, symbols and relocations.
+    """
+    if data[:4] != b"\x7fELF" or len(data) < ELF_HEADER.size:
+        raise ElfError(f"'{source_name}' isn't an ELF file")
+
+    (
+        ident, typ, machine, _, _, _, section_headers_offset,
+        _, _, _, _, section_header_size, sections_count, names_index
+    ) = ELF_HEADER.unpack_from(data)
+
+    if ident[4] != ELFCLASS64 or ident[5] != ELFDATA2LSB or machine != EM_X86_64:
+        raise ElfError(f"'{source_name}' isn't an x86-64 ELF64 file")
+
+    if typ != ET_REL:
+        raise ElfError(f"'{source_name}' isn't a relocatable object")
+
+    headers = [
+        SECTION_HEADER.unpack_from(data, section_headers_offset + i * section_header_size)
+        for i in range(sections_count)
+    ]
+
+    def get_string(table_index: int, offset: int) -> str:
+        table_offset = headers[table_index][4]
+        end = data.index(b"\x00", table_offset + offset)
+
+        return data[table_offset + offset:end].decode()
+
+    obj = ObjectFile(source_name=source_name)
+    sections: dict[int, Section] = {}
+
+    for index, (name, typ, flags, _, offset, size, _, _, alignment, _) in enumerate(headers):
+        if typ not in (SHT_PROGBITS, SHT_NOBITS) or not flags & SHF_ALLOC:
+            continue
+
+        section = Section(
+            name=get_string(names_index, name),
+            type=typ,
+            flags=flags,
+            alignment=max(alignment, 1),
+            data=bytearray(data[offset:offset + size]) if typ == SHT_PROGBITS else bytearray(),
+            size=size if typ == SHT_NOBITS else 0
+        )
+
+        if any(other.name == section.name for other in obj.sections):
+            raise ElfError(f"'{source_name}': duplicate section '{section.name}' isn't supported")
+
+        sections[index] = section
+        obj.sections.append(section)
+
+    # Symbols, by their index in the symbol table
+    symbol_names: dict[int, str | None] = {}
+
+    for index, (_, typ, _, _, offset, size, link, _, _, entry_size) in enumerate(headers):
+        if typ != SHT_SYMTAB:
+            continue
+
+        for i in range(1, size // entry_size):
+            name, info, _, shndx, value, _ = SYMBOL.unpack_from(data, offset + i * entry_size)
+            binding, symbol_type = info >> 4, info & 0xF
+
+            if symbol_type == STT_SECTION:
+                symbol_names[i] = sections[shndx].name if shndx in sections else None
+                continue
+
+            if symbol_type == STT_FILE:
+                continue
+
+            if shndx == SHN_COMMON:
+                raise ElfError(f"'{source_name}': common symbols aren't supported")
+
+            if shndx == SHN_UNDEF:
+                section_name = None
+            elif shndx == SHN_ABS:
+                section_name = SECTION_ABSOLUTE
+            elif shndx in sections:
+                section_name = sections[shndx].name
+            else:
+                symbol_names[i] = None      # In a dropped section
+                continue
+
+            symbol_names[i] = get_string(link, name)
+            obj.symbols.append(
+                Symbol(name=symbol_names[i], section=section_name, value=value, binding=binding)
+            )
+
+    # Relocations
+    for typ_index, (_, typ, _, _, offset, size, _, info, _, entry_size) in enumerate(headers):
+        if typ != SHT_RELA or info not in sections:
+            continue
+
+        for i in range(size // entry_size):
+            relocation_offset, relocation_info, addend = RELA.unpack_from(data, offset + i * entry_size)
+            symbol = symbol_names.get(relocation_info >> 32)
+
+            if symbol is None:
+                raise ElfError(f"'{source_name}': relocation against a dropped section")
+
+            sections[info].relocations.append(
+                Relocation(offset=relocation_offset, type=relocation_info & 0xFFFFFFFF, symbol=symbol, addend=addend)
+            )
+
+    return obj
@@ -0,0 +1,893 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "Register",
+    "Memory",
+    "Immediate",
+    "Fixup",
+    "Encoding",
+    "REGISTERS",
+    "SIZE_KEYWORDS",
+    "CONDITION_CODES",
+    "FIXUP_ABS32",
+    "FIXUP_ABS32S",
+    "FIXUP_ABS64",
+    "FIXUP_REL8",
+    "FIXUP_REL32",
+    "is_mnemonic",
+    "is_jump",
+    "fits_int8",
+    "pack_immediate",
+    "encode_instruction",
+]
+
+from dataclasses import dataclass, field
+
+# Exceptions
+from manv.src.assembler.exceptions import AssemblerError
+
+@dataclass(frozen=True)
+class Register:
+    name: str
+    code: int       # 0-15
+    size: int       # In bytes
+    kind: str       # 'gpr', 'xmm' or 'ymm'
+
+    @property
+    def needs_rex(self) -> bool:
+        """
+        spl, bpl, sil and dil are only reachable with a REX prefix.
+        """
+        return self.kind == "gpr" and self.size == 1 and self.name in ("spl", "bpl", "sil", "dil")
+
+    @property
+    def is_high_byte(self) -> bool:
+        return self.name in ("ah", "ch", "dh", "bh")
+
+@dataclass
+class Memory:
+    size: int | None = None     # In bytes, None if not specified
+    base: Register | None = None
+    index: Register | None = None
+    scale: int = 1
+    displacement: int = 0
+    symbol: str | None = None
+
+@dataclass
+class Immediate:
+    value: int = 0
+    symbol: str | None = None
+
+@dataclass
+class Fixup:
+    """
+    A field of an encoded instruction that depends on a symbol's address.
+
+    The field's final value is 'S + A' for the absolute kinds and
+    'S + A - P' for the relative ones, P being the field's address.
+    """
+    offset: int
+    kind: str
+    symbol: str
+    addend: int
+
+@dataclass
+class Encoding:
+    code: bytes
+    fixups: list[Fixup] = field(default_factory=list)
+
+# Fixup kinds
+FIXUP_ABS32 = "abs32"
+FIXUP_ABS32S = "abs32s"
+FIXUP_ABS64 = "abs64"
+FIXUP_REL8 = "rel8"
+FIXUP_REL32 = "rel32"
+
+# Registers
+REGISTERS: dict[str, Register] = {}
+
+for code, name in enumerate(["rax", "rcx", "rdx", "rbx", "rsp", "rbp", "rsi", "rdi"]):
+    REGISTERS[name] = Register(name=name, code=code, size=8, kind="gpr")
+    REGISTERS["e" + name[1:]] = Register(name="e" + name[1:], code=code, size=4, kind="gpr")
+    REGISTERS[name[1:]] = Register(name=name[1:], code=code, size=2, kind="gpr")
+
+for code, name in enumerate(["al", "cl", "dl", "bl", "spl", "bpl", "sil", "dil"]):
+    REGISTERS[name] = Register(name=name, code=code, size=1, kind="gpr")
+
+for code, name in enumerate(["ah", "ch", "dh", "bh"], start=4):
+    REGISTERS[name] = Register(name=name, code=code, size=1, kind="gpr")
+
+for code in range(8, 16):
+    for suffix, size in (("", 8), ("d", 4), ("w", 2), ("b", 1)):
+        REGISTERS[f"r{code}{suffix}"] = Register(name=f"r{code}{suffix}", code=code, size=size, kind="gpr")
+
+for code in range(16):
+    REGISTERS[f"xmm{code}"] = Register(name=f"xmm{code}", code=code, size=16, kind="xmm")
+    REGISTERS[f"ymm{code}"] = Register(name=f"ymm{code}", code=code, size=32, kind="ymm")
+
+SIZE_KEYWORDS = {
+    "byte": 1,
+    "word": 2,
+    "dword": 4,
+    "qword": 8,
+    "oword": 16,
+    "yword": 32,
+}
+
+CONDITION_CODES = {
+    "o": 0x0, "no": 0x1,
+    "b": 0x2, "c": 0x2, "nae": 0x2,
+    "ae": 0x3, "nb": 0x3, "nc": 0x3,
+    "e": 0x4, "z": 0x4,
+    "ne": 0x5, "nz": 0x5,
+    "be": 0x6, "na": 0x6,
+    "a": 0x7, "nbe": 0x7,
+    "s": 0x8, "ns": 0x9,
+    "p": 0xA, "pe": 0xA,
+    "np": 0xB, "po": 0xB,
+    "l": 0xC, "nge": 0xC,
+    "ge": 0xD, "nl": 0xD,
+    "le": 0xE, "ng": 0xE,
+    "g": 0xF, "nle": 0xF,
+}
+
+# Instructions without operands
+NO_OPERANDS_INSTRUCTIONS = {
+    "ret": b"\xc3",
+    "leave": b"\xc9",
+    "nop": b"\x90",
+    "hlt": b"\xf4",
+    "int3": b"\xcc",
+    "cdq": b"\x99",
+    "cqo": b"\x48\x99",
+    "cdqe": b"\x48\x98",
+    "syscall": b"\x0f\x05",
+    "cpuid": b"\x0f\xa2",
+    "xgetbv": b"\x0f\x01\xd0",
+    "vzeroupper": b"\xc5\xf8\x77",
+}
+
+# add/or/adc/sbb/and/sub/xor/cmp, the value is the /digit of the opcode
+ALU_INSTRUCTIONS = {
+    "add": 0,
+    "or": 1,
+    "adc": 2,
+    "sbb": 3,
+    "and": 4,
+    "sub": 5,
+    "xor": 6,
+    "cmp": 7,
+}
+
+# F6/F7 group, the value is the /digit of the opcode
+UNARY_INSTRUCTIONS = {
+    "not": 2,
+    "neg": 3,
+    "mul": 4,
+    "div": 6,
+    "idiv": 7,
+}
+
+# FE/FF group
+INC_DEC_INSTRUCTIONS = {
+    "inc": 0,
+    "dec": 1,
+}
+
+# C0/C1/D0/D1/D2/D3 group
+SHIFT_INSTRUCTIONS = {
+    "rol": 0,
+    "ror": 1,
+    "rcl": 2,
+    "rcr": 3,
+    "shl": 4,
+    "sal": 4,
+    "shr": 5,
+    "sar": 7,
+}
+
+# SSE instructions: (mandatory prefix, load opcode, store opcode)
+# the load form is 'xmm, xmm/m', the store form is 'm, xmm'
+SSE_INSTRUCTIONS = {
+    # Moves
+    "movdqa": (0x66, 0x6F, 0x7F),
+    "movdqu": (0xF3, 0x6F, 0x7F),
+    "movapd": (0x66, 0x28, 0x29),
+    "movaps": (None, 0x28, 0x29),
+    "movupd": (0x66, 0x10, 0x11),
+    "movups": (None, 0x10, 0x11),
+    "movsd": (0xF2, 0x10, 0x11),
+    "movss": (0xF3, 0x10, 0x11),
+
+    # Packed integers
+    "paddq": (0x66, 0xD4, None),
+    "psubq": (0x66, 0xFB, None),
+    "paddd": (0x66, 0xFE, None),
+    "psubd": (0x66, 0xFA, None),
+    "pmuludq": (0x66, 0xF4, None),
+    "pand": (0x66, 0xDB, None),
+    "por": (0x66, 0xEB, None),
+    "pxor": (0x66, 0xEF, None),
+
+    # Floats
+    "addpd": (0x66, 0x58, None),
+    "subpd": (0x66, 0x5C, None),
+    "mulpd": (0x66, 0x59, None),
+    "divpd": (0x66, 0x5E, None),
+    "addps": (None, 0x58, None),
+    "subps": (None, 0x5C, None),
+    "mulps": (None, 0x59, None),
+    "divps": (None, 0x5E, None),
+    "addsd": (0xF2, 0x58, None),
+    "subsd": (0xF2, 0x5C, None),
+    "mulsd": (0xF2, 0x59, None),
+    "divsd": (0xF2, 0x5E, None),
+    "addss": (0xF3, 0x58, None),
+    "subss": (0xF3, 0x5C, None),
+    "mulss": (0xF3, 0x59, None),
+    "divss": (0xF3, 0x5E, None),
+    "xorpd": (0x66, 0x57, None),
+    "xorps": (None, 0x57, None),
+}
+
+# VEX.pp values of the mandatory prefixes
+VEX_PP = {
+    None: 0,
+    0x66: 1,
+    0xF3: 2,
+    0xF2: 3,
+}
+
+OTHER_MNEMONICS = {
+    "mov", "movzx", "movsx", "movsxd", "lea", "test", "imul", "push", "pop",
+    "bt", "jmp", "call",
+}
+
+def is_mnemonic(mnemonic: str) -> bool:
+    """
+    Whether a mnemonic is supported by the encoder.
+    """
+    return (
+        mnemonic in NO_OPERANDS_INSTRUCTIONS
+        or mnemonic in ALU_INSTRUCTIONS
+        or mnemonic in UNARY_INSTRUCTIONS
+        or mnemonic in INC_DEC_INSTRUCTIONS
+        or mnemonic in SHIFT_INSTRUCTIONS
+        or mnemonic in SSE_INSTRUCTIONS
+        or (mnemonic.startswith("v") and mnemonic[1:] in SSE_INSTRUCTIONS)
+        or mnemonic in OTHER_MNEMONICS
+        or get_condition_code(mnemonic, "j") is not None
+        or get_condition_code(mnemonic, "set") is not None
+        or get_condition_code(mnemonic, "cmov") is not None
+    )
+
+def is_jump(mnemonic: str) -> bool:
+    """
+    Whether a mnemonic is a jmp or a jcc, the only instructions with a short form.
+    """
+    return mnemonic == "jmp" or get_condition_code(mnemonic, "j") is not None
+
+def get_condition_code(mnemonic: str, prefix: str) -> int | None:
+    """
+    The condition code of a jcc/setcc/cmovcc mnemonic.
+    """
+    if not mnemonic.startswith(prefix):
+        return None
+
+    return CONDITION_CODES.get(mnemonic[len(prefix):])
+
+def fits_int8(value: int) -> bool:
+    return -0x80 <= value <= 0x7F
+
+def fits_int32(value: int) -> bool:
+    return -0x80000000 <= value <= 0x7FFFFFFF
+
+def pack_immediate(value: int, size: int) -> bytes:
+    """
+    Pack an immediate, accepting both the signed and unsigned ranges of its size.
+    """
+    bits = size * 8
+
+    if not -(1 << (bits - 1)) <= value < (1 << bits):
+        raise AssemblerError(f"value '{value}' doesn't fit in {size} byte(s)")
+
+    return (value & ((1 << bits) - 1)).to_bytes(size, "little")
+
+def sign_extend(value: int, size: int) -> int:
+    """
+    Read an immediate of a given size as a signed value (0xFFFFFFF0 -> -16 for a dword).
+    """
+    bits = size * 8
+    value &= (1 << bits) - 1
+
+    return value - (1 << bits) if value >> (bits - 1) else value
+
+def encode_modrm(reg: int, rm: Register | Memory) -> tuple[int, int, bytes, Fixup | None]:
+    """
+    Encode the ModRM byte of an operand with its SIB and displacement.
+
+    Returns the REX.X and REX.B bits, the encoded bytes, and a fixup on the
+    displacement (its offset is relative to the ModRM byte).
+    """
+    reg_bits = (reg & 7) << 3
+
+    if isinstance(rm, Register):
+        return 0, rm.code >> 3, bytes([0xC0 | reg_bits | (rm.code & 7)]), None
+
+    base = rm.base
+    index = rm.index
+
+    if index is not None and index.code == 4:
+        if base is None and rm.scale == 1:
+            base, index = index, None
+        else:
+            raise AssemblerError(f"'{index.name}' can't be used as an index register")
+
+    if rm.scale not in (1, 2, 4, 8):
+        raise AssemblerError(f"invalid scale '{rm.scale}'")
+
+    scale_bits = {1: 0, 2: 1, 4: 2, 8: 3}[rm.scale] << 6
+    rex_x = index.code >> 3 if index is not None else 0
+    rex_b = base.code >> 3 if base is not None else 0
+    fixup = None
+
+    # No base: [disp32] or [index*scale + disp32], always through a SIB byte
+    # (absolute addressing, not RIP relative)
+    if base is None:
+        index_bits = (index.code & 7) << 3 if index is not None else 0b100 << 3
+        encoded = bytes([0x04 | reg_bits, scale_bits | index_bits | 0b101])
+
+        if rm.symbol is not None:
+            fixup = Fixup(offset=len(encoded), kind=FIXUP_ABS32S, symbol=rm.symbol, addend=rm.displacement)
+
+        return rex_x, rex_b, encoded + pack_immediate(rm.displacement if rm.symbol is None else 0, 4), fixup
+
+    # Pick the displacement size, rbp/r13 have no 'no displacement' form
+    if rm.symbol is not None:
+        mod = 0b10
+    elif rm.displacement == 0 and (base.code & 7) != 5:
+        mod = 0b00
+    elif fits_int8(rm.displacement):
+        mod = 0b01
+    else:
+        mod = 0b10
+
+    if index is None and (base.code & 7) != 4:
+        encoded = bytes([(mod << 6) | reg_bits | (base.code & 7)])
+    else:
+        index_bits = (index.code & 7) << 3 if index is not None else 0b100 << 3
+        encoded = bytes([(mod << 6) | reg_bits | 0b100, scale_bits | index_bits | (base.code & 7)])
+
+    if mod == 0b01:
+        encoded += pack_immediate(rm.displacement, 1)
+    elif mod == 0b10:
+        if rm.symbol is not None:
+            fixup = Fixup(offset=len(encoded), kind=FIXUP_ABS32S, symbol=rm.symbol, addend=rm.displacement)
+            encoded += bytes(4)
+        else:
+            encoded += pack_immediate(rm.displacement, 4)
+
+    return rex_x, rex_b, encoded, fixup
+
+def encode_legacy(
+    opcode: bytes,
+    reg: int,
+    rm: Register | Memory,
+    size: int,
+    *,
+    prefix: int | None = None,
+    immediate: bytes = b"",
+    immediate_fixup: Fixup | None = None,
+    byte_registers: tuple[Register, ...] = ()
+) -> Encoding:
+    """
+    Encode a legacy (non VEX) instruction with a ModRM operand:
+    [prefixes] [REX] opcode ModRM [SIB] [displacement] [immediate]
+    """
+    rex_x, rex_b, modrm, modrm_fixup = encode_modrm(reg=reg, rm=rm)
+
+    rex_w = 1 if size == 8 else 0
+    rex_r = (reg >> 3) & 1
+    rex = (rex_w << 3) | (rex_r << 2) | (rex_x << 1) | rex_b
+    needs_rex = rex != 0 or any(register.needs_rex for register in byte_registers)
+
+    if needs_rex and any(register.is_high_byte for register in byte_registers):
+        raise AssemblerError("can't use a high byte register (ah, bh, ch, dh) with a REX prefix")
+
+    code = b""
+
+    if size == 2:
+        code += b"\x66"
+    if prefix is not None:
+        code += bytes([prefix])
+    if needs_rex:
+        code += bytes([0x40 | rex])
+
+    code += opcode
+    modrm_offset = len(code)
+    code += modrm
+
+    fixups = []
+
+    if modrm_fixup is not None:
+        modrm_fixup.offset += modrm_offset
+        fixups.append(modrm_fixup)
+
+    if immediate_fixup is not None:
+        immediate_fixup.offset += len(code)
+        fixups.append(immediate_fixup)
+
+    code += immediate
+
+    return Encoding(code=code, fixups=fixups)
+
+def encode_vex(
+    opcode: int,
+    prefix: int | None,
+    reg: Register,
+    vvvv: Register | None,
+    rm: Register | Memory,
+    length: int
+) -> Encoding:
+    """
+    Encode a VEX instruction of the 0F opcode map, using the 2 bytes VEX
+    prefix when possible.
+    """
+    rex_x, rex_b, modrm, modrm_fixup = encode_modrm(reg=reg.code, rm=rm)
+
+    r = (~reg.code >> 3) & 1
+    v = (~(vvvv.code if vvvv is not None else 0)) & 0xF
+    l = 1 if length == 32 else 0
+    pp = VEX_PP[prefix]
+
+    if rex_x == 0 and rex_b == 0:
+        code = bytes([0xC5, (r << 7) | (v << 3) | (l << 2) | pp])
+    else:
+        code = bytes([
+            0xC4,
+            (r << 7) | ((~rex_x & 1) << 6) | ((~rex_b & 1) << 5) | 0b00001,
+            (v << 3) | (l << 2) | pp
+        ])
+
+    code += bytes([opcode])
+    fixups = []
+
+    if modrm_fixup is not None:
+        modrm_fixup.offset += len(code)
+        fixups.append(modrm_fixup)
+
+    return Encoding(code=code + modrm, fixups=fixups)
+
+def get_operands_size(mnemonic: str, operands: list) -> int:
+    """
+    The operand size of an instruction, taken from its registers or from
+    the size keyword of its memory operand.
+    """
+    for operand in operands:
+        if isinstance(operand, Register):
+            return operand.size
+
+    for operand in operands:
+        if isinstance(operand, Memory) and operand.size is not None:
+            return operand.size
+
+    raise AssemblerError(f"operation size not specified for '{mnemonic}'")
+
+def check_operands(mnemonic: str, operands: list, *kinds: tuple) -> bool:
+    """
+    Whether the operands match one of the given forms, a form being a
+    tuple of operand types.
+    """
+    return any(
+        len(operands) == len(kind) and all(isinstance(operand, typ) for operand, typ in zip(operands, kind))
+        for kind in kinds
+    )
+
+def invalid_operands(mnemonic: str) -> AssemblerError:
+    return AssemblerError(f"invalid combination of opcode and operands for '{mnemonic}'")
+
+def encode_immediate(immediate: Immediate, size: int, kind: str = FIXUP_ABS32S) -> tuple[bytes, Fixup | None]:
+    """
+    Encode an immediate, emitting a fixup when it refers to a symbol.
+    """
+    if immediate.symbol is not None:
+        return bytes(size), Fixup(offset=0, kind=kind, symbol=immediate.symbol, addend=immediate.value)
+
+    return pack_immediate(immediate.value, size), None
+
+def encode_alu(mnemonic: str, operands: list) -> Encoding:
+    digit = ALU_INSTRUCTIONS[mnemonic]
+
+    if check_operands(mnemonic, operands, (Register, Register), (Memory, Register)):
+        dst, src = operands
+        size = src.size
+        opcode = digit * 8 + (0 if size == 1 else 1)
+
+        return encode_legacy(bytes([opcode]), src.code, dst, size, byte_registers=tuple(operands[i] for i in (0, 1) if isinstance(operands[i], Register)))
+
+    if check_operands(mnemonic, operands, (Register, Memory)):
+        dst, src = operands
+        size = dst.size
+        opcode = digit * 8 + (2 if size == 1 else 3)
+
+        return encode_legacy(bytes([opcode]), dst.code, src, size, byte_registers=(dst,))
+
+    if check_operands(mnemonic, operands, (Register, Immediate), (Memory, Immediate)):
+        dst, src = operands
+        size = get_operands_size(mnemonic, [dst])
+        byte_registers = (dst,) if isinstance(dst, Register) else ()
+        is_accumulator = isinstance(dst, Register) and dst.code == 0
+
+        if size == 1:
+            immediate, fixup = encode_immediate(src, 1)
+
+            if is_accumulator and fixup is None:
+                return Encoding(code=bytes([digit * 8 + 4]) + immediate)
+
+            return encode_legacy(b"\x80", digit, dst, size, immediate=immediate, immediate_fixup=fixup, byte_registers=byte_registers)
+
+        immediate_size = 2 if size == 2 else 4
+
+        if src.symbol is None and fits_int8(sign_extend(src.value, size)):
+            immediate, fixup = pack_immediate(sign_extend(src.value, size), 1), None
+
+            return encode_legacy(b"\x83", digit, dst, size, immediate=immediate)
+
+        if size == 8 and src.symbol is None and not fits_int32(src.value):
+            raise AssemblerError(f"signed dword value '{src.value}' exceeds bounds")
+
+        immediate, fixup = encode_immediate(src, immediate_size)
+
+        if is_accumulator:
+            # Short form: add rax, imm32
+            code = (b"\x66" if size == 2 else b"\x48" if size == 8 else b"") + bytes([digit * 8 + 5])
+
+            if fixup is not None:
+                fixup.offset = len(code)
+
+            return Encoding(code=code + immediate, fixups=[fixup] if fixup is not None else [])
+
+        return encode_legacy(b"\x81", digit, dst, size, immediate=immediate, immediate_fixup=fixup, byte_registers=byte_registers)
+
+    raise invalid_operands(mnemonic)
+
+def encode_mov(mnemonic: str, operands: list) -> Encoding:
+    if check_operands(mnemonic, operands, (Register, Register), (Memory, Register)):
+        dst, src = operands
+
+        if dst.size is not None and dst.size != src.size:
+            raise AssemblerError(f"mismatch in operand sizes for '{mnemonic}'")
+
+        opcode = 0x88 if src.size == 1 else 0x89
+
+        return encode_legacy(bytes([opcode]), src.code, dst, src.size, byte_registers=tuple(o for o in operands if isinstance(o, Register)))
+
+    if check_operands(mnemonic, operands, (Register, Memory)):
+        dst, src = operands
+        opcode = 0x8A if dst.size == 1 else 0x8B
+
+        return encode_legacy(bytes([opcode]), dst.code, src, dst.size, byte_registers=(dst,))
+
+    if check_operands(mnemonic, operands, (Register, Immediate)):
+        dst, src = operands
+        rex_b = dst.code >> 3
+        size = dst.size
+
+        if size == 8:
+            if src.symbol is not None or not fits_int32(src.value) and not 0 <= src.value < (1 << 32):
+                # mov r64, imm64
+                immediate, fixup = encode_immediate(src, 8, kind=FIXUP_ABS64)
+                code = bytes([0x48 | rex_b, 0xB8 + (dst.code & 7)])
+
+                if fixup is not None:
+                    fixup.offset = len(code)
+
+                return Encoding(code=code + immediate, fixups=[fixup] if fixup is not None else [])
+
+            if src.value < 0:
+                # mov r/m64, sign extended imm32
+                return encode_legacy(b"\xC7", 0, dst, 8, immediate=pack_immediate(src.value, 4))
+
+            # A positive value fits in a 32 bits mov, which zero extends to 64 bits
+            size = 4
+
+        immediate, fixup = encode_immediate(src, size, kind=FIXUP_ABS32)
+        code = (b"\x66" if size == 2 else b"") + (bytes([0x40 | rex_b]) if rex_b or dst.needs_rex else b"")
+        code += bytes([(0xB0 if size == 1 else 0xB8) + (dst.code & 7)])
+
+        if fixup is not None:
+            fixup.offset = len(code)
+
+        return Encoding(code=code + immediate, fixups=[fixup] if fixup is not None else [])
+
+    if check_operands(mnemonic, operands, (Memory, Immediate)):
+        dst, src = operands
+        size = get_operands_size(mnemonic, [dst])
+
+        if size == 8 and src.symbol is None and not fits_int32(src.value):
+            raise AssemblerError(f"signed dword value '{src.value}' exceeds bounds")
+
+        immediate, fixup = encode_immediate(src, 1 if size == 1 else 2 if size == 2 else 4)
+
+        return encode_legacy(b"\xC6" if size == 1 else b"\xC7", 0, dst, size, immediate=immediate, immediate_fixup=fixup)
+
+    raise invalid_operands(mnemonic)
+
+def encode_gpr_instruction(mnemonic: str, operands: list) -> Encoding:
+    """
+    Encode the general purpose instructions other than mov and the ALU ones.
+    """
+    if mnemonic in UNARY_INSTRUCTIONS or mnemonic in INC_DEC_INSTRUCTIONS:
+        if not check_operands(mnemonic, operands, (Register,), (Memory,)):
+            raise invalid_operands(mnemonic)
+
+        size = get_operands_size(mnemonic, operands)
+
+        if mnemonic in UNARY_INSTRUCTIONS:
+            opcode, digit = (0xF6 if size == 1 else 0xF7), UNARY_INSTRUCTIONS[mnemonic]
+        else:
+            opcode, digit = (0xFE if size == 1 else 0xFF), INC_DEC_INSTRUCTIONS[mnemonic]
+
+        return encode_legacy(bytes([opcode]), digit, operands[0], size, byte_registers=tuple(o for o in operands if isinstance(o, Register)))
+
+    if mnemonic in SHIFT_INSTRUCTIONS:
+        digit = SHIFT_INSTRUCTIONS[mnemonic]
+        size = get_operands_size(mnemonic, operands[:1])
+        byte_registers = tuple(o for o in operands[:1] if isinstance(o, Register))
+
+        if check_operands(mnemonic, operands, (Register, Immediate), (Memory, Immediate)):
+            if operands[1].value == 1:
+                return encode_legacy(bytes([0xD0 if size == 1 else 0xD1]), digit, operands[0], size, byte_registers=byte_registers)
+
+            return encode_legacy(bytes([0xC0 if size == 1 else 0xC1]), digit, operands[0], size, immediate=pack_immediate(operands[1].value, 1), byte_registers=byte_registers)
+
+        if check_operands(mnemonic, operands, (Register, Register), (Memory, Register)) and operands[1].name == "cl":
+            return encode_legacy(bytes([0xD2 if size == 1 else 0xD3]), digit, operands[0], size, byte_registers=byte_registers)
+
+        raise invalid_operands(mnemonic)
+
+    if mnemonic == "lea":
+        if not check_operands(mnemonic, operands, (Register, Memory)):
+            raise invalid_operands(mnemonic)
+
+        return encode_legacy(b"\x8D", operands[0].code, operands[1], operands[0].size)
+
+    if mnemonic == "test":
+        if check_operands(mnemonic, operands, (Register, Register), (Memory, Register)):
+            size = operands[1].size
+
+            return encode_legacy(bytes([0x84 if size == 1 else 0x85]), operands[1].code, operands[0], size, byte_registers=tuple(o for o in operands if isinstance(o, Register)))
+
+        if check_operands(mnemonic, operands, (Register, Immediate), (Memory, Immediate)):
+            size = get_operands_size(mnemonic, operands[:1])
+            immediate = pack_immediate(operands[1].value, 1 if size == 1 else 2 if size == 2 else 4)
+
+            if isinstance(operands[0], Register) and operands[0].code == 0:
+                # Short form: test al/ax/eax/rax, imm
+                code = (b"\x66" if size == 2 else b"\x48" if size == 8 else b"") + bytes([0xA8 if size == 1 else 0xA9])
+
+                return Encoding(code=code + immediate)
+
+            return encode_legacy(bytes([0xF6 if size == 1 else 0xF7]), 0, operands[0], size, immediate=immediate, byte_registers=tuple(o for o in operands[:1] if isinstance(o, Register)))
+
+        raise invalid_operands(mnemonic)
+
+    if mnemonic == "imul":
+        if check_operands(mnemonic, operands, (Register,), (Memory,)):
+            size = get_operands_size(mnemonic, operands)
+
+            return encode_legacy(bytes([0xF6 if size == 1 else 0xF7]), 5, operands[0], size)
+
+        if check_operands(mnemonic, operands, (Register, Register), (Register, Memory)):
+            return encode_legacy(b"\x0F\xAF", operands[0].code, operands[1], operands[0].size)
+
+        if check_operands(mnemonic, operands, (Register, Immediate)):
+            operands = [operands[0], operands[0], operands[1]]
+
+        if check_operands(mnemonic, operands, (Register, Register, Immediate), (Register, Memory, Immediate)):
+            dst, src, value = operands
+
+            if fits_int8(value.value):
+                return encode_legacy(b"\x6B", dst.code, src, dst.size, immediate=pack_immediate(value.value, 1))
+
+            return encode_legacy(b"\x69", dst.code, src, dst.size, immediate=pack_immediate(value.value, 2 if dst.size == 2 else 4))
+
+        raise invalid_operands(mnemonic)
+
+    if mnemonic in ("movzx", "movsx"):
+        if not check_operands(mnemonic, operands, (Register, Register), (Register, Memory)):
+            raise invalid_operands(mnemonic)
+
+        src_size = operands[1].size
+
+        if src_size not in (1, 2):
+            raise invalid_operands(mnemonic)
+
+        opcode = {"movzx": 0xB6, "movsx": 0xBE}[mnemonic] + (1 if src_size == 2 else 0)
+
+        return encode_legacy(bytes([0x0F, opcode]), operands[0].code, operands[1], operands[0].size, byte_registers=tuple(o for o in operands if isinstance(o, Register) and o.size == 1))
+
+    if mnemonic == "movsxd":
+        if not check_operands(mnemonic, operands, (Register, Register), (Register, Memory)):
+            raise invalid_operands(mnemonic)
+
+        return encode_legacy(b"\x63", operands[0].code, operands[1], 8)
+
+    if mnemonic in ("push", "pop"):
+        if check_operands(mnemonic, operands, (Register,)) and operands[0].size == 8:
+            register = operands[0]
+            code = bytes([0x41]) if register.code >> 3 else b""
+
+            return Encoding(code=code + bytes([(0x50 if mnemonic == "push" else 0x58) + (register.code & 7)]))
+
+        if mnemonic == "push" and check_operands(mnemonic, operands, (Immediate,)) and operands[0].symbol is None:
+            if fits_int8(operands[0].value):
+                return Encoding(code=b"\x6A" + pack_immediate(operands[0].value, 1))
+
+            return Encoding(code=b"\x68" + pack_immediate(operands[0].value, 4))
+
+        raise invalid_operands(mnemonic)
+
+    if mnemonic == "bt":
+        if check_operands(mnemonic, operands, (Register, Immediate), (Memory, Immediate)):
+            size = get_operands_size(mnemonic, operands[:1])
+
+            return encode_legacy(b"\x0F\xBA", 4, operands[0], size, immediate=pack_immediate(operands[1].value, 1))
+
+        if check_operands(mnemonic, operands, (Register, Register), (Memory, Register)):
+            return encode_legacy(b"\x0F\xA3", operands[1].code, operands[0], operands[1].size)
+
+        raise invalid_operands(mnemonic)
+
+    if (condition_code := get_condition_code(mnemonic, "set")) is not None:
+        if not check_operands(mnemonic, operands, (Register,), (Memory,)) or get_operands_size(mnemonic, operands) != 1:
+            raise invalid_operands(mnemonic)
+
+        return encode_legacy(bytes([0x0F, 0x90 + condition_code]), 0, operands[0], 1, byte_registers=tuple(o for o in operands if isinstance(o, Register)))
+
+    if (condition_code := get_condition_code(mnemonic, "cmov")) is not None:
+        if not check_operands(mnemonic, operands, (Register, Register), (Register, Memory)):
+            raise invalid_operands(mnemonic)
+
+        return encode_legacy(bytes([0x0F, 0x40 + condition_code]), operands[0].code, operands[1], operands[0].size)
+
+    raise AssemblerError(f"unsupported instruction '{mnemonic}'")
+
+def encode_branch(mnemonic: str, operands: list, short: bool) -> Encoding:
+    """
+    Encode jmp/jcc/call. Relative targets are always fixups, the assembler
+    resolves the ones that land in the same section.
+    """
+    if len(operands) != 1:
+        raise invalid_operands(mnemonic)
+
+    target = operands[0]
+
+    if isinstance(target, (Register, Memory)):
+        if mnemonic not in ("jmp", "call"):
+            raise invalid_operands(mnemonic)
+
+        if isinstance(target, Register) and target.size != 8:
+            raise invalid_operands(mnemonic)
+
+        # The operand size of an indirect branch defaults to 64 bits, no REX.W
+        encoding = encode_legacy(b"\xFF", 4 if mnemonic == "jmp" else 2, target, 4)
+
+        return encoding
+
+    if target.symbol is None:
+        raise AssemblerError(f"'{mnemonic}' to an absolute address isn't supported")
+
+    if mnemonic == "call":
+        opcode = b"\xE8"
+    elif mnemonic == "jmp":
+        opcode = b"\xEB" if short else b"\xE9"
+    else:
+        condition_code = get_condition_code(mnemonic, "j")
+        opcode = bytes([0x70 + condition_code]) if short else bytes([0x0F, 0x80 + condition_code])
+
+    short = short and mnemonic != "call"
+    size = 1 if short else 4
+
+    return Encoding(
+        code=opcode + bytes(size),
+        fixups=[
+            Fixup(
+                offset=len(opcode),
+                kind=FIXUP_REL8 if short else FIXUP_REL32,
+                symbol=target.symbol,
+                addend=target.value - size
+            )
+        ]
+    )
+
+def encode_sse(mnemonic: str, operands: list) -> Encoding:
+    is_vex = mnemonic not in SSE_INSTRUCTIONS
+    prefix, load_opcode, store_opcode = SSE_INSTRUCTIONS[mnemonic[1:] if is_vex else mnemonic]
+    vector = (Register,)
+
+    def is_vector(operand) -> bool:
+        return isinstance(operand, Register) and operand.kind in ("xmm", "ymm")
+
+    if not is_vex:
+        if len(operands) == 2 and is_vector(operands[0]) and operands[0].kind == "xmm" and isinstance(operands[1], (Register, Memory)):
+            if isinstance(operands[1], Register) and not is_vector(operands[1]):
+                raise invalid_operands(mnemonic)
+
+            return encode_legacy(bytes([0x0F, load_opcode]), operands[0].code, operands[1], 0, prefix=prefix)
+
+        if store_opcode is not None and len(operands) == 2 and isinstance(operands[0], Memory) and is_vector(operands[1]):
+            return encode_legacy(bytes([0x0F, store_opcode]), operands[1].code, operands[0], 0, prefix=prefix)
+
+        raise invalid_operands(mnemonic)
+
+    if store_opcode is not None:
+        # Moves: vmovdqa ymm, ymm/m - vmovdqa m, ymm
+        if len(operands) == 2 and is_vector(operands[0]) and isinstance(operands[1], (Register, Memory)):
+            return encode_vex(load_opcode, prefix, operands[0], None, operands[1], operands[0].size)
+
+        if len(operands) == 2 and isinstance(operands[0], Memory) and is_vector(operands[1]):
+            return encode_vex(store_opcode, prefix, operands[1], None, operands[0], operands[1].size)
+
+        raise invalid_operands(mnemonic)
+
+    # Non destructive source: vpaddq ymm, ymm, ymm/m
+    if len(operands) == 3 and is_vector(operands[0]) and is_vector(operands[1]) and isinstance(operands[2], vector + (Memory,)):
+        if operands[0].kind != operands[1].kind:
+            raise invalid_operands(mnemonic)
+
+        return encode_vex(load_opcode, prefix, operands[0], operands[1], operands[2], operands[0].size)
+
+    raise invalid_operands(mnemonic)
+
+def encode_instruction(mnemonic: str, operands: list, short: bool = False) -> Encoding:
+    """
+    Encode one instruction to machine code.
+
+    'short' selects the rel8 form of jmp/jcc.
+    """
+    if mnemonic in NO_OPERANDS_INSTRUCTIONS:
+        if operands:
+            raise invalid_operands(mnemonic)
+
+        return Encoding(code=NO_OPERANDS_INSTRUCTIONS[mnemonic])
+
+    for operand in operands:
+        if isinstance(operand, Memory):
+            for register in (operand.base, operand.index):
+                if register is not None and (register.kind != "gpr" or register.size != 8):
+                    raise AssemblerError(f"invalid effective address, '{register.name}' isn't a 64 bits register")
+
+    if mnemonic in ALU_INSTRUCTIONS:
+        return encode_alu(mnemonic, operands)
+
+    if mnemonic == "mov":
+        return encode_mov(mnemonic, operands)
+
+    if mnemonic in ("jmp", "call") or get_condition_code(mnemonic, "j") is not None:
+        return encode_branch(mnemonic, operands, short=short)
+
+    if mnemonic in SSE_INSTRUCTIONS or (mnemonic.startswith("v") and mnemonic[1:] in SSE_INSTRUCTIONS):
+        return encode_sse(mnemonic, operands)
+
+    return encode_gpr_instruction(mnemonic, operands)
@@ -78,9 +78,10 @@ class Constant(ASTNode):
     typ: Type
     value: ASTNode
     line: LineModel
+    is_array: bool = False  # Declared with an explicit size, ex: x[10]
 
     def __repr__(self) -> str:
-        return f"Constant(identifier={self.identifier!r}, size={self.size!r}, typ={self.typ!r}, value={self.value!r})"
+        return f"Constant(identifier={self.identifier!r}, size={self.size!r}, typ={self.typ!r}, value={self.value!r}, is_array={self.is_array!r})"
 
 @dataclass
 class CallConstant(ASTNode):
@@ -93,6 +94,7 @@ class Variable(ASTNode):
     typ: Type
     value: ASTNode
     line: LineModel
+    is_array: bool = False  # Declared with an explicit size, ex: x[10]
 
 @dataclass
 class MemoryAddress(ASTNode):
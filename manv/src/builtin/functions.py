@@ -24,6 +24,8 @@ __all__ = [
     "exit_func",
     "printi_func",
     "prints_func",
+    "cpu_features_func",
+    "CPU_HAS_AVX2_LABEL",
     "BUILTIN_FUNCTIONS"
 ]
 
@@ -159,8 +161,49 @@ prints_func = Function(
     is_syscall=True
 )
 
+# Byte set to 1 by `manv.cpu_features` when AVX2 can be used
+CPU_HAS_AVX2_LABEL = "manv.has_avx2"
+
+# CPU features detection, called from `_start` before `main`
+# by programs that use vectorized array operations.
+cpu_features_func = Function(
+    identifier=Identifier(name="manv.cpu_features"),
+    arguments=[NULL()],
+    statements=[NULL()],
+    return_type=NULL(),
+    asm_code={
+        "text": [
+            "manv.cpu_features:\n",
+            "\t" + "push    rbx\n",
+            "\t" + "mov     eax, 1\n",
+            "\t" + "cpuid\n",
+            "\t" + "and     ecx, 0x18000000  ; OSXSAVE | AVX\n",
+            "\t" + "cmp     ecx, 0x18000000\n",
+            "\t" + "jne     manv.cpu_features.done\n",
+            "\t" + "xor     ecx, ecx\n",
+            "\t" + "xgetbv                   ; The OS must save the YMM state\n",
+            "\t" + "and     eax, 6\n",
+            "\t" + "cmp     eax, 6\n",
+            "\t" + "jne     manv.cpu_features.done\n",
+            "\t" + "mov     eax, 7\n",
+            "\t" + "xor     ecx, ecx\n",
+            "\t" + "cpuid\n",
+            "\t" + "bt      ebx, 5           ; AVX2\n",
+            "\t" + "jnc     manv.cpu_features.done\n",
+            "\t" + f"mov     byte [{CPU_HAS_AVX2_LABEL}], 1\n",
+            "manv.cpu_features.done:\n",
+            "\t" + "pop     rbx\n",
+            "\t" + "ret\n",
+        ],
+        "bss": [
+            "\t" + f"{CPU_HAS_AVX2_LABEL} resb 1\n",
+        ]
+    }
+)
+
 BUILTIN_FUNCTIONS = [
     exit_func,
     printi_func,
-    prints_func
+    prints_func,
+    cpu_features_func
 ]
@@ -23,16 +23,34 @@
 __all__ = [
     "ASM",
 ]
+
+import io
+import re
+
+from typing import Iterator, TextIO
+
+# A label alone on its line, ex: 'main:'
+LABEL_LINE_REGEX = re.compile(r"\s*(?P<label>[A-Za-z_.$?@][\w.$?@#~]*):\s*")
+
+# NASM's default alignment of '.text'
+TEXT_ALIGNMENT = 16
+
 class ASM:
     """
     ASM object for holding the generated assembly
     """
     def __init__(self):
         self.section_data: dict[str, list[str]] = {}
+        self.section_rodata: dict[str, list[str]] = {}
         self.section_bss: dict[str, list[str]] = {}
         self.section_text: dict[str, list[str]] = {}
+        self.section_alignment: dict[str, int] = {}
 
         self.no_label_instructions = "no_label"  # This label used for instructions suchs as, 'global', 'extern' ...
+
+        # Each function in its own '.text.<function>' section, so the linker
+        # can drop the ones that aren't reached (--gc-sections)
+        self.function_sections = True
         
 
     def add_to_section(self, section: str, code: list[str] | str,  label: str | None = None):
@@ -41,6 +59,7 @@ class ASM:
         """
         target = {
             'data': self.section_data,
+            'rodata': self.section_rodata,
             'bss': self.section_bss,
             'text': self.section_text
         }.get(section)
@@ -64,32 +83,87 @@ class ASM:
                 if line:
                     target[label].append(line)
 
+    def set_section_alignment(self, section: str, alignment: int) -> None:
+        """
+        Set the minimum alignment (in bytes) of a section.
+        """
+        if section not in ('data', 'rodata', 'bss', 'text'):
+            raise ValueError(f"Unknown section: {section}")
+
+        self.section_alignment[section] = max(alignment, self.section_alignment.get(section, 0))
+
     def get_assembly(self) -> str:
         """
         Output the final NASM code, grouped by section and label.
         """
-        def format_section(section_name: str, section_dict: dict[str, list[str]]) -> str:
-            if not section_dict:
-                return ""
-            result = f"section .{section_name}\n"
-            for label, lines in section_dict.items():
-                if not lines:
-                    continue
-                
-                if label == self.no_label_instructions:
-                    result += ''.join(lines)
-                    continue
-            
-                if ":" not in label:
-                    label += ":"
-                
-                result += label + "\n"
-                result += ''.join(lines)
-            
-            return result
+        output = io.StringIO()
+
+        self.write(output=output)
+
+        return output.getvalue()
+
+    def write(self, output: TextIO) -> None:
+        """
+        Stream the final NASM code to a file object or a pipe, section
+        by section, without building the whole program in memory.
+        """
+        output.writelines(self.iter_lines())
+
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Iterate over the lines of the final NASM code.
+        """
+        for section_name, section_dict in [
+            ("data", self.section_data),
+            ("rodata", self.section_rodata),
+            ("bss", self.section_bss),
+            ("text", self.section_text),
+        ]:
+            yield from self.iter_section(section_name=section_name, section_dict=section_dict)
+
+    def iter_section(self, section_name: str, section_dict: dict[str, list[str]]) -> Iterator[str]:
+        """
+        Iterate over the lines of a section, including its header and labels.
+        """
+        if not section_dict:
+            return
+
+        header = f"section .{section_name}"
+        if section_name in self.section_alignment:
+            header += f" align={self.section_alignment[section_name]}"
+
+        yield header + "\n"
+
+        function = None
+
+        for label, lines in section_dict.items():
+            if not lines:
+                continue
+
+            if label != self.no_label_instructions:
+                lines = [(label if ":" in label else label + ":") + "\n", *lines]
+
+            if section_name != "text" or not self.function_sections:
+                yield from lines
+                continue
+
+            for line in lines:
+                match = LABEL_LINE_REGEX.fullmatch(line)
+
+                # A function starts at a label that isn't one of the current
+                # function's ('main.if.0.else' is in 'main')
+                if match is not None and (function is None or not match.group("label").startswith(function + ".")):
+                    function = match.group("label")
+
+                    yield self.get_function_section_header(function=function)
+
+                yield line
+
+    def get_function_section_header(self, function: str) -> str:
+        """
+        The header of a function's section, with its attributes spelled out
+        since NASM only infers them for the standard section names.
+        """
+        alignment = self.section_alignment.get("text", TEXT_ALIGNMENT)
 
-        return (
-            format_section("data", self.section_data) +
-            format_section("bss", self.section_bss) +
-            format_section("text", self.section_text)
-        )
+        return f"section .text.{function} progbits alloc exec nowrite align={alignment}\n"
@@ -24,15 +24,9 @@ __all__ = [
     "Codegen"
 ]
 
+import re
 import sys
-import random
-from rich import print
-
-# Utils
-from manv.utils import (
-    random_ascii_str,
-    random_int
-)
+from typing import Iterator
 
 # Base
 from manv.src.ast.base import ASTNode
@@ -52,14 +46,120 @@ from manv.src.builtin.types import *
 # ASM class
 from manv.src.codegen.asm import *
 
+# Symbols and labels naming
+from manv.src.codegen.symbols import *
+
+# Logs
+from manv.log import logger, count
+
+# Profiler phases
+from manv.profiler import profile_phase
+
 # Sections
-TEXT_SECTION = "text"
-DATA_SECTION = "data"
-BSS_SECTION  = "bss"
+TEXT_SECTION    = "text"
+DATA_SECTION    = "data"
+RODATA_SECTION  = "rodata"
+BSS_SECTION     = "bss"
 
 # Labels
 MAIN_FUNC_LABEL = "main"
 
+# Element-wise array operations: (AVX2, SSE2, scalar) instructions.
+# A 'None' vector instruction means the operation has no packed form
+# for the element type and only the scalar loop is emitted.
+ARRAY_OP_INSTRUCTIONS = {
+    IntType: {
+        AdditionOp:     ("vpaddq", "paddq", "add"),
+        SubtractionOp:  ("vpsubq", "psubq", "sub"),
+        MultiplyOp:     (None, None, "imul"),
+        DivideOp:       (None, None, "idiv"),
+    },
+    FloatType: {
+        AdditionOp:     ("vaddpd", "addpd", "addsd"),
+        SubtractionOp:  ("vsubpd", "subpd", "subsd"),
+        MultiplyOp:     ("vmulpd", "mulpd", "mulsd"),
+        DivideOp:       ("vdivpd", "divpd", "divsd"),
+    }
+}
+
+# Aligned moves for each element type: (AVX2, SSE2)
+ARRAY_MOV_INSTRUCTIONS = {
+    IntType: ("vmovdqa", "movdqa"),
+    FloatType: ("vmovapd", "movapd"),
+}
+
+# Conditions codes, used by jcc, setcc and cmovcc
+CONDITION_CODES = {
+    EqualSymbol: "e",
+    NotEqualSymbol: "ne",
+    GreaterThanSymbol: "g",
+    GreaterThanOrEqualToSymbol: "ge",
+    SmallerThanSymbol: "l",
+    SmallerThanOrEqualToSymbol: "le",
+}
+
+# Condition code true when the original one is false
+OPPOSITE_CONDITION_CODES = {
+    "e": "ne",
+    "ne": "e",
+    "g": "le",
+    "ge": "l",
+    "l": "ge",
+    "le": "g",
+}
+
+# Condition code to use when the 'cmp' operands are swapped
+SWAPPED_CONDITION_CODES = {
+    "e": "e",
+    "ne": "ne",
+    "g": "l",
+    "ge": "le",
+    "l": "g",
+    "le": "ge",
+}
+
+# Evaluation of a condition between two literals
+CONDITION_CODES_EVALUATION = {
+    "e": lambda left, right: left == right,
+    "ne": lambda left, right: left != right,
+    "g": lambda left, right: left > right,
+    "ge": lambda left, right: left >= right,
+    "l": lambda left, right: left < right,
+    "le": lambda left, right: left <= right,
+}
+
+# Range of the sign-extended immediates accepted by 'cmp'
+IMM32_MIN = -(2 ** 31)
+IMM32_MAX = 2 ** 31 - 1
+
+# Chains of 'if (x == constant)' on the same identifier
+SWITCH_MIN_CASES            = 4     # Shorter chains are kept as compares
+SWITCH_JUMP_TABLE_DENSITY   = 0.5   # Minimum ratio of cases over the table size
+SWITCH_LINEAR_SEARCH_CASES  = 3     # Leafs size of the binary search tree
+
+ARRAY_ELEMENT_SIZE = 8     # Every element is a qword
+ARRAY_ALIGNMENT    = 32    # Size of a YMM register
+
+# 64-bit registers and their low 32 bits, writing which zeroes the upper ones
+REGISTERS_32 = {
+    "rax": "eax", "rbx": "ebx", "rcx": "ecx", "rdx": "edx",
+    "rsi": "esi", "rdi": "edi", "rbp": "ebp",
+    **{f"r{reg}": f"r{reg}d" for reg in range(8, 16)},
+}
+
+# 'mov reg, immediate' and 'mov reg, symbol', rewritten shorter by -Os
+MOV_IMMEDIATE_REGEX = re.compile(r"\t(?:mov)\s+(?P<register>\w+),\s*(?P<source>[\w.$?@]+)\s*\n")
+
+# 'xor reg, reg', the 32 bits form zeroes the register without a REX prefix
+XOR_ZERO_REGEX = re.compile(r"\txor\s+(?P<register>\w+),\s*(?P=register)\s*\n")
+
+# Instructions that neither read nor write the flags
+FLAGS_NEUTRAL_MNEMONICS = {"mov", "lea", "push", "pop", "movzx", "movsx", "movsxd", "nop"}
+
+# Instructions that overwrite the flags without reading them, or after
+# which they're dead (they aren't preserved across calls)
+FLAGS_KILLING_MNEMONICS = {"cmp", "test", "add", "sub", "and", "or", "xor", "neg", "call", "syscall", "ret"}
+
 # Arguments registers for Unix x86-64
 ARGS_REGISTERS = [
     "rdi",
@@ -74,35 +174,272 @@ class Codegen:
     """
     Generate assembly code
     """
-    def __init__(self) -> None:
+    def __init__(self, optimize_size: bool = False) -> None:
         self.asm = ASM()
+        self.labels = LabelAllocator()
+        self.arrays: dict[str, Constant | Variable] = {}    # Arrays declared with an explicit size
+
+        # -Os: 'main' inlined in '_start', identical constants merged and
+        # shorter encodings. The labels of 'main' follow '_start' so they
+        # stay in its section.
+        self.optimize_size = optimize_size
+        self.constants: dict[str, str] = {}     # Data of a constant ('dq 1') -> its line
+        self.stored_symbols: set[str] | None = set()    # Written by the program, never merged (None when unknown)
+        self.asm.function_sections = not optimize_size
 
-    def codegen(self, program: Program) -> ASM:
+    def codegen(self, program: Program, imports: list[ASTNode] | None = None, entry: bool = True) -> ASM:
         """
         Generate assembly code based on the program's AST tree.
+
+        For a module of a project, 'imports' holds the declarations it uses
+        from other modules: they're referenced as extern symbols and the
+        module's own declarations are exported. Only the entry module has
+        statements and the '_start' entry point.
         """
         self.program = program
 
-        self.asm.add_to_section(
-            section=TEXT_SECTION,
-            code=[
-                "global _start\n",
-                "_start:\n",
-                "\t" + f"call {MAIN_FUNC_LABEL}\n",
-                "\t" + f"mov rax, 60\n",
-                "\t" + f"mov rdi, 0\n",
-                "\t" + f"syscall\n"
-            ]
+        if not entry:
+            for statement in program.statements:
+                if not isinstance(statement, (Constant, Variable, Pointer)):
+                    logger.error("Only the entry module can have statements, modules can only declare constants, variables and pointers.")
+                    sys.exit(1)
+
+        if imports is not None:
+            self.asm.add_to_section(
+                section=TEXT_SECTION,
+                code=[
+                    *[f"extern {mangle_symbol(declaration.identifier.name)}\n" for declaration in imports],
+                    *[
+                        f"global {mangle_symbol(statement.identifier.name)}\n"
+                        for statement in self.walk_statements(statements=program.statements)
+                        if isinstance(statement, (Constant, Variable, Pointer))
+                    ]
+                ]
+            )
+
+        # The constants of the other modules are written by the entry module
+        self.stored_symbols = self.get_stored_symbols(statements=program.statements) if entry else None
+
+        # Vectorized array operations need the CPU features
+        # to be checked before running `main`.
+        self.collect_arrays(statements=(imports or []) + program.statements)
+        uses_simd = any(
+            self.is_array_op(statement=statement) and
+            self.get_array_op_instructions(statement=statement)[0] is not None and
+            int(self.arrays[statement.left.name].size.value) >= 4
+            for statement in self.walk_statements(statements=program.statements)
         )
 
+        if entry and self.optimize_size:
+            self.asm.add_to_section(
+                section=TEXT_SECTION,
+                code="global _start\n"
+            )
+            self.asm.add_to_section(
+                section=TEXT_SECTION,
+                label=MAIN_FUNC_LABEL,
+                code=[
+                    "_start:\n",
+                    ("\t" + f"call {cpu_features_func.identifier.name}\n" if uses_simd else ""),
+                ]
+            )
+        elif entry:
+            self.asm.add_to_section(
+                section=TEXT_SECTION,
+                code=[
+                    "global _start\n",
+                    "_start:\n",
+                    ("\t" + f"call {cpu_features_func.identifier.name}\n" if uses_simd else ""),
+                    "\t" + f"call {MAIN_FUNC_LABEL}\n",
+                    "\t" + f"mov rax, 60\n",
+                    "\t" + f"mov rdi, 0\n",
+                    "\t" + f"syscall\n"
+                ]
+            )
+
+        if uses_simd:
+            self.asm.add_to_section(
+                section=TEXT_SECTION,
+                code=cpu_features_func.asm_code["text"]
+            )
+            self.asm.add_to_section(
+                section=BSS_SECTION,
+                code=cpu_features_func.asm_code["bss"]
+            )
+
         for statement in program.statements:
             self.process_statement(
                 statement=statement,
                 asm_label=MAIN_FUNC_LABEL
             )
 
+        # The inlined 'main' exits after its last statement
+        if entry and self.optimize_size:
+            self.asm.add_to_section(
+                section=TEXT_SECTION,
+                label=self.labels.new(function=MAIN_FUNC_LABEL, kind="exit"),
+                code=[
+                    "\t" + f"mov rax, 60\n",
+                    "\t" + f"mov rdi, 0\n",
+                    "\t" + f"syscall\n"
+                ]
+            )
+
+        if self.optimize_size:
+            self.shorten_encodings()
+
+        count(instructions_emitted=sum(
+            line.startswith("\t") for lines in self.asm.section_text.values() for line in lines
+        ))
+
         return self.asm
 
+    def merge_constant(self, symbol: str, asm_code: list[str] | str) -> bool:
+        """
+        Put the label of a constant on the data of an identical constant
+        declared before, so they share it. Constants the program writes to
+        keep their own data. Returns False when there's none.
+        """
+        if not isinstance(asm_code, str):   # Arrays, kept aligned
+            return False
+
+        if self.stored_symbols is None or symbol in self.stored_symbols:
+            return False
+
+        data = asm_code.split(maxsplit=1)[1]
+
+        if data not in self.constants:
+            self.constants[data] = asm_code
+            return False
+
+        lines = self.asm.section_data[self.asm.no_label_instructions]
+        lines.insert(lines.index(self.constants[data]), f"{symbol}:\n")
+
+        return True
+
+    def shorten_encodings(self) -> None:
+        """
+        Rewrite the instructions that have a shorter encoding: zeroing a
+        register with a 32 bits 'xor' (when the flags are dead for a 'mov'),
+        and loading a symbol's address in the 32 bits register, the
+        executables being static and below 4 GiB.
+        """
+        for lines in self.asm.section_text.values():
+            for index, line in enumerate(lines):
+                match = XOR_ZERO_REGEX.fullmatch(line)
+
+                if match is not None and match.group("register") in REGISTERS_32:
+                    register = REGISTERS_32[match.group("register")]
+                    lines[index] = "\t" + f"xor {register}, {register}\n"
+                    continue
+
+                match = MOV_IMMEDIATE_REGEX.fullmatch(line)
+
+                if match is None or match.group("register") not in REGISTERS_32:
+                    continue
+
+                register, source = REGISTERS_32[match.group("register")], match.group("source")
+
+                if source[0].isdigit():
+                    try:
+                        is_zero = int(source, 0) == 0
+                    except ValueError:
+                        is_zero = False     # nasm only syntax, ex: '0h'
+
+                    if is_zero and self.are_flags_dead(lines=lines, index=index):
+                        lines[index] = "\t" + f"xor {register}, {register}\n"
+                elif source.lower() not in RESERVED_SYMBOLS:
+                    lines[index] = "\t" + f"mov {register}, {source}\n"
+
+    @staticmethod
+    def are_flags_dead(lines: list[str], index: int) -> bool:
+        """
+        Whether the flags are overwritten or not needed anymore before the
+        instructions after 'lines[index]' read them. Unknown past a label or
+        a jump, they're considered live.
+        """
+        for line in lines[index + 1:]:
+            words = line.split(";")[0].split()
+
+            if not words:
+                continue
+
+            if words[0].lower() in FLAGS_KILLING_MNEMONICS:
+                return True
+
+            if words[0].lower() not in FLAGS_NEUTRAL_MNEMONICS:
+                return False
+
+        return False
+
+    def walk_statements(self, statements: list[ASTNode]) -> Iterator[ASTNode]:
+        """
+        Iterate over statements, including the ones nested in if-else blocks.
+        """
+        for statement in statements:
+            yield statement
+
+            if isinstance(statement, IfElse):
+                yield from self.walk_statements(statements=statement.if_block_statements)
+                yield from self.walk_statements(statements=statement.else_block_statements)
+
+    def get_stored_symbols(self, statements: list[ASTNode]) -> set[str]:
+        """
+        The symbols the statements write to: the results of the operations
+        and the errors of the syscalls.
+        """
+        stored_symbols = set()
+
+        for statement in self.walk_statements(statements=statements):
+            if isinstance(statement, (MultiplyOp, AdditionOp, DivideOp, SubtractionOp)):
+                stored_symbols.add(mangle_symbol(statement.assign.identifier.name))
+            elif isinstance(statement, Syscall):
+                stored_symbols.add(mangle_symbol(statement.error.name))
+
+        return stored_symbols
+
+    def collect_arrays(self, statements: list[ASTNode]) -> None:
+        """
+        Collect the int and float arrays declared in the program with a
+        literal size, the others ('x[n]') keep the scalar code.
+        """
+        for statement in self.walk_statements(statements=statements):
+            if (
+                isinstance(statement, (Constant, Variable)) and
+                statement.is_array and
+                isinstance(statement.typ, (IntType, FloatType)) and
+                str(statement.size.value).isdigit()
+            ):
+                self.arrays[statement.identifier.name] = statement
+
+    def is_array_op(self, statement: ASTNode) -> bool:
+        """
+        Is the statement an element-wise operation over same-sized arrays.
+        """
+        if not isinstance(statement, (MultiplyOp, DivideOp, AdditionOp, SubtractionOp)):
+            return False
+
+        operands = [statement.left, statement.right, statement.assign.identifier]
+
+        if not all(isinstance(operand, Identifier) and operand.name in self.arrays for operand in operands):
+            return False
+
+        declarations = [self.arrays[operand.name] for operand in operands]
+
+        return (
+            len({int(declaration.size.value) for declaration in declarations}) == 1 and
+            len({type(declaration.typ) for declaration in declarations}) == 1
+        )
+
+    def get_array_op_instructions(self, statement: ASTNode) -> tuple[str | None, str | None, str]:
+        """
+        Get the (AVX2, SSE2, scalar) instructions of an array operation.
+        """
+        typ = type(self.arrays[statement.left.name].typ)
+
+        return ARRAY_OP_INSTRUCTIONS[typ][type(statement)]
+
+    @profile_phase("codegen")
     def process_statement(self, statement: ASTNode, asm_label: str | None = None) -> str:
         """
         Process a single statement
@@ -110,15 +447,23 @@ class Codegen:
         # Constant declaration
         if isinstance(statement, Constant):
             asm_code = None
-            if isinstance(statement.typ, (CharType, StrType)): # Use 'db'
-                asm_code = "\t" + f"{statement.identifier.name} db {statement.value.value}, 0\n"
+            if statement.identifier.name in self.arrays:   # Aligned for vector loads
+                self.asm.set_section_alignment(section=DATA_SECTION, alignment=ARRAY_ALIGNMENT)
+
+                asm_code = [
+                    "\t" + f"align {ARRAY_ALIGNMENT}\n",
+                    "\t" + f"{mangle_symbol(statement.identifier.name)} times {int(statement.size.value)} dq {statement.value.value}\n"
+                ]
+            elif isinstance(statement.typ, (CharType, StrType)): # Use 'db'
+                asm_code = "\t" + f"{mangle_symbol(statement.identifier.name)} db {statement.value.value}, 0\n"
             else:   # Use 'dq'
-                asm_code = "\t" + f"{statement.identifier.name} dq {statement.value.value}\n"
-            
-            self.asm.add_to_section(
-                section=DATA_SECTION,
-                code=asm_code
-            )
+                asm_code = "\t" + f"{mangle_symbol(statement.identifier.name)} dq {statement.value.value}\n"
+
+            if not self.optimize_size or not self.merge_constant(symbol=mangle_symbol(statement.identifier.name), asm_code=asm_code):
+                self.asm.add_to_section(
+                    section=DATA_SECTION,
+                    code=asm_code
+                )
 
         # Variable declaration
         if isinstance(statement, Variable):
@@ -126,15 +471,23 @@ class Codegen:
             section = None
             asm_code = ""
 
-            if statement.value is None:
+            if statement.value is None and statement.identifier.name in self.arrays:   # Aligned for vector stores
+                section = BSS_SECTION
+                self.asm.set_section_alignment(section=BSS_SECTION, alignment=ARRAY_ALIGNMENT)
+
+                asm_code = [
+                    "\t" + f"alignb {ARRAY_ALIGNMENT}\n",
+                    "\t" + f"{mangle_symbol(statement.identifier.name)} resq {int(statement.size.value)}\n"
+                ]
+            elif statement.value is None:
                 section = BSS_SECTION
-                asm_code = "\t" + f"{statement.identifier.name} resq {statement.size.value}\n"
+                asm_code = "\t" + f"{mangle_symbol(statement.identifier.name)} resq {statement.size.value}\n"
             else:
                 section = DATA_SECTION
                 if isinstance(statement.typ, (CharType, StrType)): # Use 'db'
-                    asm_code = "\t" + f"{statement.identifier.name} db {statement.value.value}, 0xA\n"
+                    asm_code = "\t" + f"{mangle_symbol(statement.identifier.name)} db {statement.value.value}, 0xA\n"
                 else:   # Use 'dq'
-                    asm_code = "\t" + f"{statement.identifier.name} dq {statement.value.value}\n"
+                    asm_code = "\t" + f"{mangle_symbol(statement.identifier.name)} dq {statement.value.value}\n"
             
             self.asm.add_to_section(
                 section=section,
@@ -143,24 +496,29 @@ class Codegen:
 
         # Pointer declaration
         if isinstance(statement, Pointer):
-            label = f"{statement.identifier.name}_ptr_{random_int()+random_int()}"
-            value_identifier = f"{random_ascii_str(len=6)}"
-
             # Declare the pointer and the value
             data_sec_asm_code = ""
 
             if isinstance(statement.typ, (CharType, StrType)): # Use 'db'
-                data_sec_asm_code = "\t" + f"{statement.identifier.name} db {statement.value.value}, 0xA\n"
+                data_sec_asm_code = "\t" + f"{mangle_symbol(statement.identifier.name)} db {statement.value.value}, 0xA\n"
             else:   # Use 'dq'
-                data_sec_asm_code = "\t" + f"{statement.identifier.name} dq {statement.value.value}\n"
+                data_sec_asm_code = "\t" + f"{mangle_symbol(statement.identifier.name)} dq {statement.value.value}\n"
             
             self.asm.add_to_section(
                 section=DATA_SECTION,
                 code=data_sec_asm_code
             )
 
+        # Element-wise array operations
+        if self.is_array_op(statement=statement):
+            self.asm.add_to_section(
+                section=TEXT_SECTION,
+                label=asm_label,
+                code=self.process_array_op(statement=statement, asm_label=asm_label)
+            )
+
         # Operations
-        if isinstance(statement, (MultiplyOp, DivideOp, AdditionOp, SubtractionOp)):
+        elif isinstance(statement, (MultiplyOp, DivideOp, AdditionOp, SubtractionOp)):
             asm_code = list()
 
             if isinstance(statement, MultiplyOp):
@@ -169,12 +527,12 @@ class Codegen:
                 right = None
                 
                 if isinstance(statement.left, Identifier):
-                    left = f"[{statement.left.name}]"
+                    left = f"[{mangle_symbol(statement.left.name)}]"
                 else:
                     left = statement.left.value
                 
                 if isinstance(statement.right, Identifier):
-                    right = f"[{statement.right.name}]"
+                    right = f"[{mangle_symbol(statement.right.name)}]"
                 else:
                     right = statement.right.value
                 
@@ -193,7 +551,7 @@ class Codegen:
 
                 # Store the result in the result identifier
                 asm_code.append(
-                    "\t" + f"mov [{statement.assign.identifier.name}], {regs[0]}\n"
+                    "\t" + f"mov [{mangle_symbol(statement.assign.identifier.name)}], {regs[0]}\n"
                 )
             elif isinstance(statement, DivideOp):
                 regs = ["rax", "rdx", "rcx"]
@@ -201,14 +559,14 @@ class Codegen:
                 right = None
                 
                 if isinstance(statement.left, Identifier):
-                    left = f"[{statement.left.name}]"
+                    left = f"[{mangle_symbol(statement.left.name)}]"
                 else:
                     left = statement.left.value
                 
                 if isinstance(statement.right, Identifier):
-                    right = f"[{statement.right.name}]"
+                    right = f"[{mangle_symbol(statement.right.name)}]"
                 else:
-                    left = statement.right.value
+                    right = statement.right.value
                 
                 asm_code.append(
                     "\t" + f"mov {regs[0]}, {left}\n"
@@ -230,7 +588,7 @@ class Codegen:
 
                 # Store the result in the result identifier
                 asm_code.append(
-                    "\t" + f"mov [{statement.assign.identifier.name}], {regs[0]}\n"
+                    "\t" + f"mov [{mangle_symbol(statement.assign.identifier.name)}], {regs[0]}\n"
                 )
             elif isinstance(statement, AdditionOp):
                 regs = ["rax"]
@@ -238,14 +596,14 @@ class Codegen:
                 right = None
 
                 if isinstance(statement.left, Identifier):
-                    left = f"[{statement.left.name}]"
+                    left = f"[{mangle_symbol(statement.left.name)}]"
                 else:
                     left = statement.left.value
                 
                 if isinstance(statement.right, Identifier):
-                    right = f"[{statement.right.name}]"
+                    right = f"[{mangle_symbol(statement.right.name)}]"
                 else:
-                    left = statement.right.value
+                    right = statement.right.value
                 
                 asm_code.append(
                     "\t" + f"mov {regs[0]}, {left}\n"
@@ -258,7 +616,7 @@ class Codegen:
 
                 # Store the result in the result identifier
                 asm_code.append(
-                    "\t" + f"mov [{statement.assign.identifier.name}], {regs[0]}\n"
+                    "\t" + f"mov [{mangle_symbol(statement.assign.identifier.name)}], {regs[0]}\n"
                 )
             elif isinstance(statement, SubtractionOp):
                 regs = ["rbx"]
@@ -266,14 +624,14 @@ class Codegen:
                 right = None
 
                 if isinstance(statement.left, Identifier):
-                    left = f"[{statement.left.name}]"
+                    left = f"[{mangle_symbol(statement.left.name)}]"
                 else:
                     left = statement.left.value
                 
                 if isinstance(statement.right, Identifier):
-                    right = f"[{statement.right.name}]"
+                    right = f"[{mangle_symbol(statement.right.name)}]"
                 else:
-                    left = statement.right.value
+                    right = statement.right.value
                 
                 asm_code.append(
                     "\t" + f"mov {regs[0]}, {left}\n",
@@ -286,7 +644,7 @@ class Codegen:
 
                 # Store the result in the result identifier
                 asm_code.append(
-                    "\t" + f"mov [{statement.assign.identifier.name}], {regs[0]}\n"
+                    "\t" + f"mov [{mangle_symbol(statement.assign.identifier.name)}], {regs[0]}\n"
                 )
 
             # For now we are adding every instruction into the main function
@@ -299,10 +657,9 @@ class Codegen:
 
         # syscall
         if isinstance(statement, Syscall):
-            label = "syscall_" + str(random.choice(range(999, 9999)))
             syscall_number = statement.syscall_number
             args = statement.args
-            error_identifier = statement.error.name
+            error_identifier = mangle_symbol(statement.error.name)
 
             syscall_regs_list = [
                 "rdi",
@@ -318,7 +675,7 @@ class Codegen:
                 section=TEXT_SECTION,
                 label=asm_label,
                 code=[
-                    ("\t" + f"mov rax, {syscall_number}\n" if not isinstance(syscall_number, Identifier) else "\t" + f"mov rax, [{syscall_number.name}]\n"),
+                    ("\t" + f"mov rax, {syscall_number}\n" if not isinstance(syscall_number, Identifier) else "\t" + f"mov rax, [{mangle_symbol(syscall_number.name)}]\n"),
                 ]
             )
             
@@ -332,7 +689,7 @@ class Codegen:
                         section=TEXT_SECTION,
                         label=asm_label,
                         code=[
-                            "\t" + f"mov {syscall_regs_list[i]}, [{arg.identifier.name}]\n"
+                            "\t" + f"mov {syscall_regs_list[i]}, [{mangle_symbol(arg.identifier.name)}]\n"
                         ],
                         
                     )
@@ -341,7 +698,7 @@ class Codegen:
                         section=TEXT_SECTION,
                         label=asm_label,
                         code=[
-                            "\t" + f"mov {syscall_regs_list[i]}, [{arg}]\n"
+                            "\t" + f"mov {syscall_regs_list[i]}, [{mangle_symbol(arg)}]\n"
                         ],
                         
                     )
@@ -350,7 +707,7 @@ class Codegen:
                         section=TEXT_SECTION,
                         label=asm_label,
                         code=[
-                            "\t" + f"mov {syscall_regs_list[i]}, {arg}\n"
+                            "\t" + f"mov {syscall_regs_list[i]}, {mangle_symbol(arg) if arg in self.program.ptr_identifiers else arg}\n"
                         ],
                         
                     )
@@ -377,119 +734,565 @@ class Codegen:
         
         # if-else condition
         if isinstance(statement, IfElse):
-            comparision_asm_instruction_map = {
-                EqualSymbol: "je",
-                NotEqualSymbol: "jne",
-                GreaterThanSymbol: "jg",
-                GreaterThanOrEqualToSymbol: "jge",
-                SmallerThanSymbol: "jl",
-                SmallerThanOrEqualToSymbol: "jle",
-            }
-            comparision_opposite_asm_instructions_map = {
-                "je": "jne",
-                "jne": "je",
-                "jg": "jle",
-                "jge": "jl",
-                "jl": "jge",
-                "jle": "jg"
-            }
-
-            # Compare
-            left_element = None     
-            right_element = None
-            compare_label = "compare" + random_ascii_str(len=8)
-            asm_code = []
-            #  Move the left or right element into a registery in case its a literal
-            if isinstance(statement.condition.left, Identifier) and isinstance(statement.condition.right, Identifier):
-                # Move the left element into the eax regitery
-                left_element = "eax"
-                asm_code.append(
-                    "\t" + f"mov {left_element}, [{statement.condition.left.name}]\n"
-                )
-                asm_code.append(
-                    "\t" + f"cmp {left_element}, [{statement.condition.right.name}]\n"
-                )
-            elif isinstance(statement.condition.left, Identifier) and isinstance(statement.condition.right, (NumberLiteral, FloatLiteral, StringLiteral, CharLiteral)):
-                right_element = "eax"
-                asm_code.append(
-                    "\t" + f"mov {right_element}, {statement.condition.right.value}\n"
-                )
-                asm_code.append(
-                    "\t" + f"cmp [{statement.condition.left.name}], {right_element}\n"
-                )
-            elif isinstance(statement.condition.left,(NumberLiteral, FloatLiteral, StringLiteral, CharLiteral)) and isinstance(statement.condition.left, Identifier):
-                left_element = "eax"
-                asm_code.append(
-                    "\t" + f"mov {left_element}, {statement.condition.left.value}\n"
-                )
-                asm_code.append(
-                    "\t" + f"cmp {left_element}, [{statement.condition.right.name}]\n"
-                )
-            else:
-                left_element = "eax"
-                asm_code.append(
-                    "\t" + f"mov {left_element}, {statement.condition.left.value}\n"
-                )
-                asm_code.append(
-                    "\t" + f"cmp {left_element}, [{statement.condition.right.name}]\n"
-                )
-
             self.asm.add_to_section(
                 section=TEXT_SECTION,
                 label=asm_label,
-                code=asm_code
+                code=self.process_if_else(statement=statement, asm_label=asm_label)
+            )
+
+    def process_if_else(self, statement: IfElse, asm_label: str | None = None) -> list[str]:
+        """
+        Lower an if-else condition.
+
+        The if block falls through right after the compare and the else
+        block is placed after it, so only a not-taken branch sits on the
+        likely path. Blocks that only assign a value to the same identifier
+        are lowered to 'cmov'/'setcc' without any branch.
+        """
+        # Chains of equality tests on the same identifier
+        switch = self.get_switch_cases(statement=statement)
+        if switch is not None:
+            identifier, cases, default_statements = switch
+
+            return self.process_switch(
+                identifier=identifier,
+                cases=cases,
+                default_statements=default_statements,
+                asm_label=asm_label
             )
-            # If, Else block statements label
-            if_block_label = "if_block_" + str(random_int())
-            else_block_label = "else_block_" + str(random_int())
 
-            for if_block_statement in statement.if_block_statements:
+        asm_code, condition_code = self.process_compare(compare=statement.condition)
+
+        # Both sides of the condition are literals, keep only the taken block
+        if isinstance(condition_code, bool):
+            taken_block_statements = statement.if_block_statements if condition_code else statement.else_block_statements
+
+            for taken_block_statement in taken_block_statements:
                 self.process_statement(
-                    statement=if_block_statement,
-                    asm_label=if_block_label
-                )
-                # Add a return
-                self.asm.add_to_section(
-                    section=TEXT_SECTION,
-                    label=if_block_label,
-                    code=[
-                        "\t" + f"ret\n"
-                    ]
+                    statement=taken_block_statement,
+                    asm_label=asm_label
                 )
-            
-            for else_block_statement in statement.else_block_statements:
+
+            return []
+
+        branchless_asm_code = self.process_branchless_if_else(
+            statement=statement,
+            compare_asm_code=asm_code,
+            condition_code=condition_code
+        )
+        if branchless_asm_code is not None:
+            return branchless_asm_code
+
+        if_block_statements = statement.if_block_statements
+        else_block_statements = statement.else_block_statements
+
+        # Let the non-empty block fall through
+        if len(if_block_statements) == 0 and len(else_block_statements) != 0:
+            if_block_statements, else_block_statements = else_block_statements, if_block_statements
+            condition_code = OPPOSITE_CONDITION_CODES[condition_code]
+
+        if_label = self.labels.new(function=asm_label, kind="if")
+        else_block_label = f"{if_label}.else"
+        end_if_label = f"{if_label}.end"
+
+        asm_code.append(
+            "\t" + f"j{OPPOSITE_CONDITION_CODES[condition_code]} {else_block_label if else_block_statements else end_if_label}\n"
+        )
+
+        # The blocks statements are emitted inline, after the jump
+        self.asm.add_to_section(
+            section=TEXT_SECTION,
+            label=asm_label,
+            code=asm_code
+        )
+
+        for if_block_statement in if_block_statements:
+            self.process_statement(
+                statement=if_block_statement,
+                asm_label=asm_label
+            )
+
+        if else_block_statements:
+            self.asm.add_to_section(
+                section=TEXT_SECTION,
+                label=asm_label,
+                code=[
+                    "\t" + f"jmp {end_if_label}\n",
+                    f"{else_block_label}:\n"
+                ]
+            )
+
+            for else_block_statement in else_block_statements:
                 self.process_statement(
                     statement=else_block_statement,
-                    asm_label=else_block_label
+                    asm_label=asm_label
                 )
 
-                # Add a return
-                self.asm.add_to_section(
-                    section=TEXT_SECTION,
-                    label=else_block_label,
-                    code=[
-                        "\t" + f"ret\n"
-                    ]
+        return [
+            f"{end_if_label}:\n"
+        ]
+
+    def get_switch_cases(self, statement: IfElse) -> tuple[Identifier, list[tuple[int, list[ASTNode]]], list[ASTNode]] | None:
+        """
+        Get the cases of an if/else-if chain that compares the same identifier
+        for equality against integer literals, as (identifier, cases, default
+        statements) where cases are (value, statements) in the chain's order.
+
+        Returns None when the chain is too short or isn't a switch.
+        """
+        identifier = None
+        cases = list()
+        seen_values = set()
+
+        while True:
+            compare = statement.condition
+
+            if not isinstance(compare.symbol, EqualSymbol):
+                return None
+
+            if isinstance(compare.left, Identifier) and self.get_immediate(element=compare.right) is not None:
+                case_identifier, value = compare.left, self.get_immediate(element=compare.right)
+            elif isinstance(compare.right, Identifier) and self.get_immediate(element=compare.left) is not None:
+                case_identifier, value = compare.right, self.get_immediate(element=compare.left)
+            else:
+                return None
+
+            if identifier is None:
+                identifier = case_identifier
+            elif identifier.name != case_identifier.name:
+                return None
+
+            # Only the first test of a value can be reached
+            if value not in seen_values:
+                seen_values.add(value)
+                cases.append((value, statement.if_block_statements))
+
+            else_block_statements = statement.else_block_statements
+
+            if len(else_block_statements) == 1 and isinstance(else_block_statements[0], IfElse):
+                statement = else_block_statements[0]
+                continue
+
+            break
+
+        if len(cases) < SWITCH_MIN_CASES:
+            return None
+
+        return identifier, cases, else_block_statements
+
+    def process_switch(self, identifier: Identifier, cases: list[tuple[int, list[ASTNode]]], default_statements: list[ASTNode], asm_label: str | None = None) -> list[str]:
+        """
+        Lower a chain of equality tests on the same identifier.
+
+        Dense chains dispatch with a bounds check and an indirect jump through
+        a jump table in '.rodata', sparse chains with a binary search tree of
+        compares.
+        """
+        switch_label = self.labels.new(function=asm_label, kind="switch")
+        default_label = f"{switch_label}.default"
+        end_switch_label = f"{switch_label}.end"
+
+        case_labels = {value: f"{switch_label}.case_{i}" for i, (value, _) in enumerate(cases)}
+        values = sorted(case_labels)
+
+        asm_code = [
+            "\t" + f"mov rax, [{mangle_symbol(identifier.name)}]\n"
+        ]
+
+        table_size = values[-1] - values[0] + 1
+
+        if len(values) / table_size >= SWITCH_JUMP_TABLE_DENSITY and IMM32_MIN <= values[0] <= IMM32_MAX:
+            jump_table_label = f"{switch_label}.jump_table"
+
+            if values[0] != 0:
+                asm_code.append(
+                    "\t" + f"sub rax, {values[0]}\n"
                 )
 
-            # Jump instruction
-            jump_instruction = comparision_asm_instruction_map[type(statement.condition.symbol)]
-            opposite_jump_instruction = comparision_opposite_asm_instructions_map[jump_instruction]
+            # Values below the first case wrap around as unsigned
+            asm_code += [
+                "\t" + f"cmp rax, {table_size - 1}\n",
+                "\t" + f"ja {default_label}\n",
+                "\t" + f"jmp [{jump_table_label} + rax*8]\n",
+            ]
 
             self.asm.add_to_section(
-                section=TEXT_SECTION,
-                label=asm_label,
+                section=RODATA_SECTION,
+                label=jump_table_label,
                 code=[
-                    "\t" + f"{jump_instruction} {if_block_label}\n"
+                    "\t" + f"dq {case_labels.get(value, default_label)}\n"
+                    for value in range(values[0], values[-1] + 1)
                 ]
             )
+        else:
+            asm_code += self.get_binary_search_asm(
+                values=values,
+                case_labels=case_labels,
+                default_label=default_label
+            )
+
+        self.asm.add_to_section(
+            section=TEXT_SECTION,
+            label=asm_label,
+            code=asm_code
+        )
+
+        # Cases blocks
+        for value, statements in cases:
             self.asm.add_to_section(
                 section=TEXT_SECTION,
                 label=asm_label,
-                code=[
-                    "\t" + f"{opposite_jump_instruction} {else_block_label}\n"
-                ]
+                code=f"{case_labels[value]}:\n"
+            )
+
+            for case_statement in statements:
+                self.process_statement(
+                    statement=case_statement,
+                    asm_label=asm_label
+                )
+
+            self.asm.add_to_section(
+                section=TEXT_SECTION,
+                label=asm_label,
+                code="\t" + f"jmp {end_switch_label}\n"
+            )
+
+        # Default block, falls through to the end of the switch
+        self.asm.add_to_section(
+            section=TEXT_SECTION,
+            label=asm_label,
+            code=f"{default_label}:\n"
+        )
+
+        for default_statement in default_statements:
+            self.process_statement(
+                statement=default_statement,
+                asm_label=asm_label
+            )
+
+        return [
+            f"{end_switch_label}:\n"
+        ]
+
+    def get_binary_search_asm(self, values: list[int], case_labels: dict[int, str], default_label: str) -> list[str]:
+        """
+        Generate a binary search tree of compares over the sorted case values,
+        the value being searched is in 'rax'.
+        """
+        asm_code = list()
+
+        def compare(value: int) -> str:
+            if IMM32_MIN <= value <= IMM32_MAX:
+                return "\t" + f"cmp rax, {value}\n"
+
+            asm_code.append(
+                "\t" + f"mov rdx, {value}\n"
+            )
+            return "\t" + "cmp rax, rdx\n"
+
+        if len(values) <= SWITCH_LINEAR_SEARCH_CASES:
+            for value in values:
+                asm_code.append(compare(value))
+                asm_code.append(
+                    "\t" + f"je {case_labels[value]}\n"
+                )
+
+            asm_code.append(
+                "\t" + f"jmp {default_label}\n"
+            )
+
+            return asm_code
+
+        middle = len(values) // 2
+        middle_value = values[middle]
+        greater_label = f"{case_labels[middle_value]}.greater"
+
+        asm_code.append(compare(middle_value))
+        asm_code += [
+            "\t" + f"je {case_labels[middle_value]}\n",
+            "\t" + f"jg {greater_label}\n",
+        ]
+
+        asm_code += self.get_binary_search_asm(
+            values=values[:middle],
+            case_labels=case_labels,
+            default_label=default_label
+        )
+        asm_code.append(
+            f"{greater_label}:\n"
+        )
+        asm_code += self.get_binary_search_asm(
+            values=values[middle + 1:],
+            case_labels=case_labels,
+            default_label=default_label
+        )
+
+        return asm_code
+
+    def process_compare(self, compare: Compare) -> tuple[list[str], str | bool]:
+        """
+        Generate the 'cmp' instruction of a comparison, using memory and
+        immediate operands directly when possible.
+
+        Returns the assembly code and the condition code (e, ne, g, ...) that
+        is true after the 'cmp', or the result itself when both sides are
+        literals.
+        """
+        asm_code = []
+        condition_code = CONDITION_CODES[type(compare.symbol)]
+
+        left = compare.left
+        right = compare.right
+
+        left_immediate = self.get_immediate(element=left)
+        right_immediate = self.get_immediate(element=right)
+
+        # Constant condition
+        if left_immediate is not None and right_immediate is not None:
+            return asm_code, CONDITION_CODES_EVALUATION[condition_code](left_immediate, right_immediate)
+
+        # The memory operand must be on the left side of 'cmp'
+        if isinstance(right, Identifier) and not isinstance(left, Identifier):
+            left, right = right, left
+            left_immediate, right_immediate = right_immediate, left_immediate
+            condition_code = SWAPPED_CONDITION_CODES[condition_code]
+
+        if isinstance(left, Identifier) and isinstance(right, Identifier):
+            asm_code.append(
+                "\t" + f"mov rcx, [{mangle_symbol(left.name)}]\n"
+            )
+            asm_code.append(
+                "\t" + f"cmp rcx, [{mangle_symbol(right.name)}]\n"
+            )
+        elif isinstance(left, Identifier) and right_immediate is not None and IMM32_MIN <= right_immediate <= IMM32_MAX:
+            asm_code.append(
+                "\t" + f"cmp qword [{mangle_symbol(left.name)}], {right_immediate}\n"
             )
+        elif isinstance(left, Identifier):
+            asm_code.append(
+                "\t" + f"mov rcx, {right_immediate if right_immediate is not None else right.value}\n"
+            )
+            asm_code.append(
+                "\t" + f"cmp [{mangle_symbol(left.name)}], rcx\n"
+            )
+        else:
+            asm_code.append(
+                "\t" + f"mov rcx, {left.value}\n"
+            )
+            asm_code.append(
+                "\t" + f"cmp rcx, {right.value}\n"
+            )
+
+        return asm_code, condition_code
+
+    def process_branchless_if_else(self, statement: IfElse, compare_asm_code: list[str], condition_code: str) -> list[str] | None:
+        """
+        Lower an if-else condition whose blocks only assign a value to the
+        same identifier to 'setcc' (for 1/0 values) or 'cmov'.
+
+        Returns None when the blocks can't be lowered without branches.
+        """
+        if_block_statements = statement.if_block_statements
+        else_block_statements = statement.else_block_statements
+
+        if len(if_block_statements) != 1 or len(else_block_statements) > 1:
+            return None
+
+        if_op = if_block_statements[0]
+        else_op = else_block_statements[0] if else_block_statements else None
+
+        # Division can fault, so it is only computed when its block runs
+        branchless_ops = (MultiplyOp, AdditionOp, SubtractionOp)
+
+        if not isinstance(if_op, branchless_ops) or self.is_array_op(statement=if_op):
+            return None
+
+        if else_op is not None and (not isinstance(else_op, branchless_ops) or self.is_array_op(statement=else_op)):
+            return None
+
+        if else_op is not None and else_op.assign.identifier.name != if_op.assign.identifier.name:
+            return None
+
+        result_identifier = mangle_symbol(if_op.assign.identifier.name)
+
+        asm_code = list()
+
+        if_value = self.get_op_immediate(op=if_op)
+        else_value = self.get_op_immediate(op=else_op) if else_op is not None else None
+
+        # The result is the value of the condition itself
+        if else_op is not None and (if_value, else_value) in [(1, 0), (0, 1)]:
+            setcc_condition_code = condition_code if if_value == 1 else OPPOSITE_CONDITION_CODES[condition_code]
+
+            asm_code += compare_asm_code
+            asm_code += [
+                "\t" + f"set{setcc_condition_code} al\n",
+                "\t" + "movzx eax, al\n",
+                "\t" + f"mov [{result_identifier}], rax\n"
+            ]
+
+            return asm_code
+
+        # Both values are computed before the 'cmp', since the
+        # operations overwrite the flags.
+        if else_op is not None:
+            asm_code += self.get_op_value_asm(op=else_op, register="rax")
+        else:
+            asm_code.append(
+                "\t" + f"mov rax, [{result_identifier}]\n"
+            )
+
+        asm_code += self.get_op_value_asm(op=if_op, register="rdx")
+        asm_code += compare_asm_code
+        asm_code += [
+            "\t" + f"cmov{condition_code} rax, rdx\n",
+            "\t" + f"mov [{result_identifier}], rax\n"
+        ]
+
+        return asm_code
+
+    def get_op_value_asm(self, op: ASTNode, register: str) -> list[str]:
+        """
+        Generate the assembly computing an operation's value into a register.
+        """
+        op_instruction = {
+            MultiplyOp: "imul",
+            AdditionOp: "add",
+            SubtractionOp: "sub",
+        }[type(op)]
+
+        immediate = self.get_op_immediate(op=op)
+        if immediate is not None:
+            return [
+                "\t" + f"mov {register}, {immediate}\n"
+            ]
+
+        left = f"[{mangle_symbol(op.left.name)}]" if isinstance(op.left, Identifier) else op.left.value
+        right = f"[{mangle_symbol(op.right.name)}]" if isinstance(op.right, Identifier) else op.right.value
+
+        return [
+            "\t" + f"mov {register}, {left}\n",
+            "\t" + f"{op_instruction} {register}, {right}\n"
+        ]
+
+    def get_op_immediate(self, op: ASTNode) -> int | None:
+        """
+        Get the value of an operation computed at compile time, when
+        both of its operands are integer literals.
+        """
+        left = self.get_immediate(element=op.left)
+        right = self.get_immediate(element=op.right)
+
+        if left is None or right is None:
+            return None
+
+        if isinstance(op, MultiplyOp):
+            return left * right
+        elif isinstance(op, AdditionOp):
+            return left + right
+        elif isinstance(op, SubtractionOp):
+            return left - right
+
+        return None
+
+    def get_immediate(self, element: ASTNode) -> int | None:
+        """
+        Get the value of an integer literal, or None.
+        """
+        if not isinstance(element, NumberLiteral):
+            return None
+
+        try:
+            return int(element.value)
+        except (TypeError, ValueError):
+            return None
+
+    def process_array_op(self, statement: ASTNode, asm_label: str | None = None) -> list[str]:
+        """
+        Lower an element-wise array operation to an AVX2 loop, or an SSE2
+        loop when AVX2 isn't available, followed by a scalar remainder loop.
+        """
+        asm_code = list()
+        label = self.labels.new(function=asm_label, kind="array_op")
+
+        typ = type(self.arrays[statement.left.name].typ)
+        size = int(self.arrays[statement.left.name].size.value)
+        avx2_instruction, sse2_instruction, scalar_instruction = self.get_array_op_instructions(statement=statement)
+        avx2_mov, sse2_mov = ARRAY_MOV_INSTRUCTIONS[typ]
+
+        left = f"{mangle_symbol(statement.left.name)} + rcx*{ARRAY_ELEMENT_SIZE}"
+        right = f"{mangle_symbol(statement.right.name)} + rcx*{ARRAY_ELEMENT_SIZE}"
+        result = f"{mangle_symbol(statement.assign.identifier.name)} + rcx*{ARRAY_ELEMENT_SIZE}"
+
+        asm_code.append(
+            "\t" + "xor rcx, rcx\n"
+        )
+
+        # Vector loops, the elements count is known at compile time
+        # so only the loops that run at least once are emitted.
+        avx2_count = size - size % 4
+        sse2_count = size - size % 2
+
+        if avx2_instruction is not None and avx2_count > 0:
+            asm_code += [
+                "\t" + f"cmp byte [{CPU_HAS_AVX2_LABEL}], 0\n",
+                "\t" + f"je {label}.sse2\n",
+                f"{label}.avx2:\n",
+                "\t" + f"{avx2_mov} ymm0, [{left}]\n",
+                "\t" + f"{avx2_instruction} ymm0, ymm0, [{right}]\n",
+                "\t" + f"{avx2_mov} [{result}], ymm0\n",
+                "\t" + "add rcx, 4\n",
+                "\t" + f"cmp rcx, {avx2_count}\n",
+                "\t" + f"jb {label}.avx2\n",
+                "\t" + "vzeroupper\n",
+                "\t" + f"jmp {label}.scalar\n",
+            ]
+
+        if sse2_instruction is not None and sse2_count > 0:
+            asm_code += [
+                f"{label}.sse2:\n",
+                "\t" + f"{sse2_mov} xmm0, [{left}]\n",
+                "\t" + f"{sse2_instruction} xmm0, [{right}]\n",
+                "\t" + f"{sse2_mov} [{result}], xmm0\n",
+                "\t" + "add rcx, 2\n",
+                "\t" + f"cmp rcx, {sse2_count}\n",
+                "\t" + f"jb {label}.sse2\n",
+            ]
+
+        # Scalar remainder loop
+        asm_code += [
+            f"{label}.scalar:\n",
+            "\t" + f"cmp rcx, {size}\n",
+            "\t" + f"jae {label}.done\n",
+        ]
+
+        if typ is FloatType:
+            asm_code += [
+                "\t" + f"movsd xmm0, [{left}]\n",
+                "\t" + f"{scalar_instruction} xmm0, [{right}]\n",
+                "\t" + f"movsd [{result}], xmm0\n",
+            ]
+        elif scalar_instruction == "idiv":
+            asm_code += [
+                "\t" + f"mov rax, [{left}]\n",
+                "\t" + "cqo\n",
+                "\t" + f"idiv qword [{right}]\n",
+                "\t" + f"mov [{result}], rax\n",
+            ]
+        else:
+            asm_code += [
+                "\t" + f"mov rax, [{left}]\n",
+                "\t" + f"{scalar_instruction} rax, [{right}]\n",
+                "\t" + f"mov [{result}], rax\n",
+            ]
+
+        asm_code += [
+            "\t" + "inc rcx\n",
+            "\t" + f"jmp {label}.scalar\n",
+            f"{label}.done:\n",
+        ]
+
+        return asm_code
 
     def get_size_of_obj(self, obj, seen=None) -> int:
         """
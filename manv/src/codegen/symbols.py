@@ -0,0 +1,83 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "mangle_symbol",
+    "LabelAllocator",
+    "RESERVED_SYMBOLS"
+]
+
+# Names that can't be used as-is for a symbol, because NASM reads them as
+# a register or a keyword, or because the generated code already uses them.
+RESERVED_SYMBOLS = {
+    # Registers
+    *[f"r{reg}{suffix}" for reg in range(8, 16) for suffix in ("", "d", "w", "b")],
+    "rax", "rbx", "rcx", "rdx", "rsi", "rdi", "rbp", "rsp", "rip",
+    "eax", "ebx", "ecx", "edx", "esi", "edi", "ebp", "esp",
+    "ax", "bx", "cx", "dx", "si", "di", "bp", "sp",
+    "al", "bl", "cl", "dl", "ah", "bh", "ch", "dh", "sil", "dil", "bpl", "spl",
+    *[f"{kind}mm{reg}" for kind in ("x", "y", "z") for reg in range(32)],
+
+    # Size and data keywords
+    "byte", "word", "dword", "qword", "tword", "oword", "yword", "zword",
+    "db", "dw", "dd", "dq", "dt", "do", "dy", "dz",
+    "resb", "resw", "resd", "resq", "rest", "reso", "resy", "resz",
+    "times", "equ", "incbin", "align", "alignb", "section", "segment",
+    "global", "extern", "common", "default", "bits", "rel", "abs",
+    "strict", "nosplit", "seg", "wrt",
+
+    # Labels used by the generated code
+    "_start", "main",
+}
+
+# Separator of the generated labels, it can't appear in a ManV
+# identifier so they never collide with the program's symbols.
+LABEL_SEPARATOR = "."
+
+def mangle_symbol(name: str) -> str:
+    """
+    Map a ManV identifier to its assembly symbol.
+
+    Identifiers are kept as-is unless they are reserved, in which case
+    a '$' (not valid in a ManV identifier) is appended.
+    """
+    if name.lower() in RESERVED_SYMBOLS:
+        return f"{name}$"
+
+    return name
+
+class LabelAllocator:
+    """
+    Deterministic labels for the generated code, numbered with a
+    counter per function: '<function>.<kind>.<n>'
+    """
+    def __init__(self) -> None:
+        self.counters: dict[str, int] = {}
+
+    def new(self, function: str, kind: str) -> str:
+        """
+        Allocate a new label of a kind (if, switch ...) inside a function.
+        """
+        n = self.counters.get(function, 0)
+        self.counters[function] = n + 1
+
+        return LABEL_SEPARATOR.join([function, kind, str(n)])
@@ -25,13 +25,19 @@ __all__ = [
 ]
 
 import sys
+import logging
 
-from rich import print
 from typing import Generator, List, Dict
 
 # Models
 from manv.models.line_model import LineModel
 
+# Logs
+from manv.log import logger, count
+
+# Profiler phases
+from manv.profiler import profile_phase
+
 # Tokens
 from manv.src.parser.tokens import *
 
@@ -62,6 +68,14 @@ class Tokens:
     def __init__(self, file_path: str | None = None) -> None:
         self.file_path = file_path
 
+        # Each instance gets its own lists, otherwise tokens and identifiers
+        # would be shared between every program lexed in the same process.
+        self.tokens = list()
+        self.const_identifiers = list()
+        self.var_identifiers = list()
+        self.ptr_identifiers = list()
+        self.functions_identifiers = list()
+
 class Lexer:
     """
     Lexer for manv language.
@@ -69,16 +83,24 @@ class Lexer:
     def __init__(self) -> None:
         self.global_identifiers = list() # Identifiers for variables, constants, functions that are globally available.
 
-    def generate_tokens(self, data: Generator, file_path: str | None = None) -> Tokens:
+    @profile_phase("lexing")
+    def generate_tokens(self, data: Generator, file_path: str | None = None, imports: Tokens | None = None) -> Tokens:
         """
-        Generates tokens from a program source code.
+        Generates tokens from a program source code, 'imports' holds the
+        identifiers declared in other modules.
         """
         tokens = Tokens(
             file_path=file_path
         )
+
+        if imports is not None:
+            tokens.const_identifiers.extend(imports.const_identifiers)
+            tokens.var_identifiers.extend(imports.var_identifiers)
+            tokens.ptr_identifiers.extend(imports.ptr_identifiers)
+            tokens.functions_identifiers.extend(imports.functions_identifiers)
         
         last_line: LineModel | None = None
-
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         # if-else condition blocks
         is_if_condition_block = False
@@ -103,10 +125,8 @@ class Lexer:
                 i  for i in current_line.content.split(" ") if i != ""
             ]
 
-            # print(
-            #     f"[bold blue][DEBUG][reset]: Current line '{current_line.line_number}'\n"
-            #     f"\t   {current_line.line_number!r} | {current_line.content!r}\n"
-            # )
+            if debug:
+                logger.debug("Current line '%d': %r", current_line.line_number, current_line.content)
             
             token = Token(
                 line=current_line,
@@ -163,9 +183,7 @@ class Lexer:
                         if char == "{":
                             continue
 
-                        print(
-                            f"[bold red][ERROR][reset]: Expected a semicolon at end of line '{token.line.line_number}'"
-                        )
+                        logger.error(f"Expected a semicolon at end of line '{token.line.line_number}'")
                         sys.exit(1)
                 
                 # End-Of-Line
@@ -179,9 +197,8 @@ class Lexer:
                             if x == "/" and text[_+1] == "/":
                                 is_eof = True
                 if is_eof:
-                    print(
-                        f"[bold blue][DEBUG][reset]: Reached EOF of line '{current_line.line_number}'."
-                    )
+                    if debug:
+                        logger.debug("Reached EOF of line '%d'.", current_line.line_number)
                     
                     token.tokens.append({TOKENS_SYNTAX_MAP[SYMBOL_TOKEN]: SYMBOLS[SEMICOLON_SYMBOL]})
                     token_construct = ""
@@ -315,8 +332,8 @@ class Lexer:
                     token_construct = ""
                 
                 # Keyword: MUL_KEYWORD, ADD_KEYWORD, SUB_KEYWORD, DIV_KEYWORD
-                if token_construct in ["mul", "add", "sub", "div"]:
-                    token.tokens.append({TOKENS_SYNTAX_MAP[KEYWORD_TOKEN] : KEYWORDS_SYNTAX_MAP[MUL_KEYWORD]})
+                if token_construct in OP_KEYWORDS_MAP:
+                    token.tokens.append({TOKENS_SYNTAX_MAP[KEYWORD_TOKEN] : KEYWORDS_SYNTAX_MAP[OP_KEYWORDS_MAP[token_construct]]})
                     
                     parsed_op_elements, skip_indexes_list = self.parse_op_elements(
                         token_construct=token_construct,
@@ -388,7 +405,7 @@ class Lexer:
                 # Keyword: ELSE_KEYWORD
                 if token_construct == "else":
                     if not is_last_block_if_block:
-                        print(f"[bold red][ERROR][reset]: Can't use else-condition without an if-condition in line '{token.line.line_number}'.")
+                        logger.error(f"Can't use else-condition without an if-condition in line '{token.line.line_number}'.")
                         sys.exit(1)
                     
                     token.tokens.append(
@@ -403,6 +420,11 @@ class Lexer:
                     is_last_block_if_block = False
                     if_condition_block_count -= 1
                 
+                # Identifiers are only matched on a word boundary, otherwise
+                # a constant named 'a' would match the start of 'add'.
+                if next_char is not None and (next_char.isalnum() or next_char == "_"):
+                    continue
+
                 # Constant identifier
                 if token_construct in tokens.const_identifiers:
                     token.tokens.append(
@@ -446,7 +468,9 @@ class Lexer:
 
             last_line = current_line
             last_char = char
-            
+
+        count(lines_lexed=tokens.lines_count, tokens_made=sum(len(token.tokens) for token in tokens.tokens))
+
         return tokens
 
     def strip_line_from_comments(self, line_content: str) -> str:
@@ -566,7 +590,7 @@ class Lexer:
         Is the line context a mathematical operation (mul, div, sub, add)
         """
         first_token = token.tokens[0]
-        ops = [pair[1] for pair in list(KEYWORDS_SYNTAX_MAP.items())[:4]]
+        ops = [KEYWORDS_SYNTAX_MAP[keyword] for keyword in OP_KEYWORDS_MAP.values()]
 
         return list(first_token.items())[0][1] in ops
 
@@ -600,6 +624,14 @@ class Lexer:
         """
         return self.is_last_token_if(token=token, index=0)
 
+    def is_line_context_else_if(self, token: Token) -> bool:
+        """
+        Is the current line context an else-if condition: '} else if (...) {'
+        """
+        else_token = {TOKENS_SYNTAX_MAP[KEYWORD_TOKEN]: KEYWORDS_SYNTAX_MAP[ELSE_KEYWORD]}
+
+        return len(token.tokens) >= 3 and token.tokens[-2] == else_token and self.is_last_token_if(token=token, index=-1)
+
     def parse_constant_declaration(self, token_construct: str, current_index: int, current_char: str, line_content: str, token: Token) -> list:
         """
         Parse constant declaration elements: identifier, size, type, value.
@@ -1011,49 +1043,38 @@ class Lexer:
             right_element = ""
             result_var_identifier = ""
 
-            split_line_content = line_content.split(" ")    # Spliting the line is more convenient
+            line_content = line_content[current_index+1:]   # Ignore the operation keyword
+            line_content = self.strip_line_from_comments(line_content=line_content)
 
-            # Operation keywords mul, div, add, sub
-            op_keywords = list()
-            for pair in list(KEYWORDS.items())[:4]:
-                op_keywords.append(pair[1])
-            
-            for i, char in enumerate(split_line_content):
-                # Skip the operation keyword (mul, add, div, sub)
-                if char in op_keywords:
-                    continue
-                
-                # Left element
-                if char.startswith("("):
-                    left_element = char[1:-1] # Remove '(', ','
-                    
-                    elements.append(
-                        {(LITERALS_SYNTAX_MAP[OP_LEFT_ELEMENT_LITERAL] if not is_identifier(left_element) else TOKENS_SYNTAX_MAP[IDENTIFIER_TOKEN]): left_element}
-                    )
+            # Both '(left, right) into result;' and the bare
+            # 'left, right into result;' forms are accepted.
+            operands, _, result_var_identifier = line_content.partition(" into ")
+            operands = operands.strip().removeprefix("(").removesuffix(")")
 
-                # Right element
-                if char.endswith(")"):
-                    right_element = char[:-1] # Remove ')'
-                    
-                    elements.append(
-                        {(LITERALS_SYNTAX_MAP[OP_LEFT_ELEMENT_LITERAL] if not is_identifier(right_element) else TOKENS_SYNTAX_MAP[IDENTIFIER_TOKEN]) : right_element}
-                    )
-                
-                # into keyword
-                if char == "into":
-                    elements.append(
-                        {KEYWORDS_SYNTAX_MAP[INTO_KEYWORD]: "into"}
-                    )
-                
-                # Result identifier
-                if split_line_content[i-1] == "into" and char.endswith(";\n"):
-                    result_var_identifier = char[:-2] # Remove ';\n'
+            if "," in operands:
+                left_element, right_element = [element.strip() for element in operands.split(",", 1)]
 
-                    elements.append({TOKENS_SYNTAX_MAP[IDENTIFIER_TOKEN]: result_var_identifier})
-                    elements.append({TOKENS_SYNTAX_MAP[SYMBOL_TOKEN]: SYMBOLS_SYNTAX_MAP[SEMICOLON_SYMBOL]})
-                
-                if len(elements) == 5:
-                    break
+            # Left element
+            elements.append(
+                {(LITERALS_SYNTAX_MAP[OP_LEFT_ELEMENT_LITERAL] if not is_identifier(left_element) else TOKENS_SYNTAX_MAP[IDENTIFIER_TOKEN]): left_element}
+            )
+
+            # Right element
+            elements.append(
+                {(LITERALS_SYNTAX_MAP[OP_LEFT_ELEMENT_LITERAL] if not is_identifier(right_element) else TOKENS_SYNTAX_MAP[IDENTIFIER_TOKEN]) : right_element}
+            )
+
+            # into keyword
+            elements.append(
+                {KEYWORDS_SYNTAX_MAP[INTO_KEYWORD]: "into"}
+            )
+
+            # Result identifier
+            result_var_identifier = result_var_identifier.strip()
+
+            if result_var_identifier.endswith(";"):
+                elements.append({TOKENS_SYNTAX_MAP[IDENTIFIER_TOKEN]: result_var_identifier[:-1].strip()})
+                elements.append({TOKENS_SYNTAX_MAP[SYMBOL_TOKEN]: SYMBOLS_SYNTAX_MAP[SEMICOLON_SYMBOL]})
 
         return elements, skip_indexes_list
 
@@ -1080,7 +1101,7 @@ class Lexer:
             else:
                 # The given syscall number is higher then 'max_syscall_idx'
                 if int(syscall_number) > max_syscall_idx:
-                    print(f"[bold red][ERROR][reset]: Invalid syscall number, in line '{token.line.line_number}'")
+                    logger.error(f"Invalid syscall number, in line '{token.line.line_number}'")
                     sys.exit(1)
                 
                 elements.append(
@@ -1092,7 +1113,7 @@ class Lexer:
 
             # Handle too many arguments passed
             if len(regs_values) > max_syscall_regs_n:
-                print(f"[bold red][ERROR][reset]: syscall only supports up to 6 arguments (found 8), in line '{token.line.line_number}'.")
+                logger.error(f"syscall only supports up to 6 arguments (found 8), in line '{token.line.line_number}'.")
                 sys.exit(1)
             
             for reg_value in regs_values:
@@ -1188,7 +1209,7 @@ class Lexer:
                 #       10 = = 10;  // Should throw an error.
                 #       10 == 10; // Should work
                 if line_content[i+1] == " " and char not in [">", "<"]: # Characters like >, < will expect '=' after.
-                    print(f"[bold red][ERROR][reset]: Invalid syntax in line '{token.line.line_number}'.")
+                    logger.error(f"Invalid syntax in line '{token.line.line_number}'.")
                     sys.exit(1)
                 elif line_content[i+1] == " " and char in [">", "<"]:
                      pass
@@ -1197,7 +1218,7 @@ class Lexer:
 
                 # Invalid compare token
                 if condition_symbol not in compare_map:
-                    print(f"[bold red][ERROR][reset]: Invalid compare symbol '{condition_symbol}' in line '{token.line.line_number}'")
+                    logger.error("Invalid compare symbol '%s' in line '%d'", condition_symbol, token.line.line_number)
                     sys.exit(1)
                 else:
                     elements.append(
@@ -1238,7 +1259,7 @@ class Lexer:
         """
         elements = list()
 
-        if self.is_line_context_if(token=token):
+        if self.is_line_context_if(token=token) or self.is_line_context_else_if(token=token):
             condition = ""                  # Conditions for now are just comparison
             is_in_condition_block = False   # Track if we are inside of '()'
             rparen_symbol = False           # Track the '(' symbol
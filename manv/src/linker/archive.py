@@ -0,0 +1,193 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "Archive",
+    "write_archive",
+    "read_archive",
+    "load_archive",
+]
+
+import struct
+
+from pathlib import Path
+from functools import lru_cache
+from typing import BinaryIO
+
+# ELF
+from manv.src.assembler.elf import ObjectFile, read_object, STB_LOCAL
+
+# Exceptions
+from manv.src.assembler.exceptions import ElfError
+
+# GNU ar format, as written by 'ar rcsD'
+ARCHIVE_MAGIC = b"!<arch>\n"
+MEMBER_HEADER = struct.Struct("16s12s6s6s8s10s2s")
+MEMBER_MAGIC = b"`\n"
+SYMBOL_TABLE_NAME = "/"
+LONG_NAMES_NAME = "//"
+
+class Archive:
+    """
+    A static library: its members' data by header offset, and the symbol
+    index telling which member defines which global symbol. Members are
+    only read as objects when one of their symbols is needed.
+    """
+    def __init__(self, name: str, symbols: dict[str, int], members: dict[int, tuple[str, bytes]]) -> None:
+        self.name = name
+        self.symbols = symbols      # Symbol -> offset of the member defining it
+        self.members = members      # Offset -> (name, data)
+
+        self._objects: dict[int, ObjectFile] = {}
+
+    def get_member(self, offset: int) -> ObjectFile:
+        """
+        The object of a member, read once.
+        """
+        if offset not in self._objects:
+            name, data = self.members[offset]
+            self._objects[offset] = read_object(data=data, source_name=f"{self.name}({name})")
+
+        return self._objects[offset]
+
+def get_defined_symbols(obj: ObjectFile) -> list[str]:
+    """
+    The global symbols an object defines.
+    """
+    return [
+        symbol.name
+        for symbol in obj.symbols
+        if symbol.binding != STB_LOCAL and symbol.section is not None
+    ]
+
+def write_member_header(output: BinaryIO, name: str, size: int) -> None:
+    # Deterministic: no timestamp, owner or group
+    output.write(MEMBER_HEADER.pack(
+        name.encode().ljust(16),
+        b"0".ljust(12),
+        b"0".ljust(6),
+        b"0".ljust(6),
+        b"644".ljust(8),
+        str(size).encode().ljust(10),
+        MEMBER_MAGIC
+    ))
+
+def write_archive(members: list[tuple[str, bytes]], output: BinaryIO) -> None:
+    """
+    Write objects (name and ELF bytes) into a static archive, with the
+    symbol index of their global definitions. A symbol defined by several
+    members is indexed to the first one, like ld would pick it.
+    """
+    # Long member names go in the '//' member
+    long_names = b""
+    header_names = []
+
+    for name, _ in members:
+        if len(name) >= 16:
+            header_names.append(f"/{len(long_names)}")
+            long_names += name.encode() + b"/\n"
+        else:
+            header_names.append(f"{name}/")
+
+    symbols: dict[str, int] = {}    # Symbol -> index of the member
+    for index, (name, data) in enumerate(members):
+        for symbol in get_defined_symbols(read_object(data=data, source_name=name)):
+            symbols.setdefault(symbol, index)
+
+    names = b"".join(symbol.encode() + b"\0" for symbol in symbols)
+    table_size = 4 + 4 * len(symbols) + len(names)
+
+    # Offsets of the member headers
+    offset = len(ARCHIVE_MAGIC) + MEMBER_HEADER.size + table_size + table_size % 2
+
+    if long_names:
+        offset += MEMBER_HEADER.size + len(long_names) + len(long_names) % 2
+
+    offsets = []
+    for _, data in members:
+        offsets.append(offset)
+        offset += MEMBER_HEADER.size + len(data) + len(data) % 2
+
+    output.write(ARCHIVE_MAGIC)
+
+    write_member_header(output, SYMBOL_TABLE_NAME, table_size)
+    output.write(struct.pack(f">I{len(symbols)}I", len(symbols), *[offsets[index] for index in symbols.values()]))
+    output.write(names + b"\n" * (table_size % 2))
+
+    if long_names:
+        write_member_header(output, LONG_NAMES_NAME, len(long_names))
+        output.write(long_names + b"\n" * (len(long_names) % 2))
+
+    for header_name, (_, data) in zip(header_names, members):
+        write_member_header(output, header_name, len(data))
+        output.write(data + b"\n" * (len(data) % 2))
+
+def read_archive(data: bytes, name: str) -> Archive:
+    """
+    Read a static archive.
+    """
+    if not data.startswith(ARCHIVE_MAGIC):
+        raise ElfError(f"'{name}' isn't a static archive")
+
+    symbols: dict[str, int] = {}
+    members: dict[int, tuple[str, bytes]] = {}
+    long_names = b""
+    offset = len(ARCHIVE_MAGIC)
+
+    while offset + MEMBER_HEADER.size <= len(data):
+        member_name, *_, size, magic = MEMBER_HEADER.unpack_from(data, offset)
+
+        if magic != MEMBER_MAGIC:
+            raise ElfError(f"'{name}' has a malformed member at offset {offset}")
+
+        member_name = member_name.decode().rstrip()
+        start = offset + MEMBER_HEADER.size
+        content = data[start:start + int(size)]
+
+        if member_name == SYMBOL_TABLE_NAME:
+            count, = struct.unpack_from(">I", content)
+            offsets = struct.unpack_from(f">{count}I", content, 4)
+            names = content[4 + 4 * count:].split(b"\0")
+
+            symbols.update(zip((symbol.decode() for symbol in names), offsets))
+        elif member_name == LONG_NAMES_NAME:
+            long_names = content
+        else:
+            if member_name.startswith("/"):
+                start_name = int(member_name[1:])
+                member_name = long_names[start_name:long_names.index(b"/\n", start_name)].decode()
+            else:
+                member_name = member_name.rstrip("/")
+
+            members[offset] = (member_name, content)
+
+        offset = start + int(size) + int(size) % 2
+
+    return Archive(name=name, symbols=symbols, members=members)
+
+@lru_cache(maxsize=64)
+def load_archive(path: Path, mtime_ns: int, size: int) -> Archive:
+    """
+    Read a static archive, cached on its path, mtime and size like the
+    library objects.
+    """
+    return read_archive(data=path.read_bytes(), name=str(path))
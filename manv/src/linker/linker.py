@@ -0,0 +1,594 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "Linker",
+    "BASE_ADDRESS",
+    "load_library",
+]
+
+import struct
+
+from pathlib import Path
+from functools import lru_cache
+from dataclasses import dataclass, field
+from typing import BinaryIO
+
+# ELF
+from manv.src.assembler.elf import *
+from manv.src.assembler.elf import (
+    ELF_HEADER,
+    SECTION_HEADER,
+    SYMBOL,
+    ELFCLASS64,
+    ELFDATA2LSB,
+    EV_CURRENT,
+    ET_EXEC,
+    EM_X86_64,
+    SHT_NULL,
+    SHT_SYMTAB,
+    SHT_STRTAB,
+    SHN_ABS,
+    STT_NOTYPE,
+)
+
+# Exceptions
+from manv.src.assembler.exceptions import ElfError
+from manv.src.linker.exceptions import LinkerError
+
+# Static archives
+from manv.src.linker.archive import Archive, load_archive
+
+# Same defaults as ld for a static x86-64 executable
+BASE_ADDRESS = 0x400000
+PAGE_SIZE = 0x1000
+
+PROGRAM_HEADER = struct.Struct("<IIQQQQQQ")
+
+PT_LOAD = 1
+PT_GNU_STACK = 0x6474E551
+
+PF_X = 0x1
+PF_W = 0x2
+PF_R = 0x4
+
+# Output sections in the order of the executable, and the segment holding them
+OUTPUT_SECTIONS = {
+    ".rodata": PF_R,
+    ".text": PF_R | PF_X,
+    ".data": PF_R | PF_W,
+    ".bss": PF_R | PF_W,
+}
+
+@dataclass
+class OutputSection:
+    name: str
+    type: int
+    flags: int
+    alignment: int = 1
+    data: bytearray = field(default_factory=bytearray)
+    size: int = 0
+    offset: int = 0     # In the file
+    address: int = 0
+
+def get_output_section(section: Section) -> str | None:
+    """
+    The output section of an input section, from its flags
+    ('.text.main' goes to '.text' ...). None for dropped sections.
+    """
+    if not section.flags & SHF_ALLOC:
+        return None
+
+    if section.flags & SHF_EXECINSTR:
+        return ".text"
+
+    if section.flags & SHF_WRITE:
+        return ".bss" if section.type == SHT_NOBITS else ".data"
+
+    return ".rodata"
+
+@lru_cache(maxsize=256)
+def load_library(path: Path, mtime_ns: int, size: int) -> ObjectFile:
+    """
+    Read a library object, cached on its path, mtime and size so a process
+    linking many programs (compile-many, the daemon) reads it only once.
+
+    Linking doesn't modify its input objects, so they can be shared.
+    """
+    return read_object(data=path.read_bytes(), source_name=str(path))
+
+class Linker:
+    """
+    Minimal static linker: merges the sections of a program's objects and
+    of the stdlib objects it uses, applies their relocations and writes an
+    executable ELF, without running ld.
+    """
+    def __init__(self, entry: str = "_start", gc_sections: bool = False, strip: bool = False, compact: bool = False) -> None:
+        self.entry = entry
+        self.gc_sections = gc_sections     # Drop the sections not reachable from the entry point, like 'ld --gc-sections'
+        self.strip = strip                 # No symbol table nor section headers
+        self.compact = compact             # Segments packed in the file, like 'ld -z noseparate-code'
+        self.objects: list[ObjectFile] = []
+        self.libraries: list[ObjectFile] = []   # Only linked when they define a needed symbol
+        self.archives: list[Archive] = []       # Only their members defining a needed symbol are linked
+
+    def add_object(self, obj: ObjectFile) -> None:
+        self.objects.append(obj)
+
+    def add_library(self, obj: ObjectFile) -> None:
+        self.libraries.append(obj)
+
+    def add_archive(self, archive: Archive) -> None:
+        self.archives.append(archive)
+
+    def add_library_dir(self, path: Path) -> None:
+        """
+        Add the precompiled objects and static archives of a libraries
+        directory (stdlib/libs).
+        """
+        if not path.is_dir():
+            return
+
+        for library_path in sorted([*path.glob("*.o"), *path.glob("*.a")]):
+            stat = library_path.stat()
+            load = load_archive if library_path.suffix == ".a" else load_library
+
+            try:
+                library = load(path=library_path.resolve(), mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            except ElfError as error:
+                raise LinkerError(str(error)) from None
+
+            if isinstance(library, Archive):
+                self.add_archive(library)
+            else:
+                self.add_library(library)
+
+    def get_linked_objects(self) -> list[ObjectFile]:
+        """
+        The program's objects, and the libraries objects and archives
+        members that define one of their undefined symbols (recursively).
+        Loose library objects are searched before the archives.
+        """
+        linked = list(self.objects)
+        pending = list(self.libraries)
+        linked_members: set[tuple[int, int]] = set()    # (Archive index, member offset)
+
+        while True:
+            defined = {
+                symbol.name
+                for obj in linked
+                for symbol in obj.symbols
+                if symbol.binding != STB_LOCAL and symbol.section is not None
+            }
+            undefined = {
+                symbol.name
+                for obj in linked
+                for symbol in obj.symbols
+                if symbol.section is None
+            } - defined
+
+            if not undefined:
+                return linked
+
+            for library in pending:
+                if any(
+                    symbol.name in undefined
+                    for symbol in library.symbols
+                    if symbol.binding != STB_LOCAL and symbol.section is not None
+                ):
+                    linked.append(library)
+                    pending.remove(library)
+                    break
+            else:
+                member = self.find_archive_member(undefined, linked_members)
+
+                if member is None:
+                    return linked
+
+                linked.append(member)
+
+    def find_archive_member(self, undefined: set[str], linked_members: set[tuple[int, int]]) -> ObjectFile | None:
+        """
+        The first archive member, through the symbol indexes, defining one
+        of the undefined symbols and not linked yet.
+        """
+        for index, archive in enumerate(self.archives):
+            for name in sorted(undefined):
+                offset = archive.symbols.get(name)
+
+                if offset is None or (index, offset) in linked_members:
+                    continue
+
+                linked_members.add((index, offset))
+
+                try:
+                    return archive.get_member(offset)
+                except ElfError as error:
+                    raise LinkerError(str(error)) from None
+
+        return None
+
+    def get_live_sections(self, objects: list[ObjectFile]) -> set[tuple[int, str]]:
+        """
+        The sections reachable from the entry point's section through the
+        relocations, as (id of the object, section name).
+        """
+        definitions: dict[str, tuple[int, ObjectFile, str]] = {}    # Symbol -> (binding, object, section)
+        local_sections: dict[int, dict[str, str]] = {}              # Object -> local symbol -> section
+        sections: dict[int, dict[str, Section]] = {}
+
+        for obj in objects:
+            sections[id(obj)] = {section.name: section for section in obj.sections}
+            local_sections[id(obj)] = {}
+
+            for symbol in obj.symbols:
+                if symbol.section in (None, SECTION_ABSOLUTE):
+                    continue
+
+                if symbol.binding == STB_LOCAL:
+                    local_sections[id(obj)].setdefault(symbol.name, symbol.section)
+                elif symbol.name not in definitions or definitions[symbol.name][0] == STB_WEAK:
+                    definitions[symbol.name] = (symbol.binding, obj, symbol.section)
+
+        if self.entry not in definitions:
+            return set()
+
+        _, entry_obj, entry_section = definitions[self.entry]
+
+        live = {(id(entry_obj), entry_section)}
+        pending = [(entry_obj, entry_section)]
+
+        while pending:
+            obj, section_name = pending.pop()
+
+            for relocation in sections[id(obj)][section_name].relocations:
+                # Resolved like the relocations: section symbols, locals, then globals
+                if relocation.symbol in sections[id(obj)]:
+                    target = (obj, relocation.symbol)
+                elif relocation.symbol in local_sections[id(obj)]:
+                    target = (obj, local_sections[id(obj)][relocation.symbol])
+                elif relocation.symbol in definitions:
+                    target = definitions[relocation.symbol][1:]
+                else:
+                    continue    # Undefined, reported when linking
+
+                if (id(target[0]), target[1]) not in live:
+                    live.add((id(target[0]), target[1]))
+                    pending.append(target)
+
+        return live
+
+    def link(self, output: BinaryIO) -> None:
+        """
+        Link the objects and write the executable.
+        """
+        objects = self.get_linked_objects()
+        live = self.get_live_sections(objects) if self.gc_sections else None
+
+        # Merge the input sections
+        sections = {
+            name: OutputSection(name=name, type=SHT_NOBITS if name == ".bss" else SHT_PROGBITS, flags=SHF_ALLOC)
+            for name in OUTPUT_SECTIONS
+        }
+        placements: dict[tuple[int, str], tuple[OutputSection, int]] = {}
+
+        for name, section in sections.items():
+            for obj in objects:
+                for input_section in obj.sections:
+                    if get_output_section(input_section) != name:
+                        continue
+
+                    if live is not None and (id(obj), input_section.name) not in live:
+                        continue
+
+                    offset = align(section.size, input_section.alignment)
+
+                    if section.type != SHT_NOBITS:
+                        section.data += bytes(offset - len(section.data)) + input_section.data
+
+                    section.size = offset + input_section.length
+                    section.alignment = max(section.alignment, input_section.alignment)
+                    section.flags |= input_section.flags
+
+                    placements[(id(obj), input_section.name)] = (section, offset)
+
+        used_sections = [section for section in sections.values() if section.size]
+        segments = self.layout(used_sections)
+
+        # Symbols addresses
+        global_symbols: dict[str, tuple[int, int]] = {}
+        section_symbols: dict[int, dict[str, int]] = {}
+        local_symbols: dict[int, dict[str, int]] = {}
+
+        def get_address(obj: ObjectFile, section_name: str | None, value: int) -> int:
+            if section_name == SECTION_ABSOLUTE:
+                return value
+
+            section, offset = placements[(id(obj), section_name)]
+
+            return section.address + offset + value
+
+        for obj in objects:
+            section_symbols[id(obj)] = {
+                section.name: get_address(obj, section.name, 0)
+                for section in obj.sections
+                if (id(obj), section.name) in placements
+            }
+            local_symbols[id(obj)] = {}
+
+            for symbol in obj.symbols:
+                if symbol.section is None:
+                    continue
+
+                # In a dropped section
+                if symbol.section != SECTION_ABSOLUTE and (id(obj), symbol.section) not in placements:
+                    continue
+
+                address = get_address(obj, symbol.section, symbol.value)
+
+                if symbol.binding == STB_LOCAL:
+                    local_symbols[id(obj)][symbol.name] = address
+                    continue
+
+                if symbol.name in global_symbols:
+                    if symbol.binding == STB_WEAK:
+                        continue
+
+                    if global_symbols[symbol.name][0] != STB_WEAK:
+                        raise LinkerError(f"{obj.source_name}: multiple definition of '{symbol.name}'")
+
+                global_symbols[symbol.name] = (symbol.binding, address)
+
+        # Relocations
+        for obj in objects:
+            for input_section in obj.sections:
+                if (id(obj), input_section.name) not in placements:
+                    continue
+
+                section, offset = placements[(id(obj), input_section.name)]
+
+                for relocation in input_section.relocations:
+                    if relocation.symbol in section_symbols[id(obj)]:
+                        target = section_symbols[id(obj)][relocation.symbol]
+                    elif relocation.symbol in local_symbols[id(obj)]:
+                        target = local_symbols[id(obj)][relocation.symbol]
+                    elif relocation.symbol in global_symbols:
+                        target = global_symbols[relocation.symbol][1]
+                    elif any(symbol.name == relocation.symbol and symbol.binding == STB_WEAK for symbol in obj.symbols):
+                        target = 0
+                    else:
+                        raise LinkerError(f"{obj.source_name}: undefined reference to '{relocation.symbol}'")
+
+                    self.apply_relocation(section, offset + relocation.offset, relocation, target)
+
+        if self.entry not in global_symbols:
+            raise LinkerError(f"cannot find entry symbol '{self.entry}'")
+
+        self.write_executable(
+            output=output,
+            sections=used_sections,
+            segments=segments,
+            entry=global_symbols[self.entry][1],
+            symbols=[
+                (name, address)
+                for obj in objects
+                for name, address in local_symbols[id(obj)].items()
+            ] + [(name, address) for name, (_, address) in global_symbols.items()],
+            globals_count=len(global_symbols)
+        )
+
+    def layout(self, sections: list[OutputSection]) -> list[tuple[int, list[OutputSection]]]:
+        """
+        Assign a file offset and an address to each output section.
+        Each segment starts on a new page, the first one holds the headers.
+
+        A compact executable has the read only data in the code segment,
+        and its segments packed in the file: they still start on a new
+        page in memory, at the same offset in the page as in the file.
+        """
+        segments: list[tuple[int, list[OutputSection]]] = []
+
+        for section in sections:
+            flags = OUTPUT_SECTIONS[section.name]
+
+            if self.compact and flags == PF_R:
+                flags = PF_R | PF_X
+
+            if segments and segments[-1][0] == flags:
+                segments[-1][1].append(section)
+            else:
+                segments.append((flags, [section]))
+
+        # The headers are in a read only segment
+        headers_flags = PF_R | PF_X if self.compact else PF_R
+
+        if not segments or segments[0][0] != headers_flags:
+            segments.insert(0, (headers_flags, []))
+
+        offset = ELF_HEADER.size + PROGRAM_HEADER.size * (len(segments) + 1)
+        bias = BASE_ADDRESS     # Address of the segment's sections minus their offset
+        end_address = BASE_ADDRESS
+
+        for i, (_, segment_sections) in enumerate(segments):
+            if i > 0 and self.compact:
+                bias = align(end_address, PAGE_SIZE) - (offset - offset % PAGE_SIZE)
+            elif i > 0:
+                offset = align(offset, PAGE_SIZE)
+
+            for section in segment_sections:
+                offset = align(offset, section.alignment)
+                section.offset = offset
+                section.address = bias + offset
+
+                if section.type != SHT_NOBITS:
+                    offset += section.size
+
+            # .bss takes no room in the file but its addresses are used
+            offset += sum(section.size for section in segment_sections if section.type == SHT_NOBITS)
+            end_address = bias + offset
+
+        return segments
+
+    def apply_relocation(self, section: OutputSection, offset: int, relocation: Relocation, target: int) -> None:
+        place = section.address + offset
+        value = target + relocation.addend
+
+        if relocation.type == R_X86_64_64:
+            size, signed = 8, None
+        elif relocation.type in (R_X86_64_PC32, R_X86_64_PLT32):
+            size, signed, value = 4, True, value - place
+        elif relocation.type == R_X86_64_32:
+            size, signed = 4, False
+        elif relocation.type == R_X86_64_32S:
+            size, signed = 4, True
+        else:
+            raise LinkerError(f"unsupported relocation type '{relocation.type}' in section '{section.name}'")
+
+        if signed is True and not -(1 << 31) <= value < (1 << 31) or signed is False and not 0 <= value < (1 << 32):
+            raise LinkerError(f"relocation truncated to fit against '{relocation.symbol}'")
+
+        if section.type == SHT_NOBITS:
+            raise LinkerError(f"relocation in the nobits section '{section.name}'")
+
+        section.data[offset:offset + size] = (value & ((1 << (size * 8)) - 1)).to_bytes(size, "little")
+
+    def write_executable(
+        self,
+        output: BinaryIO,
+        sections: list[OutputSection],
+        segments: list[tuple[int, list[OutputSection]]],
+        entry: int,
+        symbols: list[tuple[str, int]],
+        globals_count: int
+    ) -> None:
+        """
+        Write the executable: headers, segments, then a symbol table and
+        the section headers (for objdump, gdb and perf) unless it's stripped.
+        """
+        headers_size = ELF_HEADER.size + PROGRAM_HEADER.size * (len(segments) + 1)
+        image = bytearray(headers_size)
+
+        for section in sections:
+            if section.type != SHT_NOBITS:
+                image += bytes(section.offset - len(image)) + section.data
+
+        # Program headers
+        program_headers = b""
+
+        for i, (flags, segment_sections) in enumerate(segments):
+            start = 0 if i == 0 else segment_sections[0].offset
+            bias = BASE_ADDRESS if i == 0 else segment_sections[0].address - segment_sections[0].offset
+            end_file = max(
+                [section.offset + section.size for section in segment_sections if section.type != SHT_NOBITS]
+                + [headers_size if i == 0 else start]
+            )
+            end_memory = max([end_file] + [section.offset + section.size for section in segment_sections])
+
+            program_headers += PROGRAM_HEADER.pack(
+                PT_LOAD, flags, start, bias + start, bias + start,
+                end_file - start, end_memory - start, PAGE_SIZE
+            )
+
+        # Non executable stack
+        program_headers += PROGRAM_HEADER.pack(PT_GNU_STACK, PF_R | PF_W, 0, 0, 0, 0, 0, 16)
+
+        # A stripped executable only has what's needed to run it
+        if self.strip:
+            section_headers_offset, section_headers_count = 0, 0
+        else:
+            section_headers_offset, section_headers_count = self.write_section_headers(
+                image=image,
+                sections=sections,
+                symbols=symbols,
+                globals_count=globals_count
+            )
+
+        image[:ELF_HEADER.size] = ELF_HEADER.pack(
+            b"\x7fELF" + bytes([ELFCLASS64, ELFDATA2LSB, EV_CURRENT]) + bytes(9),
+            ET_EXEC, EM_X86_64, EV_CURRENT,
+            entry, ELF_HEADER.size, section_headers_offset,
+            0, ELF_HEADER.size, PROGRAM_HEADER.size, len(segments) + 1,
+            SECTION_HEADER.size, section_headers_count, max(section_headers_count - 1, 0)
+        )
+        image[ELF_HEADER.size:ELF_HEADER.size + len(program_headers)] = program_headers
+
+        output.write(image)
+
+    def write_section_headers(
+        self,
+        image: bytearray,
+        sections: list[OutputSection],
+        symbols: list[tuple[str, int]],
+        globals_count: int
+    ) -> tuple[int, int]:
+        """
+        Append the symbol table and the section headers to the executable,
+        returns the offset and the count of the section headers.
+        """
+        # Symbol table
+        section_names = StringTable()
+        symbol_names = StringTable()
+        section_indexes = {section.name: index for index, section in enumerate(sections, start=1)}
+
+        def get_section_index(address: int) -> int:
+            for section in sections:
+                if section.address <= address < section.address + section.size:
+                    return section_indexes[section.name]
+
+            return SHN_ABS
+
+        symtab = SYMBOL.pack(0, 0, 0, 0, 0, 0)
+
+        for i, (name, address) in enumerate(symbols):
+            binding = STB_LOCAL if i < len(symbols) - globals_count else STB_GLOBAL
+            symtab += SYMBOL.pack(symbol_names.add(name), (binding << 4) | STT_NOTYPE, 0, get_section_index(address), address, 0)
+
+        section_headers = [SECTION_HEADER.pack(0, SHT_NULL, 0, 0, 0, 0, 0, 0, 0, 0)]
+
+        for section in sections:
+            section_headers.append(
+                SECTION_HEADER.pack(
+                    section_names.add(section.name), section.type, section.flags, section.address,
+                    section.offset, section.size, 0, 0, section.alignment, 0
+                )
+            )
+
+        symtab_index = len(section_headers)
+
+        for name, typ, data, link, info, alignment, entry_size in [
+            (".symtab", SHT_SYMTAB, symtab, symtab_index + 1, 1 + len(symbols) - globals_count, 8, SYMBOL.size),
+            (".strtab", SHT_STRTAB, bytes(symbol_names.data), 0, 0, 1, 0),
+            (".shstrtab", SHT_STRTAB, None, 0, 0, 1, 0),
+        ]:
+            name_offset = section_names.add(name)
+
+            if data is None:
+                data = bytes(section_names.data)
+
+            offset = align(len(image), alignment)
+            image += bytes(offset - len(image)) + data
+            section_headers.append(SECTION_HEADER.pack(name_offset, typ, 0, 0, offset, len(data), link, info, alignment, entry_size))
+
+        section_headers_offset = align(len(image), 8)
+        image += bytes(section_headers_offset - len(image)) + b"".join(section_headers)
+
+        return section_headers_offset, len(section_headers)
@@ -44,6 +44,9 @@ from manv.src.builtin.literals import *
 # AST
 from manv.src.ast.nodes import *
 
+# Profiler phases
+from manv.profiler import profile_phase
+
 BUILTIN_TYPES_OBJ_MAP =  {
     IntType: NumberLiteral,
     FloatType: FloatLiteral,
@@ -59,6 +62,7 @@ class Parser:
     def __init__(self) -> None:
         pass
     
+    @profile_phase("parsing")
     def parse(self, tokens) -> Program:
         """
         Build an AST
@@ -71,6 +75,7 @@ class Parser:
         is_if_condition_block = False
         is_else_condition_block = False
         if_else: IfElse = None
+        root_if_else: IfElse = None     # First if-else of an else-if chain
 
         for i, token in enumerate(tokens.tokens):
             current_line = token.line
@@ -92,17 +97,43 @@ class Parser:
             if list(line_tokens[0].items())[0][0] == TOKENS_SYNTAX_MAP[SYMBOL_TOKEN]:
                 symbol = list(line_tokens[0].items())[0][1]
                     
+                else_keyword_token = {TOKENS_SYNTAX_MAP[KEYWORD_TOKEN]: KEYWORDS_SYNTAX_MAP[ELSE_KEYWORD]}
+                if_keyword_token = {TOKENS_SYNTAX_MAP[KEYWORD_TOKEN]: KEYWORDS_SYNTAX_MAP[IF_KEYWORD]}
+
+                is_else = else_keyword_token in line_tokens
+                is_else_if = is_else and if_keyword_token in line_tokens
+
                 # Symbol: RBRACE_SYMBOL
                 # Close an if condition or else condition block
                 if symbol == SYMBOLS_SYNTAX_MAP[RBRACE_SYMBOL]:
                     if is_if_condition_block:
                         is_if_condition_block = False
+
+                        # An if condition without an else block
+                        if not is_else:
+                            program.statements.append(root_if_else)
                     elif is_else_condition_block:
                         is_else_condition_block = False
-                        program.statements.append(if_else)
+                        program.statements.append(root_if_else)
                 
+                # Keyword: ELSE_KEYWORD followed by IF_KEYWORD
+                # The else block holds the next if-else of the chain
+                if is_else_if:
+                    else_if = IfElse(
+                        condition=self.parse_condition(
+                            line_tokens=line_tokens[line_tokens.index(if_keyword_token):]
+                        ),
+                        if_block_statements=list(),
+                        else_block_statements=list()
+                    )
+                    if_else.else_block_statements.append(else_if)
+                    if_else = else_if
+
+                    is_if_condition_block = True
+                    is_else_condition_block = False
+
                 # Keyword: ELSE_KEYWORD
-                if list(line_tokens[-1].items())[0][1] == KEYWORDS_SYNTAX_MAP[ELSE_KEYWORD]:
+                elif list(line_tokens[-1].items())[0][1] == KEYWORDS_SYNTAX_MAP[ELSE_KEYWORD]:
                     is_if_condition_block = False
                     is_else_condition_block = True
             
@@ -117,6 +148,9 @@ class Parser:
                     const_size = list(line_tokens[2].items())[0][1]
                     const_type = list(line_tokens[3].items())[0][1]
                     const_value = list(line_tokens[4].items())[0][1]
+
+                    # A size given between '[]' declares an array of 'size' elements
+                    const_is_array = list(line_tokens[2].items())[0][0] == LITERALS_SYNTAX_MAP[SIZE_LITERAL]
                     
                     const_declaration = Constant(
                         identifier=Identifier(
@@ -129,7 +163,8 @@ class Parser:
                         value=BUILTIN_TYPES_OBJ_MAP[BUILTIN_TYPES[const_type]](
                             value=const_value
                         ),
-                        line=current_line
+                        line=current_line,
+                        is_array=const_is_array
                     )
 
                     if is_if_condition_block:
@@ -151,6 +186,9 @@ class Parser:
                     if not list(line_tokens[4].items())[0][0] == SYMBOLS_SYNTAX_MAP[SEMICOLON_SYMBOL]:
                         var_value = list(line_tokens[4].items())[0][1]
 
+                    # A size given between '[]' declares an array of 'size' elements
+                    var_is_array = list(line_tokens[2].items())[0][0] == LITERALS_SYNTAX_MAP[SIZE_LITERAL]
+
                     var_declaration = Variable(
                         identifier=Identifier(
                             name=var_identifier,
@@ -160,7 +198,8 @@ class Parser:
                         ),
                         typ=BUILTIN_TYPES[var_type](),
                         value=None,
-                        line=current_line
+                        line=current_line,
+                        is_array=var_is_array
                     )
 
                     if is_if_condition_block:
@@ -204,10 +243,10 @@ class Parser:
                 
                 # Operations keywords (mul, div, add, sub)
                 op_keywords = [
-                    KEYWORDS[MUL_KEYWORD],
-                    KEYWORDS[ADD_KEYWORD],
-                    KEYWORDS[SUB_KEYWORD],
-                    KEYWORDS[DIV_KEYWORD]
+                    KEYWORDS_SYNTAX_MAP[MUL_KEYWORD],
+                    KEYWORDS_SYNTAX_MAP[ADD_KEYWORD],
+                    KEYWORDS_SYNTAX_MAP[SUB_KEYWORD],
+                    KEYWORDS_SYNTAX_MAP[DIV_KEYWORD]
                 ]
 
                 if keyword in op_keywords:
@@ -308,46 +347,14 @@ class Parser:
                 
                 # Keyword: IF_KEYWORD
                 if keyword == KEYWORDS_SYNTAX_MAP[IF_KEYWORD]:
-                    left_element = list(line_tokens[2].items())[0][1]
-                    right_element = list(line_tokens[4].items())[0][1]
-                    compare_symbol = list(line_tokens[3].items())[0][1]
-                    
-                    # Compare symbol
-                    compare_symbol_map = {
-                        "==": EqualSymbol,
-                        "!=": NotEqualSymbol,
-                        ">": GreaterThanSymbol,
-                        ">=":GreaterThanOrEqualToSymbol ,
-                        "<": SmallerThanSymbol,
-                        "<=": SmallerThanOrEqualToSymbol,
-                    }
-                    compare_symbol = compare_symbol_map[compare_symbol]()
-
-                    # Left element
-                    if list(line_tokens[2].items())[0][0] == TOKENS_SYNTAX_MAP[IDENTIFIER_TOKEN]:
-                        left_element = Identifier(name=left_element)
-                    elif list(line_tokens[2].items())[0][0] == LITERALS_SYNTAX_MAP[NUMBER_LITERAL]:
-                        left_element = NumberLiteral(value=left_element)
-                    elif list(line_tokens[2].items())[0][0] == LITERALS_SYNTAX_MAP[FLOAT_LITERAL]:
-                        left_element = FloatLiteral(value=left_element)
-
-                    # Right element
-                    if list(line_tokens[4].items())[0][0] == TOKENS_SYNTAX_MAP[IDENTIFIER_TOKEN]:
-                        right_element = Identifier(name=right_element)
-                    elif list(line_tokens[4].items())[0][0] == LITERALS_SYNTAX_MAP[NUMBER_LITERAL]:
-                        right_element = NumberLiteral(value=right_element)
-                    elif list(line_tokens[4].items())[0][0] == LITERALS_SYNTAX_MAP[FLOAT_LITERAL]:
-                        right_element = FloatLiteral(value=right_element)
-
                     if_else = IfElse(
-                        condition=Compare(
-                            left=left_element,
-                            right=right_element,
-                            symbol=compare_symbol
+                        condition=self.parse_condition(
+                            line_tokens=line_tokens
                         ),
                         if_block_statements=list(),
                         else_block_statements=list()
                     )
+                    root_if_else = if_else
                     is_if_condition_block = True
                 
                 # Keyword: ELSE_KEYWORD
@@ -363,6 +370,49 @@ class Parser:
 
         return program
     
+    def parse_condition(self, line_tokens: list[dict]) -> Compare:
+        """
+        Build the comparison of an if condition, 'line_tokens' starts
+        with the IF_KEYWORD token: if ( left symbol right ) {
+        """
+        left_element = list(line_tokens[2].items())[0][1]
+        right_element = list(line_tokens[4].items())[0][1]
+        compare_symbol = list(line_tokens[3].items())[0][1]
+
+        # Compare symbol
+        compare_symbol_map = {
+            "==": EqualSymbol,
+            "!=": NotEqualSymbol,
+            ">": GreaterThanSymbol,
+            ">=":GreaterThanOrEqualToSymbol ,
+            "<": SmallerThanSymbol,
+            "<=": SmallerThanOrEqualToSymbol,
+            "=<": SmallerThanOrEqualToSymbol,     # As spelled by the lexer
+        }
+        compare_symbol = compare_symbol_map[compare_symbol]()
+
+        # Left element
+        if list(line_tokens[2].items())[0][0] == TOKENS_SYNTAX_MAP[IDENTIFIER_TOKEN]:
+            left_element = Identifier(name=left_element)
+        elif list(line_tokens[2].items())[0][0] == LITERALS_SYNTAX_MAP[NUMBER_LITERAL]:
+            left_element = NumberLiteral(value=left_element)
+        elif list(line_tokens[2].items())[0][0] == LITERALS_SYNTAX_MAP[FLOAT_LITERAL]:
+            left_element = FloatLiteral(value=left_element)
+
+        # Right element
+        if list(line_tokens[4].items())[0][0] == TOKENS_SYNTAX_MAP[IDENTIFIER_TOKEN]:
+            right_element = Identifier(name=right_element)
+        elif list(line_tokens[4].items())[0][0] == LITERALS_SYNTAX_MAP[NUMBER_LITERAL]:
+            right_element = NumberLiteral(value=right_element)
+        elif list(line_tokens[4].items())[0][0] == LITERALS_SYNTAX_MAP[FLOAT_LITERAL]:
+            right_element = FloatLiteral(value=right_element)
+
+        return Compare(
+            left=left_element,
+            right=right_element,
+            symbol=compare_symbol
+        )
+
     def get_type_literal(self, data):
         """
         Get the type literal of data
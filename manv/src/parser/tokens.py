@@ -209,6 +209,14 @@ KEYWORDS: dict[int, str] = {
     COMMENT_KEYWORD: "//"
 }
 
+# Operations keywords binded to their source representation
+OP_KEYWORDS_MAP: dict[str, int] = {
+    "mul": MUL_KEYWORD,
+    "add": ADD_KEYWORD,
+    "div": DIV_KEYWORD,
+    "sub": SUB_KEYWORD,
+}
+
 # Types binded to their string representation
 TYPE_SYNTAX_MAP: dict[int, str] = {
     INT_TYPE: "INT_TYPE",
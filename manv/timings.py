@@ -0,0 +1,88 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "PhaseTimer",
+    "PhaseTiming"
+]
+
+import time
+import resource
+
+from dataclasses import dataclass
+from contextlib import contextmanager
+from typing import Iterator
+
+@dataclass
+class PhaseTiming:
+    """
+    Resources used by a phase of the compilation.
+    """
+    name: str
+    wall: float         # Seconds
+    cpu: float          # Seconds, including the child processes (nasm, ld)
+    peak_rss: int       # Bytes, peak of the process or of a child process so far
+
+class PhaseTimer:
+    """
+    Measure the phases of a compilation, a phase run several times (one
+    per module) adds up.
+    """
+    def __init__(self) -> None:
+        self.phases: dict[str, PhaseTiming] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Measure the code run inside the context.
+        """
+        wall = time.perf_counter()
+        cpu = self.get_cpu_time()
+
+        try:
+            yield
+        finally:
+            timing = self.phases.setdefault(name, PhaseTiming(name=name, wall=0, cpu=0, peak_rss=0))
+            timing.wall += time.perf_counter() - wall
+            timing.cpu += self.get_cpu_time() - cpu
+            timing.peak_rss = max(timing.peak_rss, self.get_peak_rss())
+
+    @staticmethod
+    def get_cpu_time() -> float:
+        """
+        CPU time used by the process and its finished children.
+        """
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+
+        return usage.ru_utime + usage.ru_stime + children.ru_utime + children.ru_stime
+
+    @staticmethod
+    def get_peak_rss() -> int:
+        """
+        Peak resident set size of the process and its children, in bytes.
+        """
+        # ru_maxrss is in KiB on Linux
+        return 1024 * max(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        )
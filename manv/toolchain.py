@@ -0,0 +1,329 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "Toolchain",
+    "ToolchainError",
+    "TMPFS_DIR_PATH",
+    "STDLIB_ARCHIVE_NAME"
+]
+
+import io
+import os
+import time
+import tempfile
+import subprocess
+
+from pathlib import Path
+from contextlib import contextmanager, nullcontext
+from typing import Iterator, ContextManager
+
+# Logs
+from manv.log import logger
+
+# ASM
+from manv.src.codegen.asm import ASM
+
+# Assembler
+from manv.src.assembler.assembler import Assembler
+from manv.src.assembler.elf import ObjectFile, write_object, read_object
+from manv.src.assembler.exceptions import AssemblerError, ElfError
+
+# Linker
+from manv.src.linker.linker import Linker
+from manv.src.linker.exceptions import LinkerError
+
+# Build cache
+from manv.cache import BuildCache, hash_files, tool_hash
+
+# Phases timings
+from manv.timings import PhaseTimer
+
+# Static archive of the stdlib objects, in the libraries directory
+STDLIB_ARCHIVE_NAME = "libmanv.a"
+
+# Memory backed filesystem for the intermediate files
+TMPFS_DIR_PATH = Path("/dev/shm")
+
+class ToolchainError(Exception): ...    # A build step failed
+
+class Toolchain:
+    """
+    Turn the generated assembly into an executable, with the built-in
+    assembler and linker or with nasm and ld.
+
+    Intermediate files live in a private temporary directory (on tmpfs
+    when available) that is removed in-process, and the executable is
+    replaced atomically so concurrent builds of a file don't collide.
+    """
+    def __init__(
+        self,
+        libs_dir_path: Path,
+        use_nasm: bool = False,
+        use_ld: bool = False,
+        dbg: bool = False,
+        keep_files: bool = False,
+        tools_limit: ContextManager | None = None,
+        timer: PhaseTimer | None = None,
+        gc_sections: bool = True,
+        optimize_size: bool = False
+    ) -> None:
+        self.libs_dir_path = libs_dir_path
+        self.use_nasm = use_nasm
+        self.use_ld = use_ld
+        self.dbg = dbg
+        self.keep_files = keep_files
+        self.tools_limit = tools_limit      # Held while running nasm or ld, ex: a semaphore
+        self.timer = timer or PhaseTimer()  # Assembly and linking phases
+        self.gc_sections = gc_sections      # Only link the sections reachable from '_start'
+        self.optimize_size = optimize_size  # -Os: size optimized code, stripped and compact executable
+
+        self.timings: dict[str, float] = {}     # Tool -> total seconds
+
+    def build(
+        self,
+        asm: ASM | str,
+        name: str,
+        output_path: Path,
+        cache: BuildCache | None = None,
+        object_output_path: Path | None = None
+    ) -> None:
+        """
+        Assemble and link a program, restoring the object and the executable
+        from the build cache when their inputs didn't change.
+
+        The object is also written to 'object_output_path' when given.
+        """
+        with self.work_dir() as work_dir:
+            asm_path = work_dir / f"{name}.asm"
+            object_path = work_dir / f"{name}.o"
+
+            if self.use_nasm or self.keep_files:
+                with open(asm_path, "w") as output:
+                    if isinstance(asm, str):
+                        output.write(asm)
+                    else:
+                        asm.write(output=output)
+
+            if cache is None:
+                obj = self.assemble(asm=asm, asm_path=asm_path, object_path=object_path)
+
+                if object_output_path is not None:
+                    object_output_path.write_bytes(object_path.read_bytes() if obj is None else self.serialize(obj))
+
+                self.link(objects=[obj], object_paths=[object_path], output_path=output_path)
+                return
+
+            # Keyed on the assembly itself, the key of the executable on the object
+            if not isinstance(asm, str):
+                asm = asm.get_assembly()
+
+            object_key = cache.key("obj", asm, *self.assembler_flags())
+            object_data = cache.get(object_key)
+
+            if object_data is None:
+                obj = self.assemble(asm=asm, asm_path=asm_path, object_path=object_path)
+                object_data = object_path.read_bytes() if obj is None else self.serialize(obj)
+
+                cache.put(object_key, object_data)
+            else:
+                logger.info("Restored [cyan]'%s'[reset] from the build cache", object_path.name)
+
+                if self.use_ld or self.keep_files:
+                    object_path.write_bytes(object_data)
+
+                obj = None if self.use_ld else read_object(data=object_data, source_name=object_path.name)
+
+            executable_key = cache.key("bin", object_data, *self.linker_flags())
+
+            if cache.restore(executable_key, output_path):
+                logger.info("Restored [cyan]'%s'[reset] from the build cache", output_path.name)
+                return
+
+            self.link(objects=[obj], object_paths=[object_path], output_path=output_path)
+
+            cache.store(executable_key, output_path)
+
+    def assembler_flags(self) -> list[str]:
+        """
+        Everything besides the assembly that the object depends on.
+        """
+        if self.use_nasm:
+            return ["nasm", tool_hash("nasm"), str(self.dbg)]
+
+        return ["builtin"]
+
+    def linker_flags(self) -> list[str]:
+        """
+        Everything besides the object that the executable depends on.
+        """
+        libs = hash_files(sorted([*self.libs_dir_path.glob("*.o"), *self.libs_dir_path.glob("*.a")])) if self.libs_dir_path.is_dir() else ""
+
+        if self.use_ld:
+            return ["ld", tool_hash("ld"), str(self.dbg), str(self.gc_sections), str(self.optimize_size), libs]
+
+        return ["builtin", str(self.gc_sections), str(self.optimize_size), libs]
+
+    @staticmethod
+    def serialize(obj: ObjectFile) -> bytes:
+        """
+        The ELF64 bytes of an object.
+        """
+        output = io.BytesIO()
+        write_object(obj=obj, output=output)
+
+        return output.getvalue()
+
+    @contextmanager
+    def work_dir(self) -> Iterator[Path]:
+        """
+        The directory of the intermediate files: the current directory when
+        they're kept, a private temporary directory otherwise.
+        """
+        if self.keep_files:
+            yield Path.cwd()
+            return
+
+        tmp_dir = TMPFS_DIR_PATH if TMPFS_DIR_PATH.is_dir() and os.access(TMPFS_DIR_PATH, os.W_OK) else None
+
+        with tempfile.TemporaryDirectory(prefix="manv-", dir=tmp_dir) as path:
+            yield Path(path)
+
+    def assemble(self, asm: ASM | str, asm_path: Path, object_path: Path) -> ObjectFile | None:
+        """
+        Assemble the program, returns its object or None when it's only on
+        disk (nasm).
+        """
+        with self.timer.phase("assembly"):
+            if self.use_nasm:
+                cmd = ["nasm", "-f", "elf64", str(asm_path), "-o", str(object_path)]
+
+                if self.dbg:
+                    cmd.append("-g")
+
+                self.run_tool(name="nasm", cmd=cmd)
+
+                return None
+
+            start = time.perf_counter()
+
+            try:
+                lines = asm.splitlines(keepends=True) if isinstance(asm, str) else asm.iter_lines()
+                obj = Assembler().assemble(lines=lines, source_name=asm_path.name)
+            except AssemblerError as error:
+                raise ToolchainError(f"Caught the following error when assembling.\n{error}") from None
+
+            self.timings["assembler"] = self.timings.get("assembler", 0) + time.perf_counter() - start
+
+            if self.use_ld or self.keep_files:
+                with open(object_path, "wb") as output:
+                    write_object(obj=obj, output=output)
+
+            return obj
+
+    def link(self, objects: list[ObjectFile | None], object_paths: list[Path], output_path: Path) -> None:
+        """
+        Link the program's objects into the executable, an object that is
+        None is read from its path.
+        """
+        with self.timer.phase("linking"):
+            if self.use_ld:
+                # Linked next to the executable and renamed over it, like with the built-in linker
+                with tempfile.NamedTemporaryFile(dir=output_path.parent, prefix=f".{output_path.name}.", delete=False) as output:
+                    tmp_output_path = Path(output.name)
+
+                cmd = ["ld", "-L", str(self.libs_dir_path), "-o", str(tmp_output_path), *[str(path) for path in object_paths]]
+
+                # The stdlib archive, after the objects so ld pulls in the members they need
+                if (self.libs_dir_path / STDLIB_ARCHIVE_NAME).is_file():
+                    cmd.append("-lmanv")
+
+                if self.gc_sections:
+                    cmd.append("--gc-sections")
+
+                if self.optimize_size:
+                    cmd.extend(["-s", "-z", "noseparate-code"])
+
+                if self.dbg:
+                    cmd.append("-g")
+
+                try:
+                    self.run_tool(name="ld", cmd=cmd)
+                except BaseException:
+                    tmp_output_path.unlink(missing_ok=True)
+                    raise
+
+                os.chmod(tmp_output_path, 0o755)
+                os.replace(tmp_output_path, output_path)
+                return
+
+            start = time.perf_counter()
+
+            try:
+                linker = Linker(gc_sections=self.gc_sections, strip=self.optimize_size, compact=self.optimize_size)
+
+                for obj, object_path in zip(objects, object_paths):
+                    if obj is None:
+                        obj = read_object(data=object_path.read_bytes(), source_name=object_path.name)
+
+                    linker.add_object(obj)
+
+                linker.add_library_dir(self.libs_dir_path)
+
+                # Write next to the executable and rename it over, so a concurrent
+                # build never sees a partially written file
+                with tempfile.NamedTemporaryFile(dir=output_path.parent, prefix=f".{output_path.name}.", delete=False) as output:
+                    try:
+                        linker.link(output=output)
+                    except BaseException:
+                        os.unlink(output.name)
+                        raise
+
+                os.chmod(output.name, 0o755)
+                os.replace(output.name, output_path)
+            except (ElfError, LinkerError) as error:
+                raise ToolchainError(f"Caught the following error when linking.\n{error}") from None
+
+            self.timings["linker"] = self.timings.get("linker", 0) + time.perf_counter() - start
+
+    def run_tool(self, name: str, cmd: list[str]) -> None:
+        """
+        Run an external tool and record the time spent in it.
+        """
+        logger.info("[white]%s", " ".join(cmd), extra={"tag": "CMD", "fields": {"cmd": cmd}})
+
+        with self.tools_limit or nullcontext():
+            start = time.perf_counter()
+
+            try:
+                out = subprocess.run(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE
+                )
+            except FileNotFoundError:
+                raise ToolchainError(f"'{name}' was not found, please make sure that you have it installed on your system.") from None
+
+        self.timings[name] = self.timings.get(name, 0) + time.perf_counter() - start
+
+        if out.returncode != 0 or out.stderr != b'':
+            raise ToolchainError(f"Caught the following error when running '{name}'.\n{out.stderr.decode()}")
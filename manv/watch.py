@@ -0,0 +1,196 @@
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = [
+    "InotifyWatcher",
+    "PollingWatcher",
+    "get_watcher",
+    "watch"
+]
+
+import os
+import time
+import select
+import struct
+import ctypes
+import ctypes.util
+
+from pathlib import Path
+from typing import Callable
+
+# inotify(7) flags
+IN_CLOSE_WRITE  = 0x00000008
+IN_MOVED_TO     = 0x00000080
+IN_CREATE       = 0x00000100
+IN_DELETE       = 0x00000200
+IN_Q_OVERFLOW   = 0x00004000
+IN_NONBLOCK     = 0o4000
+IN_CLOEXEC      = 0o2000000
+
+# Editors save in place or write a new file and rename it over the old
+# one, the parent directories are watched to see both.
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+INOTIFY_EVENT = struct.Struct("iIII")   # wd, mask, cookie, len
+
+POLL_INTERVAL = 0.05   # Seconds between two checks of the polling watcher
+DEBOUNCE_DELAY = 0.03  # Seconds without changes ending a burst of saves
+
+class InotifyWatcher:
+    """
+    Watch files with inotify, through ctypes.
+    """
+    def __init__(self, paths: list[Path]) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+
+        self.paths = {path.resolve() for path in paths}
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.directories: dict[int, Path] = {}    # Watch descriptor -> directory
+
+        for directory in {path.parent for path in self.paths}:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+
+            if wd < 0:
+                os.close(self.fd)
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed on '{directory}'")
+
+            self.directories[wd] = directory
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """
+        Wait for changes, returns the changed files (none on a timeout).
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+
+        if not readable:
+            return set()
+
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+
+        while offset < len(data):
+            wd, mask, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+            name = data[offset + INOTIFY_EVENT.size:offset + INOTIFY_EVENT.size + length].rstrip(b"\0")
+            offset += INOTIFY_EVENT.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                return set(self.paths)  # Events were lost
+
+            path = self.directories.get(wd, Path()) / os.fsdecode(name)
+
+            if path in self.paths:
+                changed.add(path)
+
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+class PollingWatcher:
+    """
+    Watch files by checking their stat, where inotify isn't available.
+    """
+    def __init__(self, paths: list[Path], interval: float = POLL_INTERVAL) -> None:
+        self.paths = {path.resolve() for path in paths}
+        self.interval = interval
+        self.states = {path: self.get_state(path) for path in self.paths}
+
+    @staticmethod
+    def get_state(path: Path) -> tuple[int, int, int] | None:
+        """
+        What changes when a file is written or replaced.
+        """
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """
+        Wait for changes, returns the changed files (none on a timeout).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            changed = set()
+
+            for path in self.paths:
+                state = self.get_state(path)
+
+                if state != self.states[path]:
+                    self.states[path] = state
+                    changed.add(path)
+
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+            time.sleep(self.interval if deadline is None else max(0, min(self.interval, deadline - time.monotonic())))
+
+    def close(self) -> None:
+        pass
+
+def get_watcher(paths: list[Path], polling: bool = False) -> InotifyWatcher | PollingWatcher:
+    """
+    An inotify watcher, or a polling one when inotify isn't available.
+    """
+    if not polling:
+        try:
+            return InotifyWatcher(paths=paths)
+        except (OSError, AttributeError, TypeError):
+            pass    # Not Linux, or out of inotify instances and watches
+
+    return PollingWatcher(paths=paths)
+
+def watch(
+    paths: list[Path],
+    on_change: Callable[[set[Path]], None],
+    debounce: float = DEBOUNCE_DELAY,
+    polling: bool = False
+) -> None:
+    """
+    Call 'on_change' with the changed files after each burst of changes,
+    a burst ends when nothing changed for 'debounce' seconds.
+    """
+    watcher = get_watcher(paths=paths, polling=polling)
+
+    try:
+        while True:
+            changed = watcher.wait()
+
+            while more := watcher.wait(timeout=debounce):
+                changed |= more
+
+            if changed:
+                on_change(changed)
+    finally:
+        watcher.close()
@@ -23,48 +23,201 @@
 # SOFTWARE.
 
 import os
-import subprocess
+import sys
+import json
+import hashlib
+import argparse
+import tempfile
 
 from rich import print
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-LIBS_OBJECTS_DIR_PATH = "stdlib/libs"
-
-ASM_LIBS_PATHS = [
-    "stdlib/core.asm",
-    "stdlib/io/io.asm"
-]
-
-def compile_libs_to_object() -> None:
-    """
-    Compile libraries into object files.
-    """
-    for path in ASM_LIBS_PATHS:
-        print(
-            f"[bold green][INFO][reset]: Compiling lib '{path}'..."
-        )
-        
-        out = subprocess.run(
-            ["nasm", "-f", "elf64", path, "-o", f"stdlib/libs/{path.split('/')[-1].replace('asm', 'o')}"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-        if out.stderr:
-            print(f"[bold red][ERROR][reset]: Caught the following error \n{out.stderr.decode()}")
-            
-        if 'command not found' in out.stderr.decode():
-            print(f"[bold red][ERROR][reset]: nasm is not installed")
-            exit(1)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Toolchain
+from manv.toolchain import Toolchain, ToolchainError, STDLIB_ARCHIVE_NAME
+
+# Static archives
+from manv.src.linker.archive import write_archive
+
+# Build cache
+from manv.cache import compiler_hash
+
+STDLIB_DIR_PATH = Path("stdlib")
+LIBS_OBJECTS_DIR_PATH = STDLIB_DIR_PATH / "libs"
+
+# Objects of the archive members, and the hashes they were assembled from
+OBJECTS_DIR_PATH = LIBS_OBJECTS_DIR_PATH / "obj"
+MANIFEST_PATH = OBJECTS_DIR_PATH / "manifest.json"
+
+ARCHIVE_PATH = LIBS_OBJECTS_DIR_PATH / STDLIB_ARCHIVE_NAME
+
+def discover_sources() -> list[Path]:
+    """
+    The assembly sources of the stdlib.
+    """
+    return sorted(
+        path for path in STDLIB_DIR_PATH.rglob("*.asm")
+        if LIBS_OBJECTS_DIR_PATH not in path.parents
+    )
+
+def get_object_name(source_path: Path) -> str:
+    """
+    The name of a source's object, unique across the stdlib
+    ('io/io.asm' is 'io_io.o').
+    """
+    return "_".join(source_path.relative_to(STDLIB_DIR_PATH).with_suffix(".o").parts)
+
+def get_source_hash(source_path: Path, toolchain: Toolchain) -> str:
+    """
+    The hash of everything an object depends on: its source, the assembler
+    and the compiler itself (the built-in assembler is part of it).
+    """
+    return hashlib.sha256(b"\0".join([
+        source_path.read_bytes(),
+        compiler_hash().encode(),
+        *[flag.encode() for flag in toolchain.assembler_flags()]
+    ])).hexdigest()
+
+def write_atomically(path: Path, data: bytes) -> None:
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", delete=False) as output:
+        output.write(data)
+
+    os.chmod(output.name, 0o644)
+    os.replace(output.name, path)
+
+def assemble_source(source_path: Path, object_path: Path, use_nasm: bool) -> tuple[Path, str | None]:
+    """
+    Assemble a source into its object, returns the error if any.
+    """
+    toolchain = Toolchain(libs_dir_path=LIBS_OBJECTS_DIR_PATH, use_nasm=use_nasm)
+
+    with toolchain.work_dir() as work_dir:
+        tmp_object_path = work_dir / object_path.name
+
+        try:
+            obj = toolchain.assemble(asm=source_path.read_text(), asm_path=source_path, object_path=tmp_object_path)
+        except ToolchainError as error:
+            return source_path, str(error)
+
+        write_atomically(object_path, tmp_object_path.read_bytes() if obj is None else Toolchain.serialize(obj))
+
+    return source_path, None
+
+def load_manifest() -> dict[str, str]:
+    """
+    The object name -> source hash of the objects assembled before.
+    """
+    try:
+        return json.loads(MANIFEST_PATH.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def compile_libs_to_object(sources: list[Path], use_nasm: bool, jobs: int | None, force: bool) -> bool:
+    """
+    Assemble the stdlib sources whose objects are out of date, in
+    parallel. Returns whether the archive has to be written again.
+    """
+    toolchain = Toolchain(libs_dir_path=LIBS_OBJECTS_DIR_PATH, use_nasm=use_nasm)
+    manifest = load_manifest()
+    archived = set(manifest)
+
+    hashes = {get_object_name(path): get_source_hash(path, toolchain) for path in sources}
+    stale = [
+        path for path in sources
+        if force
+            or manifest.get(get_object_name(path)) != hashes[get_object_name(path)]
+            or not (OBJECTS_DIR_PATH / get_object_name(path)).is_file()
+    ]
+
+    for path in sorted(set(sources) - set(stale)):
+        print(f"[bold green][INFO][reset]: Lib '{path}' is up to date")
+
+    errors = False
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(assemble_source, path, OBJECTS_DIR_PATH / get_object_name(path), use_nasm)
+            for path in stale
+        ]
+
+        for future in as_completed(futures):
+            path, error = future.result()
+
+            if error is not None:
+                print(f"[bold red][ERROR][reset]: Caught the following error when compiling lib '{path}'\n{error}")
+                errors = True
+                continue
+
+            print(f"[bold green][INFO][reset]: Compiled lib '{path}'")
+            manifest[get_object_name(path)] = hashes[get_object_name(path)]
+
+    # Objects of removed sources
+    for name in sorted(set(manifest) - set(hashes)):
+        (OBJECTS_DIR_PATH / name).unlink(missing_ok=True)
+        del manifest[name]
+
+    write_atomically(MANIFEST_PATH, json.dumps(manifest, indent=4, sort_keys=True).encode())
+
+    if errors:
+        exit(1)
+
+    return bool(stale) or set(manifest) != archived or not ARCHIVE_PATH.is_file()
+
+def archive_libs(sources: list[Path]) -> None:
+    """
+    Package the stdlib objects into the static archive, with the symbol
+    index the linkers use to pull in only the members a program needs.
+    """
+    members = [
+        (get_object_name(path), (OBJECTS_DIR_PATH / get_object_name(path)).read_bytes())
+        for path in sources
+    ]
+
+    with tempfile.NamedTemporaryFile(dir=ARCHIVE_PATH.parent, prefix=f".{ARCHIVE_PATH.name}.", delete=False) as output:
+        write_archive(members=members, output=output)
+
+    os.chmod(output.name, 0o644)
+    os.replace(output.name, ARCHIVE_PATH)
+
+    print(f"[bold green][INFO][reset]: Archived {len(members)} lib(s) into '{ARCHIVE_PATH}'")
+
+def remove_legacy_objects() -> None:
+    """
+    Remove the loose objects of the libraries directory, which would be
+    linked before the archive.
+    """
+    for object_path in sorted(LIBS_OBJECTS_DIR_PATH.glob("*.o")):
+        print(f"[bold green][INFO][reset]: Removing the legacy object '{object_path}'...")
+
+        object_path.unlink()
 
 def run() -> None:
-    if not os.path.exists(LIBS_OBJECTS_DIR_PATH):
-        print(f"[bold green][INFO][reset]: Creating directory '{LIBS_OBJECTS_DIR_PATH}'...")
+    parser = argparse.ArgumentParser(description="Compile the stdlib into a static archive.")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Number of parallel assembler processes (default: number of CPUs).")
+    parser.add_argument("--nasm", action="store_true", help="Assemble with nasm instead of the built-in assembler.")
+    parser.add_argument("--force", action="store_true", help="Assemble every lib, even the up to date ones.")
+
+    args = parser.parse_args()
+
+    if not OBJECTS_DIR_PATH.exists():
+        print(f"[bold green][INFO][reset]: Creating directory '{OBJECTS_DIR_PATH}'...")
 
-        os.mkdir(LIBS_OBJECTS_DIR_PATH)
+        OBJECTS_DIR_PATH.mkdir(parents=True)
 
     print(
         f"[bold green][INFO][reset]: Compiling std libraries"
     )
-    compile_libs_to_object()
+
+    sources = discover_sources()
+
+    if compile_libs_to_object(sources=sources, use_nasm=args.nasm, jobs=args.jobs, force=args.force):
+        archive_libs(sources=sources)
+    else:
+        print(f"[bold green][INFO][reset]: '{ARCHIVE_PATH}' is up to date")
+
+    remove_legacy_objects()
 
 if __name__ == "__main__":
     run()
@@ -24,166 +24,360 @@
 
 import os
 import sys
+import time
+import shutil
+import hashlib
+import argparse
+import tempfile
 import tomllib
 import subprocess
 
 from rich import print
+from rich.table import Table
 from pathlib import Path
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Toolchain
+from manv.toolchain import Toolchain, ToolchainError
+
+# Build cache
+from manv.cache import BuildCache
+
+# Instructions counter
+from manv.bench import open_instructions_counter, read_instructions_counter
 
 class Test:
     """
     Test class for holding info about each test
     """
     test_file_path          : str
-    test_file_object_path   : str
-    binary_file_path        : str
-    lib_file_path           : str
-    lib_object_path         : str
-    
-    stdout                  : str | None = None
-    stderr                  : str | None = None
+    binary_file_path        : str | None = None     # A temporary file when None
+    lib_file_path           : str | None = None
+    timeout                 : float | None = None   # Seconds, '--timeout' when None
+
+    # Objects are kept in the build cache, these are only read for compatibility
+    test_file_object_path   : str | None = None
+    lib_object_path         : str | None = None
+
+    stdout                  : list[str] = []
+    stderr                  : list[str] = []
+
+    # Performance budgets, not enforced when None
+    max_wall_time           : float | None = None   # Seconds, best of WALL_TIME_RUNS runs
+    max_instructions        : int | None = None     # Instructions retired, when perf counters are available
+    max_binary_size         : int | None = None     # Bytes
 
     def load_toml(self, toml: dict) -> None:
         """
         Load attributes value from toml.
         """
         for att in self.__annotations__:
-            setattr(self, att, toml["Test"][att])
-          
+            if att in toml["Test"]:
+                setattr(self, att, toml["Test"][att])
+
+@dataclass
+class Options:
+    """
+    Options of the workers.
+    """
+    use_nasm: bool = False
+    use_ld: bool = False
+    use_cache: bool = True
+    timeout: float = 10.0
+    work_dir_path: Path | None = None   # Where the objects and binaries of a run go
+
 def list_files_in_directory(directory: str) -> list[str]:
     return [str(file) for file in Path(directory).rglob('*') if file.is_file()]
 
 TESTS_PATH = "./tests"
 
-TESTS: list[Test] = list()
+# Runs of a test with a wall time budget, the fastest one is compared
+WALL_TIME_RUNS = 3
 
-def generate_test_objects() -> None:
+# Files of the test directory that aren't test descriptions
+SKIPPED_SUFFIXES = (".asm", ".o", ".mv", ".py", ".pyc", ".json")
+
+def generate_test_objects(tests_path: str = TESTS_PATH) -> list[Test]:
     """
-    Generate Test objects
+    Generate Test objects from the TOML files with a [Test] table.
     """
-    files = list_files_in_directory(directory=TESTS_PATH)
-    
-    for file in files:
-        # Skip asm files
-        if file.endswith(".asm") or file.endswith(".o") or file.endswith(".mv"):
-          continue
-        
-        # Skip binary files
+    tests = []
+
+    for file in sorted(list_files_in_directory(directory=tests_path)):
+        if file.endswith(SKIPPED_SUFFIXES):
+            continue
+
         try:
-            open(file, "rb").readline().decode('utf-8')
-        except Exception as e:
-          continue
-        
-        with open(file, "rb") as f:
-            test_config = tomllib.load(f)
-            
-            test = Test()
-            test.load_toml(test_config)
-
-            TESTS.append(test)
-      
-def compile_test_file_to_object(test_file_path: str, test_file_object_path: str) -> None:
-    """
-    Compile the test file into an object file
-    """
-    out = subprocess.run(
-      ["nasm", "-f", "elf64", test_file_path, "-o", test_file_object_path]
-    )
-
-    if out.stderr:
-        print(f"[bold red][ERROR][reset]: Caught the following error while trying to compile '{test_file_path}' \n{out.stderr.decode()}")
-        sys.exit(1)
+            with open(file, "rb") as f:
+                test_config = tomllib.load(f)
+        except (UnicodeDecodeError, tomllib.TOMLDecodeError):
+            continue
+
+        if "Test" not in test_config:
+            continue
+
+        test = Test()
+        test.load_toml(test_config)
 
-def compile_lib_file_to_object(lib_file_path: str, lib_object_path: str) -> None:
+        tests.append(test)
+
+    return tests
+
+def get_toolchain(options: Options) -> Toolchain:
+    return Toolchain(libs_dir_path=options.work_dir_path / "libs", use_nasm=options.use_nasm, use_ld=options.use_ld)
+
+def assemble_file(file_path: str, options: Options) -> tuple[str, Path | None, bool, str | None]:
     """
-    Compile the test file into an object file
+    Assemble a test or library file, once per content: the object is
+    restored from the build cache when the same source was assembled
+    before. Returns the object path (None on error), whether it came from
+    the cache and the error.
     """
-    out = subprocess.run(
-      ["nasm", "-f", "elf64", lib_file_path, "-o", lib_object_path]
-    )
+    source = Path(file_path).read_bytes()
+    toolchain = get_toolchain(options=options)
+    cache = BuildCache() if options.use_cache else None
 
-    if out.stderr:
-        print(f"[bold red][ERROR][reset]: Caught the following error while trying to compile '{lib_file_path}' \n{out.stderr.decode()}")
-        sys.exit(1)
-    
-def link_test_file_with_lib(test_file_object_path: str, lib_object_path: str, binary_file_path: str) -> None:
+    key = cache.key("test-obj", source, *toolchain.assembler_flags()) if cache is not None else None
+    object_path = options.work_dir_path / f"{Path(file_path).stem}-{hashlib.sha256(file_path.encode()).hexdigest()[:8]}.o"
+
+    data = cache.get(key) if cache is not None else None
+
+    if data is not None:
+        object_path.write_bytes(data)
+        return file_path, object_path, True, None
+
+    try:
+        obj = toolchain.assemble(asm=source.decode(), asm_path=Path(file_path), object_path=object_path)
+    except ToolchainError as error:
+        return file_path, None, False, str(error)
+
+    data = object_path.read_bytes() if obj is None else Toolchain.serialize(obj)
+    object_path.write_bytes(data)
+
+    if cache is not None:
+        cache.put(key, data)
+
+    return file_path, object_path, False, None
+
+def run_test_file(test: Test, object_paths: dict[str, Path], options: Options) -> dict:
     """
-    Link the test file object with the library object file.
+    Link a test with its library, run it and check its output.
     """
-    out = subprocess.run(
-      ["ld", "-s", "-o", binary_file_path, test_file_object_path, lib_object_path]
-    )
+    start = time.perf_counter()
+    result = {"test": test.test_file_path, "status": "PASS", "message": None}
 
-    if out.stderr:
-        print(f"[bold red][ERROR][reset]: Caught the following error while trying to link '{test_file_object_path}' and '{lib_object_path}' \n{out.stderr.decode()}")
-        sys.exit(1)
+    binary_file_path = Path(test.binary_file_path) if test.binary_file_path else options.work_dir_path / f"{Path(test.test_file_path).stem}-{os.getpid()}-{time.monotonic_ns()}"
+    paths = [object_paths[test.test_file_path]]
+
+    if test.lib_file_path:
+        paths.append(object_paths[test.lib_file_path])
+
+    try:
+        get_toolchain(options=options).link(objects=[None] * len(paths), object_paths=paths, output_path=binary_file_path)
 
-def run_test_file(test: Test) -> None:
-    """
-    Run a test file
-    """
-    # Compile the test file into an object file
-    compile_test_file_to_object(
-      test_file_path=test.test_file_path,
-      test_file_object_path=test.test_file_object_path
-    )
-
-    # Compile the lib
-    compile_lib_file_to_object(
-      lib_file_path=test.lib_file_path,
-      lib_object_path=test.lib_object_path
-    )
-
-    # Link with library
-    link_test_file_with_lib(
-      test_file_object_path=test.test_file_object_path,
-      lib_object_path=test.lib_object_path,
-      binary_file_path=test.binary_file_path
-    )
-
-    # Run the test file
-    print(f"[bold green][INFO][reset]: Running test '{test.test_file_path}'...", end=" ")
-    
-    out = subprocess.run(
-      [f"{test.binary_file_path}"],
-      stdout=subprocess.PIPE,
-      stderr=subprocess.PIPE
-    )
-
-    # Check the stderr
-    stderr_output = out.stderr.decode().strip()
-    expected_stderr = "\n".join(test.stderr).strip()
-
-    if stderr_output != expected_stderr:
-        print("[bold red]FAILD[reset]")
-        print(
-            f"[bold yellow][WARNING][reset]: Expected stderr from test '{test.test_file_path}'\n"
-            f"\t STDERR = {expected_stderr}"
+        counter_fd = open_instructions_counter() if test.max_instructions is not None else None
+        wall_time = time.perf_counter()
+
+        out = subprocess.run(
+            [str(binary_file_path.resolve())],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=test.timeout or options.timeout
         )
-        sys.exit(1)
-      
-    # Check the stdout
-    stdout_output = out.stdout.decode().strip()
-    expected_stdout = "\n".join(test.stdout).strip()
-
-    if stdout_output != expected_stdout:
-        print("[bold red]FAILD[reset]")
-        print(
-            f"[bold yellow][WARNING][reset]: Expected stdout from test '{test.test_file_path}'\n"
-            f"\t STDOUT = {out.stdout.decode() if out.stdout.decode() != '' else None}"
+
+        wall_time = time.perf_counter() - wall_time
+        instructions = read_instructions_counter(counter_fd) if counter_fd is not None else None
+    except ToolchainError as error:
+        result.update(status="ERROR", message=str(error))
+    except subprocess.TimeoutExpired:
+        result.update(status="TIMEOUT", message=f"Ran for more than {test.timeout or options.timeout} seconds")
+    else:
+        # Check the stderr, then the stdout
+        for name, output, expected in (("stderr", out.stderr, test.stderr), ("stdout", out.stdout, test.stdout)):
+            output = output.decode().strip()
+            expected = "\n".join(expected).strip()
+
+            if output != expected:
+                result.update(
+                    status="FAIL",
+                    message=f"Expected {name} from test '{test.test_file_path}'\n\t {name.upper()} = {expected!r}\n\t GOT = {output!r}"
+                )
+                break
+
+        if result["status"] == "PASS":
+            try:
+                result["budgets"] = check_budgets(
+                    test=test,
+                    binary_file_path=binary_file_path,
+                    wall_time=wall_time,
+                    instructions=instructions,
+                    options=options
+                )
+            except subprocess.TimeoutExpired:
+                result.update(status="TIMEOUT", message=f"Ran for more than {test.timeout or options.timeout} seconds when measuring its wall time")
+                result["budgets"] = []
+
+            over = [budget for budget in result["budgets"] if budget["over"]]
+
+            if over:
+                result.update(
+                    status="BUDGET",
+                    message="Over its budget of " + ", ".join(f"{budget['metric']} ({budget['measured']} > {budget['budget']})" for budget in over)
+                )
+
+    result["seconds"] = time.perf_counter() - start
+
+    return result
+
+def check_budgets(test: Test, binary_file_path: Path, wall_time: float, instructions: int | None, options: Options) -> list[dict]:
+    """
+    Measure a passing test against its performance budgets.
+    """
+    budgets = []
+
+    if test.max_wall_time is not None:
+        for _ in range(WALL_TIME_RUNS - 1):
+            start = time.perf_counter()
+            subprocess.run([str(binary_file_path.resolve())], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=test.timeout or options.timeout)
+            wall_time = min(wall_time, time.perf_counter() - start)
+
+        budgets.append({"metric": "wall_time", "budget": test.max_wall_time, "measured": round(wall_time, 6)})
+
+    if test.max_instructions is not None:
+        # Not enforced without perf counters
+        budgets.append({"metric": "instructions", "budget": test.max_instructions, "measured": instructions})
+
+    if test.max_binary_size is not None:
+        budgets.append({"metric": "binary_size", "budget": test.max_binary_size, "measured": binary_file_path.stat().st_size})
+
+    for budget in budgets:
+        budget["over"] = budget["measured"] is not None and budget["measured"] > budget["budget"]
+
+    return budgets
+
+def run_tests(tests: list[Test], options: Options, jobs: int | None = None) -> list[dict]:
+    """
+    Assemble every distinct test and library file once, then link and run
+    the tests on a pool of workers, reporting each one as it finishes.
+    """
+    results = []
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        sources = dict.fromkeys(
+            path
+            for test in tests
+            for path in (test.test_file_path, test.lib_file_path)
+            if path
         )
-        sys.exit(1)
 
-    print("[bold green]PASS[reset]")
+        object_paths = {}
+
+        for future in as_completed([executor.submit(assemble_file, source, options) for source in sources]):
+            source, object_path, cached, error = future.result()
+
+            if error is not None:
+                print(f"[bold red][ERROR][reset]: Caught the following error while trying to compile '{source}' \n{error}")
+                continue
+
+            object_paths[source] = object_path
+
+            print(f"[bold green][INFO][reset]: {'Restored' if cached else 'Assembled'} '{source}'")
+
+        futures = {}
+
+        for test in tests:
+            missing = [path for path in (test.test_file_path, test.lib_file_path) if path and path not in object_paths]
+
+            if missing:
+                results.append({"test": test.test_file_path, "status": "ERROR", "seconds": 0.0, "message": f"Couldn't assemble {', '.join(missing)}"})
+                report(results[-1])
+                continue
+
+            futures[executor.submit(run_test_file, test, object_paths, options)] = test
+
+        for future in as_completed(futures):
+            results.append(future.result())
+            report(results[-1])
+
+    return results
+
+def report(result: dict) -> None:
+    """
+    Show the result of a test.
+    """
+    color = "green" if result["status"] == "PASS" else "red"
+
+    print(f"[bold green][INFO][reset]: Running test '{result['test']}'... [bold {color}]{result['status']}[reset] ({result['seconds'] * 1000:.1f} ms)")
+
+    if result["message"]:
+        print(f"[bold yellow][WARNING][reset]: {result['message']}")
+
+def show_budgets(results: list[dict]) -> None:
+    """
+    Show the measures of the tests with performance budgets.
+    """
+    rows = [(result, budget) for result in sorted(results, key=lambda result: result["test"]) for budget in result.get("budgets", [])]
+
+    if not rows:
+        return
+
+    table = Table("test", "metric", "budget", "measured", "used")
+
+    for result, budget in rows:
+        measured = budget["measured"]
+        used = f"{measured / budget['budget'] * 100:.0f}%" if measured is not None and budget["budget"] else "-"
+
+        table.add_row(
+            result["test"],
+            budget["metric"],
+            str(budget["budget"]),
+            "-" if measured is None else str(measured),
+            f"[red]{used}[reset]" if budget["over"] else used
+        )
+
+    print(table)
+
+    if any(budget["metric"] == "instructions" and budget["measured"] is None for _, budget in rows):
+        print(f"[bold yellow][WARNING][reset]: Perf counters aren't available, the instructions budgets weren't enforced.")
 
 def run() -> None:
+    parser = argparse.ArgumentParser(description="Run the assembly tests described by TOML files.")
+    parser.add_argument("tests_path", nargs="?", default=TESTS_PATH, help="Directory of the tests.")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="The number of workers, the number of CPUs by default.")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Seconds a test can run for, unless it sets its own.")
+    parser.add_argument("--nasm", action="store_true", help="Assemble with nasm instead of the built-in assembler.")
+    parser.add_argument("--ld", action="store_true", help="Link with ld instead of the built-in linker.")
+    parser.add_argument("--no-cache", action="store_true", help="Don't use the build cache.")
+    args = parser.parse_args()
+
     # Generate test objects
     print(f"[bold green][INFO][reset]: Generating tests objects...")
-    generate_test_objects()
+    tests = generate_test_objects(tests_path=args.tests_path)
+
+    work_dir_path = Path(tempfile.mkdtemp(prefix="manv-tests-"))
+    start = time.perf_counter()
+
+    try:
+        # Run tests
+        results = run_tests(
+            tests=tests,
+            options=Options(use_nasm=args.nasm, use_ld=args.ld, use_cache=not args.no_cache, timeout=args.timeout, work_dir_path=work_dir_path),
+            jobs=args.jobs
+        )
+    finally:
+        shutil.rmtree(work_dir_path, ignore_errors=True)
+
+    show_budgets(results=results)
+
+    failed = [result for result in results if result["status"] != "PASS"]
 
-    # Run tests
-    for test in TESTS:
-        run_test_file(test=test)
+    print(f"[bold green][INFO][reset]: {len(results) - len(failed)} passed, {len(failed)} failed in {time.perf_counter() - start:.2f} s")
+
+    if failed:
+        sys.exit(1)
 
 if __name__ == "__main__":
   run()
@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+
+# MIT License
+
+# Copyright (c) 2025 ramsy0dev
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys
+import json
+
+from rich import print
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Compiler
+from manv.compiler import generate_assembly
+
+# Codegen metrics
+from manv.metrics import codegen_metrics
+
+# Logs
+from manv.log import configure
+
+CORPUS_DIR_PATH = Path(__file__).parent.parent / "tests" / "codegen"
+METRICS_PATH = CORPUS_DIR_PATH / "metrics.json"
+
+def collect_metrics() -> dict[str, dict[str, int]]:
+    """
+    Metrics of every program of the corpus.
+    """
+    return {
+        path.name: codegen_metrics(generate_assembly(file_path=path))
+        for path in sorted(CORPUS_DIR_PATH.glob("*.mv"))
+    }
+
+def run() -> None:
+    configure(level="error")
+
+    old = json.loads(METRICS_PATH.read_text()) if METRICS_PATH.exists() else {}
+    new = collect_metrics()
+
+    for name, metrics in new.items():
+        for metric, value in metrics.items():
+            previous = old.get(name, {}).get(metric)
+
+            if previous != value:
+                print(f"[bold green][INFO][reset]: {name} {metric}: {previous} -> {value}")
+
+    METRICS_PATH.write_text(json.dumps(new, indent=4) + "\n")
+
+    print(f"[bold green][INFO][reset]: Updated the metrics of {len(new)} programs in '{METRICS_PATH}'")
+
+if __name__ == "__main__":
+    run()
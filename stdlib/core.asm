@@ -23,11 +23,11 @@
 ; file: ./stdlib/code.asm
 ; description: The core library for manv
 
-section .data
-
-section .text
 global exit
 
+; Each function in its own section, so only the functions a program
+; reaches are linked (--gc-sections)
+section .text.exit progbits alloc exec nowrite align=16
 exit:
     ; -- function:
     ;   -> name: exit
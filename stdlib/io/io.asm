@@ -23,22 +23,25 @@
 ; file: stdlib/io/io.asm
 ; description: I/O library
 
-section .data
-    ; Errors code
-    invalid_text_error_code     equ 0       ; Error code for invalid text (print function)
-    invalid_text_len_error_code equ 1       ; Error code for invalid text length (print function)
+; Each function and its data are in their own sections, so only the
+; functions a program reaches are linked (--gc-sections)
 
+; Errors code
+invalid_text_error_code     equ 0       ; Error code for invalid text (print function)
+invalid_text_len_error_code equ 1       ; Error code for invalid text length (print function)
+
+section .rodata.print progbits alloc noexec nowrite align=4
     ; Errors messages
     invalid_text_error_msg      db "Invalid text", 0xA         ; Error message for invalid text (print function)
     invalid_text_len_error_msg  db "Invalid text length", 0xA  ; Error message for invalid text length (print function)
 
-section .text
-global print, printi, exit, flush_stderr, flush_stdout
+global print, printi, flush_stderr, flush_stdout
 
 ; ---------------------------------------------- ;
 ;       Builtin functions implementations        ;
 ; ---------------------------------------------- ;
 
+section .text.flush progbits alloc exec nowrite align=16
 flush:
     ; -- function:
     ;   -> name: flush
@@ -53,6 +56,9 @@ flush:
     call flush_stdout
     call flush_stderr
 
+    ret
+
+section .text.flush_stdout progbits alloc exec nowrite align=16
 flush_stdout:
     ; -- function:
     ;   -> name: flush_stdout
@@ -68,6 +74,9 @@ flush_stdout:
     mov rdi, 1
     syscall
 
+    ret
+
+section .text.flush_stderr progbits alloc exec nowrite align=16
 flush_stderr:
     ; -- function:
     ;   -> name: flush_stderr
@@ -83,6 +92,9 @@ flush_stderr:
     mov rdi, 2
     syscall
 
+    ret
+
+section .text.printi progbits alloc exec nowrite align=16
 printi:
     ; -- function:
     ;   -> name: printi
@@ -126,6 +138,7 @@ printi:
     add     rsp, 40
     ret
 
+section .text.print progbits alloc exec nowrite align=16
 print:
     ; -- function:
     ;   -> name: print
@@ -188,8 +201,3 @@ print:
     syscall
 
     ret
-
-exit:
-    mov rax, 60
-    mov rdi, 0
-    syscall
@@ -0,0 +1,84 @@
+import io
+import os
+import sys
+import pytest
+import subprocess
+
+# Assembler
+from manv.src.assembler.assembler import Assembler
+from manv.src.assembler.elf import write_object
+
+# Linker
+from manv.src.linker.linker import Linker
+from manv.src.linker.archive import write_archive, read_archive
+
+def assemble(source: list[str], source_name: str) -> bytes:
+    """
+    Assemble a source into the bytes of its object file.
+    """
+    output = io.BytesIO()
+    write_object(obj=Assembler().assemble(lines=source, source_name=source_name), output=output)
+
+    return output.getvalue()
+
+PROGRAM = [
+    "section .text\n",
+    "extern exit\n",
+    "global _start\n",
+    "_start:\n",
+    "\tmov rdi, 42\n",
+    "\tcall exit\n",
+]
+
+EXIT = [
+    "section .text\n",
+    "global exit\n",
+    "exit:\n",
+    "\tmov rax, 60\n",
+    "\tsyscall\n",
+]
+
+UNUSED = [
+    "section .text\n",
+    "global unused\n",
+    "unused:\n",
+    "\tret\n",
+]
+
+# Test units
+def test_read_archive() -> None:
+    """
+    Test that a written archive is read back with its symbol index.
+    """
+    members = [("exit.o", assemble(EXIT, "exit.asm")), ("a_long_member_name.o", assemble(UNUSED, "unused.asm"))]
+    output = io.BytesIO()
+
+    write_archive(members=members, output=output)
+    archive = read_archive(data=output.getvalue(), name="libtest.a")
+
+    assert sorted(archive.members.values()) == sorted(members)
+    assert archive.members[archive.symbols["exit"]][0] == "exit.o"
+    assert archive.members[archive.symbols["unused"]][0] == "a_long_member_name.o"
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Runs a Linux executable")
+def test_link_needed_members(tmp_path) -> None:
+    """
+    Test that only the archive members defining a needed symbol are linked.
+    """
+    with open(tmp_path / "libtest.a", "wb") as output:
+        write_archive(members=[("unused.o", assemble(UNUSED, "unused.asm")), ("exit.o", assemble(EXIT, "exit.asm"))], output=output)
+
+    linker = Linker()
+    linker.add_object(Assembler().assemble(lines=PROGRAM, source_name="program.asm"))
+    linker.add_library_dir(tmp_path)
+
+    assert [obj.source_name for obj in linker.get_linked_objects()][1:] == [f"{(tmp_path / 'libtest.a').resolve()}(exit.o)"]
+
+    executable_path = tmp_path / "program"
+
+    with open(executable_path, "wb") as output:
+        linker.link(output=output)
+
+    os.chmod(executable_path, 0o755)
+
+    assert subprocess.run([executable_path]).returncode == 42
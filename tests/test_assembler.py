@@ -0,0 +1,101 @@
+import io
+import pytest
+
+# Assembler
+from manv.src.assembler.assembler import Assembler
+from manv.src.assembler.elf import write_object, R_X86_64_32S, R_X86_64_64
+from manv.src.assembler.exceptions import AssemblerError
+
+def assemble(source: list[str]):
+    """
+    Assemble a source into an object file.
+    """
+    return Assembler().assemble(lines=source, source_name="test.asm")
+
+def get_text(source: list[str]) -> bytes:
+    """
+    The bytes of the '.text' section of an assembled source.
+    """
+    obj = assemble(["section .text\n"] + source)
+
+    return bytes(next(section for section in obj.sections if section.name == ".text").data)
+
+# Test units
+def test_encode_instructions() -> None:
+    """
+    Test the encoding of the instructions generated by the codegen.
+    """
+    instructions_map = {
+        "mov rax, 60\n": "b83c000000",
+        "mov rax, -1\n": "48c7c0ffffffff",
+        "mov r9, -3689348814741910323\n": "49b9cdcccccccccccccc",
+        "mov BYTE [rsp+31], 10\n": "c644241f0a",
+        "lea rsi, [rsp+32+rdx]\n": "488d741420",
+        "xor rcx, rcx\n": "4831c9",
+        "add rax, 7\n": "4883c007",
+        "cmp rax, 3000\n": "483db80b0000",
+        "imul rax, rbx\n": "480fafc3",
+        "cqo\n": "4899",
+        "setg al\n": "0f9fc0",
+        "movzx eax, al\n": "0fb6c0",
+        "cmovge rax, rdx\n": "480f4dc2",
+        "push r12\n": "4154",
+        "movdqa xmm0, [rbx+rcx*8]\n": "660f6f04cb",
+        "vpaddq ymm0, ymm0, [rbx+rcx*8]\n": "c5fdd404cb",
+        "vmovdqa ymm8, [r8+rcx*8]\n": "c4417d6f04c8",
+    }
+
+    for instruction, code in instructions_map.items():
+        assert get_text([instruction]).hex() == code, instruction
+
+def test_jumps_relaxation() -> None:
+    """
+    Test that jumps are short unless their target is out of range.
+    """
+    assert get_text(["start:\n", "jmp start\n"]).hex() == "ebfe"
+
+    code = get_text(["jne far\n", "times 200 nop\n", "far:\n"])
+
+    assert code[:6].hex() == "0f85c8000000"
+    assert len(code) == 206
+
+def test_relocations() -> None:
+    """
+    Test the relocations of data references and jump tables.
+    """
+    obj = assemble([
+        "section .data\n",
+        "\tx dq 5\n",
+        "\ty dq 1.5\n",
+        "section .rodata\n",
+        "table:\n",
+        "\tdq case\n",
+        "section .text\n",
+        "global _start\n",
+        "_start:\n",
+        "\tmov rax, [y]\n",
+        "case:\n",
+        "\tret\n",
+    ])
+
+    sections = {section.name: section for section in obj.sections}
+
+    assert bytes(sections[".data"].data) == (5).to_bytes(8, "little") + bytes.fromhex("000000000000f83f")
+
+    relocation = sections[".text"].relocations[0]
+    assert (relocation.offset, relocation.type, relocation.symbol, relocation.addend) == (4, R_X86_64_32S, ".data", 8)
+
+    relocation = sections[".rodata"].relocations[0]
+    assert (relocation.type, relocation.symbol, relocation.addend) == (R_X86_64_64, ".text", 8)
+
+    output = io.BytesIO()
+    write_object(obj=obj, output=output)
+
+    assert output.getvalue()[:4] == b"\x7fELF"
+
+def test_undefined_symbol() -> None:
+    """
+    Test that a reference to an undefined symbol is an error.
+    """
+    with pytest.raises(AssemblerError):
+        assemble(["section .text\n", "call nowhere\n"])
@@ -0,0 +1,64 @@
+import sys
+import pytest
+import subprocess
+
+# Batch compilation
+from manv.batch import compile_many, expand_sources, BatchOptions
+
+def write_program(path, code: int) -> None:
+    """
+    Write a program exiting with a code.
+    """
+    path.write_text(
+        "const SYS_EXIT: int = 60;\n"
+        f"const CODE: int = {code};\n"
+        "var ERRNO: int;\n"
+        "syscall SYS_EXIT, CODE, ERRNO;\n"
+    )
+
+# Test units
+@pytest.mark.skipif(sys.platform != "linux", reason="Runs a Linux executable")
+def test_compile_many(tmp_path) -> None:
+    """
+    Test that every program of a batch is compiled and reported.
+    """
+    for code in range(4):
+        write_program(tmp_path / f"program{code}.mv", code)
+
+    (tmp_path / "broken.mv").write_text("syscall X, Y;\n")
+
+    report = compile_many(
+        file_paths=expand_sources(patterns=[str(tmp_path / "*.mv")]),
+        options=BatchOptions(libs_dir_path=tmp_path / "libs", output_dir_path=tmp_path / "out", use_cache=False),
+        jobs=2
+    )
+
+    assert (report["compiled"], report["failed"]) == (4, 1)
+    assert [result["status"] for result in report["results"]] == ["error", "ok", "ok", "ok", "ok"]
+
+    for code in range(4):
+        assert subprocess.run([tmp_path / "out" / f"program{code}"]).returncode == code
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Runs a Linux executable")
+def test_compile_many_crash(tmp_path) -> None:
+    """
+    Test that a source crashing the compiler is reported as an error and
+    the rest of the batch is still compiled.
+    """
+    for code in range(2):
+        write_program(tmp_path / f"program{code}.mv", code)
+
+    (tmp_path / "binary.mv").write_bytes(b"\xff\xfe\x00")
+
+    report = compile_many(
+        file_paths=expand_sources(patterns=[str(tmp_path / "*.mv")]),
+        options=BatchOptions(libs_dir_path=tmp_path / "libs", output_dir_path=tmp_path / "out", use_cache=False),
+        jobs=1
+    )
+
+    assert (report["compiled"], report["failed"]) == (2, 1)
+    assert report["results"][0]["status"] == "error"
+    assert report["results"][0]["error"].startswith("UnicodeDecodeError")
+
+    for code in range(2):
+        assert subprocess.run([tmp_path / "out" / f"program{code}"]).returncode == code
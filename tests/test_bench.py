@@ -0,0 +1,53 @@
+import sys
+import pytest
+
+# Lexer
+from manv.src.lexer.lexer import Lexer
+
+# Parser
+from manv.src.parser.parser import Parser
+
+# Codegen
+from manv.src.codegen.codegen import Codegen
+
+# Toolchain
+from manv.toolchain import Toolchain
+
+# Runtime benchmarks
+from manv.bench import benchmark, percentile
+
+SOURCE = [
+    "const SYS_EXIT: int = 60;\n",
+    "const CODE: int = 9;\n",
+    "var ERRNO: int;\n",
+    "syscall SYS_EXIT, CODE, ERRNO;\n",
+]
+
+# Test units
+def test_percentile() -> None:
+    """
+    Test the nearest-rank percentiles.
+    """
+    values = list(range(1, 101))
+
+    assert percentile(values, 0.50) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile([7], 0.90) == 7
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Runs a Linux executable")
+def test_benchmark_executable(tmp_path) -> None:
+    """
+    Test that the runs of an executable are measured.
+    """
+    asm = Codegen().codegen(program=Parser().parse(tokens=Lexer().generate_tokens(data=SOURCE)))
+
+    Toolchain(libs_dir_path=tmp_path / "libs").build(asm=asm, name="program", output_path=tmp_path / "program")
+
+    result = benchmark(executable_path=tmp_path / "program", runs=5, warmup=1)
+
+    assert result["exit_codes"] == [9]
+    assert 0 < result["wall"]["min"] <= result["wall"]["median"] <= result["wall"]["p99"]
+
+    # A static executable that only exits stays far under a MiB
+    if result["max_rss"] is not None:
+        assert result["max_rss"] < 1 << 20
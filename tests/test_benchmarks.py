@@ -0,0 +1,44 @@
+import pytest
+
+# Lexer
+from manv.src.lexer.lexer import Lexer
+
+# Parser
+from manv.src.parser.parser import Parser
+
+# Codegen
+from manv.src.codegen.codegen import Codegen
+
+# Benchmarks
+from benchmarks.generators import GENERATORS, generate
+from benchmarks.run import compare
+
+# Test units
+@pytest.mark.parametrize("shape", GENERATORS)
+def test_generated_programs_compile(shape) -> None:
+    """
+    Test that the generated programs have the requested size and go through
+    the front end.
+    """
+    source = generate(shape=shape, lines=500)
+
+    assert len(source) == 500
+
+    asm = Codegen().codegen(program=Parser().parse(tokens=Lexer().generate_tokens(data=source)))
+
+    assert "_start:" in asm.get_assembly()
+
+def test_compare_to_baseline() -> None:
+    """
+    Test that only the metrics grown over the threshold are regressions.
+    """
+    baseline = {"consts/1000": {"lex": 1.0, "peak_rss": 100}}
+    results = {
+        "consts/1000": {"lex": 1.05, "peak_rss": 150},
+        "if_else/1000": {"lex": 9.0},
+    }
+
+    regressions = compare(results=results, baseline=baseline, threshold=0.10)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("consts/1000 peak_rss")
@@ -0,0 +1,110 @@
+import os
+import sys
+import json
+import pytest
+import subprocess
+import multiprocessing
+
+# Lexer
+from manv.src.lexer.lexer import Lexer
+
+# Parser
+from manv.src.parser.parser import Parser
+
+# Codegen
+from manv.src.codegen.codegen import Codegen
+
+# Toolchain
+from manv.toolchain import Toolchain
+
+# Build cache
+from manv.cache import BuildCache
+
+def record_hits(path, count: int) -> None:
+    """
+    Record hits from another process.
+    """
+    cache = BuildCache(path=path)
+
+    for _ in range(count):
+        cache.record(stage="obj", hit=True)
+
+SOURCE = [
+    "const SYS_EXIT: int = 60;\n",
+    "const CODE: int = 5;\n",
+    "var ERRNO: int;\n",
+    "syscall SYS_EXIT, CODE, ERRNO;\n",
+]
+
+# Test units
+@pytest.mark.skipif(sys.platform != "linux", reason="Runs a Linux executable")
+def test_restore_from_cache(tmp_path) -> None:
+    """
+    Test that a second build restores the object and the executable.
+    """
+    tokens = Lexer().generate_tokens(data=SOURCE)
+    asm = Codegen().codegen(program=Parser().parse(tokens=tokens)).get_assembly()
+
+    cache = BuildCache(path=tmp_path / "cache")
+
+    for name in ("first", "second"):
+        toolchain = Toolchain(libs_dir_path=tmp_path / "libs")
+        toolchain.build(asm=asm, name=name, output_path=tmp_path / name, cache=cache)
+
+    # Nothing was assembled or linked the second time
+    assert toolchain.timings == {}
+    assert (tmp_path / "first").read_bytes() == (tmp_path / "second").read_bytes()
+    assert subprocess.run([tmp_path / "second"]).returncode == 5
+
+    stats = cache.stats()
+
+    assert stats["hits"] == {"obj": 1, "bin": 1}
+    assert stats["misses"] == {"obj": 1, "bin": 1}
+
+def test_evict_least_recently_used(tmp_path) -> None:
+    """
+    Test that the oldest entries are evicted once over the size cap.
+    """
+    cache = BuildCache(path=tmp_path, max_size=250)
+    keys = [cache.key("asm", str(i)) for i in range(3)]
+
+    for i, key in enumerate(keys):
+        cache.put(key, bytes(100))
+        os.utime(cache.entry_path(key), ns=(i, i))
+
+    cache.put(cache.key("asm", "3"), bytes(100))
+
+    assert [cache.get(key) is not None for key in keys] == [False, False, True]
+
+def test_put_tracks_size(tmp_path, monkeypatch) -> None:
+    """
+    Test that the size is tracked as entries are stored, without
+    rescanning the cache while under its size cap.
+    """
+    cache = BuildCache(path=tmp_path, max_size=1000)
+    cache.put(cache.key("asm", "0"), bytes(100))
+
+    monkeypatch.setattr(cache, "entries", lambda: pytest.fail("The cache was rescanned"))
+
+    cache.put(cache.key("asm", "1"), bytes(100))
+    cache.put(cache.key("asm", "1"), bytes(50))
+
+    assert json.loads((tmp_path / "stats.json").read_text())["size"] == 150
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Forks the recording processes")
+def test_record_concurrently(tmp_path) -> None:
+    """
+    Test that no hit is lost when many processes record at once.
+    """
+    processes = [
+        multiprocessing.Process(target=record_hits, args=(tmp_path, 50))
+        for _ in range(4)
+    ]
+
+    for process in processes:
+        process.start()
+
+    for process in processes:
+        process.join()
+
+    assert BuildCache(path=tmp_path).stats()["hits"] == {"obj": 200}
@@ -0,0 +1,353 @@
+import pytest
+
+# Lexer
+from manv.src.lexer.lexer import Lexer
+
+# Parser
+from manv.src.parser.parser import Parser
+
+# Codegen
+from manv.src.codegen.codegen import Codegen
+from manv.src.codegen.symbols import mangle_symbol, LabelAllocator
+
+def generate_assembly(source: list[str]) -> str:
+    """
+    Generate the assembly of a program source.
+    """
+    tokens = Lexer().generate_tokens(data=source)
+    program = Parser().parse(tokens=tokens)
+
+    return Codegen().codegen(program=program).get_assembly()
+
+# Test units
+def test_deterministic_assembly() -> None:
+    """
+    Test that the same program always generates the same assembly.
+    """
+    source = [
+        "const x: int = 5;\n",
+        "var m: int;\n",
+        "var ERRNO: int;\n",
+        "if (x == 1) {\n",
+        "    syscall 60, x, ERRNO;\n",
+        "} else {\n",
+        "    syscall 60, m, ERRNO;\n",
+        "}\n",
+    ]
+
+    assert generate_assembly(source) == generate_assembly(source)
+
+def test_mangle_symbol() -> None:
+    """
+    Test that reserved names are mangled and other identifiers are kept.
+    """
+    assert mangle_symbol("x") == "x"
+    assert mangle_symbol("rax") == "rax$"
+    assert mangle_symbol("main") == "main$"
+
+def test_label_allocator() -> None:
+    """
+    Test that labels are numbered per function.
+    """
+    labels = LabelAllocator()
+
+    assert labels.new(function="main", kind="if") == "main.if.0"
+    assert labels.new(function="main", kind="switch") == "main.switch.1"
+    assert labels.new(function="f", kind="if") == "f.if.0"
+
+def test_optimize_size() -> None:
+    """
+    Test that -Os merges identical constants, inlines 'main' in '_start'
+    and zeroes registers with a 32 bits 'xor'.
+    """
+    source = [
+        "const SYS_WRITE: int = 1;\n",
+        "const STDOUT: int = 1;\n",
+        "var ERRNO: int;\n",
+        "syscall SYS_WRITE, STDOUT, STDOUT, STDOUT, ERRNO;\n",
+    ]
+
+    tokens = Lexer().generate_tokens(data=source)
+    asm = Codegen(optimize_size=True).codegen(program=Parser().parse(tokens=tokens)).get_assembly()
+
+    assert "STDOUT:\n\tSYS_WRITE dq 1\n" in asm
+    assert asm.count("dq 1") == 1
+    assert "call main" not in asm
+    assert asm.endswith("\tmov rax, 60\n\txor edi, edi\n\tsyscall\n")
+
+def test_shorten_zero_immediates() -> None:
+    """
+    Test that only the immediates equal to zero, in any base, become a
+    32 bits 'xor'.
+    """
+    codegen = Codegen(optimize_size=True)
+    codegen.asm.section_text["_start"] = [
+        "\tmov rax, 0x0\n",
+        "\tmov rbx, 0b0\n",
+        "\tmov rcx, 0x10\n",
+        "\tmov rdx, 0x0x0\n",
+        "\tsyscall\n",
+    ]
+
+    codegen.shorten_encodings()
+
+    assert codegen.asm.section_text["_start"] == [
+        "\txor eax, eax\n",
+        "\txor ebx, ebx\n",
+        "\tmov rcx, 0x10\n",
+        "\tmov rdx, 0x0x0\n",
+        "\tsyscall\n",
+    ]
+
+def test_array_size_identifier() -> None:
+    """
+    Test that an array sized with an identifier keeps the scalar code.
+    """
+    source = [
+        "const n: int = 4;\n",
+        "var y[n]: float;\n",
+        "var ERRNO: int;\n",
+        "syscall 60, n, ERRNO;\n",
+    ]
+
+    assert "y resq n\n" in generate_assembly(source)
+
+def get_switch_source(values: list[int]) -> list[str]:
+    """
+    An if/else-if chain testing a variable against values, with a
+    default block.
+    """
+    source = [
+        "const SYS_EXIT: int = 60;\n",
+        "var x: int;\n",
+        "var ERRNO: int;\n",
+        f"if (x == {values[0]}) {{\n",
+        "syscall SYS_EXIT, 0, ERRNO;\n",
+    ]
+
+    for code, value in enumerate(values[1:], start=1):
+        source += [
+            f"}} else if (x == {value}) {{\n",
+            f"syscall SYS_EXIT, {code}, ERRNO;\n",
+        ]
+
+    return source + [
+        "} else {\n",
+        "syscall SYS_EXIT, 99, ERRNO;\n",
+        "}\n",
+    ]
+
+def test_switch_jump_table() -> None:
+    """
+    Test that a dense chain of equality tests dispatches through a jump
+    table after a bounds check.
+    """
+    asm = generate_assembly(get_switch_source(values=[1, 2, 3, 4]))
+
+    assert (
+        "section .rodata\n"
+        "main.switch.0.jump_table:\n"
+        "\tdq main.switch.0.case_0\n"
+        "\tdq main.switch.0.case_1\n"
+        "\tdq main.switch.0.case_2\n"
+        "\tdq main.switch.0.case_3\n"
+    ) in asm
+    assert (
+        "\tmov rax, [x]\n"
+        "\tsub rax, 1\n"
+        "\tcmp rax, 3\n"
+        "\tja main.switch.0.default\n"
+        "\tjmp [main.switch.0.jump_table + rax*8]\n"
+    ) in asm
+
+def test_switch_binary_search() -> None:
+    """
+    Test that a sparse chain of equality tests dispatches with a binary
+    search tree of compares and no jump table.
+    """
+    asm = generate_assembly(get_switch_source(values=[0, 100, 2000, 30000]))
+
+    assert "jump_table" not in asm
+    assert (
+        "\tmov rax, [x]\n"
+        "\tcmp rax, 2000\n"
+        "\tje main.switch.0.case_2\n"
+        "\tjg main.switch.0.case_2.greater\n"
+    ) in asm
+    assert "main.switch.0.case_2.greater:\n\tcmp rax, 30000\n\tje main.switch.0.case_3\n" in asm
+
+def test_short_chain_stays_if_else() -> None:
+    """
+    Test that a chain under four cases is kept as if/else compares.
+    """
+    asm = generate_assembly(get_switch_source(values=[0, 1, 2]))
+
+    assert "switch" not in asm
+    assert asm.count("\tcmp qword [x], ") == 3
+
+def test_branchless_if_else() -> None:
+    """
+    Test that if-else blocks only assigning the same identifier are lowered
+    to 'cmov' and 'setcc' without any jump.
+    """
+    asm = generate_assembly([
+        "var x: int;\n",
+        "var y: int;\n",
+        "var r: int;\n",
+        "if (x > y) {\n",
+        "add (x, 1) into r;\n",
+        "} else {\n",
+        "add (y, 2) into r;\n",
+        "}\n",
+        "if (x == 3) {\n",
+        "add (1, 0) into r;\n",
+        "} else {\n",
+        "add (0, 0) into r;\n",
+        "}\n",
+    ])
+
+    assert (
+        "\tmov rcx, [x]\n"
+        "\tcmp rcx, [y]\n"
+        "\tcmovg rax, rdx\n"
+        "\tmov [r], rax\n"
+    ) in asm
+    assert "\tcmp qword [x], 3\n\tsete al\n\tmovzx eax, al\n\tmov [r], rax\n" in asm
+    assert "\tj" not in asm.split("main:\n")[1]
+
+def test_if_else_layout() -> None:
+    """
+    Test that the if block falls through after an inverted condition and
+    only jumps over the else block.
+    """
+    asm = generate_assembly([
+        "const SYS_EXIT: int = 60;\n",
+        "var x: int;\n",
+        "var ERRNO: int;\n",
+        "if (x < 5) {\n",
+        "syscall SYS_EXIT, 1, ERRNO;\n",
+        "} else {\n",
+        "syscall SYS_EXIT, 2, ERRNO;\n",
+        "}\n",
+    ])
+
+    assert asm.split("main:\n")[1] == (
+        "\tcmp qword [x], 5\n"
+        "\tjge main.if.0.else\n"
+        "\tmov rax, [SYS_EXIT]\n"
+        "\tmov rdi, 1\n"
+        "\tsyscall\n"
+        "\tmov [ERRNO], rax\n"
+        "\tjmp main.if.0.end\n"
+        "main.if.0.else:\n"
+        "\tmov rax, [SYS_EXIT]\n"
+        "\tmov rdi, 2\n"
+        "\tsyscall\n"
+        "\tmov [ERRNO], rax\n"
+        "main.if.0.end:\n"
+    )
+
+@pytest.mark.parametrize("symbol, jump", [
+    ("==", "jne"),
+    ("!=", "je"),
+    (">", "jge"),   # 5 > x is x < 5
+    (">=", "jg"),
+    ("<", "jle"),
+    ("=<", "jl"),
+])
+def test_swapped_compare(symbol: str, jump: str) -> None:
+    """
+    Test the condition code of each comparison with the literal on the
+    left, the identifier being moved to the left of 'cmp'.
+    """
+    asm = generate_assembly([
+        "const SYS_EXIT: int = 60;\n",
+        "var x: int;\n",
+        "var ERRNO: int;\n",
+        f"if (5 {symbol} x) {{\n",
+        "syscall SYS_EXIT, 1, ERRNO;\n",
+        "} else {\n",
+        "syscall SYS_EXIT, 2, ERRNO;\n",
+        "}\n",
+    ])
+
+    assert f"\tcmp qword [x], 5\n\t{jump} main.if.0.else\n" in asm
+
+def test_float_array_op_loops() -> None:
+    """
+    Test that a float add over arrays has an AVX2 loop, an SSE2 loop and a
+    scalar remainder loop, and that '_start' checks the CPU features first.
+    """
+    asm = generate_assembly([
+        "const a[6]: float = 1.5;\n",
+        "const b[6]: float = 2.0;\n",
+        "var c[6]: float;\n",
+        "add a, b into c;\n",
+    ])
+
+    assert "_start:\n\tcall manv.cpu_features\n\tcall main\n" in asm
+    assert (
+        "\tcmp byte [manv.has_avx2], 0\n"
+        "\tje main.array_op.0.sse2\n"
+        "main.array_op.0.avx2:\n"
+        "\tvmovapd ymm0, [a + rcx*8]\n"
+        "\tvaddpd ymm0, ymm0, [b + rcx*8]\n"
+        "\tvmovapd [c + rcx*8], ymm0\n"
+        "\tadd rcx, 4\n"
+        "\tcmp rcx, 4\n"
+    ) in asm
+    assert (
+        "main.array_op.0.sse2:\n"
+        "\tmovapd xmm0, [a + rcx*8]\n"
+        "\taddpd xmm0, [b + rcx*8]\n"
+        "\tmovapd [c + rcx*8], xmm0\n"
+        "\tadd rcx, 2\n"
+        "\tcmp rcx, 6\n"
+    ) in asm
+    assert (
+        "main.array_op.0.scalar:\n"
+        "\tcmp rcx, 6\n"
+        "\tjae main.array_op.0.done\n"
+        "\tmovsd xmm0, [a + rcx*8]\n"
+        "\taddsd xmm0, [b + rcx*8]\n"
+    ) in asm
+
+    # Aligned for the 'movapd' loads and stores
+    assert "\talign 32\n\ta times 6 dq 1.5\n\talign 32\n\tb times 6 dq 2.0\n" in asm
+    assert "\talignb 32\n\tc resq 6\n" in asm
+
+def test_int_array_mul_div_scalar() -> None:
+    """
+    Test that int mul and div over arrays only have the scalar loop, there
+    are no packed 64 bits multiply and divide.
+    """
+    asm = generate_assembly([
+        "const i[5]: int = 3;\n",
+        "const j[5]: int = 4;\n",
+        "var k[5]: int;\n",
+        "mul i, j into k;\n",
+        "div i, j into k;\n",
+    ])
+
+    assert "avx2" not in asm and "sse2" not in asm and "cpu_features" not in asm
+    assert "\tmov rax, [i + rcx*8]\n\timul rax, [j + rcx*8]\n\tmov [k + rcx*8], rax\n" in asm
+    assert "\tmov rax, [i + rcx*8]\n\tcqo\n\tidiv qword [j + rcx*8]\n\tmov [k + rcx*8], rax\n" in asm
+
+def test_optimize_size_keeps_written_constants() -> None:
+    """
+    Test that -Os doesn't merge a constant the program writes to with an
+    identical one.
+    """
+    source = [
+        "const A: int = 7;\n",
+        "const B: int = 7;\n",
+        "const C: int = 7;\n",
+        "add (1, 2) into B;\n",
+    ]
+
+    tokens = Lexer().generate_tokens(data=source)
+    asm = Codegen(optimize_size=True).codegen(program=Parser().parse(tokens=tokens)).get_assembly()
+
+    assert "C:\n\tA dq 7\n" in asm
+    assert "\tB dq 7\n" in asm
+    assert asm.count("dq 7") == 2
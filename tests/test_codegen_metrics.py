@@ -0,0 +1,41 @@
+import os
+import json
+import pytest
+
+from pathlib import Path
+
+# Compiler
+from manv.compiler import generate_assembly
+
+# Codegen metrics
+from manv.metrics import codegen_metrics, compare_metrics, count_memory_accesses
+
+CORPUS_DIR_PATH = Path(__file__).parent / "codegen"
+METRICS = json.loads((CORPUS_DIR_PATH / "metrics.json").read_text())
+
+# Growth allowed before a metric regresses, as a fraction of the baseline
+TOLERANCE = float(os.environ.get("MANV_METRICS_TOLERANCE", "0"))
+
+# Test units
+@pytest.mark.parametrize("path", sorted(CORPUS_DIR_PATH.glob("*.mv")), ids=lambda path: path.name)
+def test_codegen_metrics(path) -> None:
+    """
+    Test that the generated code of the corpus didn't grow, update the
+    baselines with 'scripts/update_codegen_metrics.py'.
+    """
+    assert path.name in METRICS, "No baseline, run 'scripts/update_codegen_metrics.py'"
+
+    metrics = codegen_metrics(generate_assembly(file_path=path))
+    regressions = compare_metrics(metrics=metrics, baseline=METRICS[path.name], tolerance=TOLERANCE)
+
+    assert not regressions, f"Codegen regressed on '{path.name}': " + ", ".join(regressions)
+
+def test_memory_accesses() -> None:
+    """
+    Test how the memory accesses of instructions are counted.
+    """
+    assert count_memory_accesses("mov", ["rax", "[x]"]) == (1, 0)
+    assert count_memory_accesses("mov", ["[x]", "rax"]) == (0, 1)
+    assert count_memory_accesses("add", ["qword [x]", "1"]) == (1, 1)
+    assert count_memory_accesses("lea", ["rax", "[x]"]) == (0, 0)
+    assert count_memory_accesses("syscall", []) == (0, 0)
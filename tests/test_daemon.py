@@ -0,0 +1,76 @@
+import os
+import sys
+import stat
+import pytest
+import threading
+import subprocess
+
+# Compile daemon
+from manv import daemon
+from manv.daemon import CompileServer, forward, stop
+
+# Test units
+@pytest.mark.skipif(sys.platform != "linux", reason="Uses a Unix socket and runs a Linux executable")
+def test_forward_to_daemon(tmp_path, monkeypatch) -> None:
+    """
+    Test that a compile forwarded to the daemon runs in the client's directory.
+    """
+    socket_path = tmp_path / "manv.sock"
+
+    # Not running yet
+    assert forward(argv=["compile", "program.mv"], socket_path=socket_path) is None
+
+    server = CompileServer(socket_path=socket_path)
+    thread = threading.Thread(target=server.serve)
+    thread.start()
+
+    try:
+        (tmp_path / "program.mv").write_text(
+            "const SYS_EXIT: int = 60;\n"
+            "const CODE: int = 4;\n"
+            "var ERRNO: int;\n"
+            "syscall SYS_EXIT, CODE, ERRNO;\n"
+        )
+        monkeypatch.chdir(tmp_path)
+
+        assert forward(argv=["compile", "program.mv", "--no-cache"], socket_path=socket_path) == 0
+        assert forward(argv=["compile", "missing.mv", "--no-cache"], socket_path=socket_path) == 1
+    finally:
+        assert stop(socket_path=socket_path)
+        thread.join()
+
+    assert subprocess.run([tmp_path / "program"]).returncode == 4
+    assert not socket_path.exists()
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Uses a Unix socket and its peer credentials")
+def test_daemon_rejects_other_users(tmp_path) -> None:
+    """
+    Test that the socket is private and that the connections of other users
+    are rejected, their commands then run locally.
+    """
+    socket_path = tmp_path / "manv.sock"
+
+    server = CompileServer(socket_path=socket_path)
+    thread = threading.Thread(target=server.serve)
+    thread.start()
+
+    try:
+        assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+
+        # As seen from a daemon run by another user
+        server.uid = os.getuid() + 1
+
+        assert forward(argv=["--help"], socket_path=socket_path) is None
+    finally:
+        server.uid = os.getuid()
+
+        assert stop(socket_path=socket_path)
+        thread.join()
+
+def test_forward_without_daemon(tmp_path, monkeypatch) -> None:
+    """
+    Test that the compiler isn't hashed when no daemon is running.
+    """
+    monkeypatch.setattr(daemon, "compiler_hash", lambda: pytest.fail("The compiler was hashed"))
+
+    assert forward(argv=["compile", "program.mv"], socket_path=tmp_path / "manv.sock") is None
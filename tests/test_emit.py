@@ -0,0 +1,58 @@
+import sys
+import json
+import pytest
+import subprocess
+
+# Compiler
+from manv.compiler import compile_file
+
+# Toolchain
+from manv.toolchain import Toolchain
+
+# Intermediate representations
+from manv.emit import Emitter, EMIT_KINDS
+
+# Phases timings
+from manv.timings import PhaseTimer
+
+SOURCE = (
+    "const SYS_EXIT: int = 60;\n"
+    "const CODE: int = 6;\n"
+    "var ERRNO: int;\n"
+    "syscall SYS_EXIT, CODE, ERRNO;\n"
+)
+
+# Test units
+@pytest.mark.skipif(sys.platform != "linux", reason="Runs a Linux executable")
+def test_emit_and_time_phases(tmp_path) -> None:
+    """
+    Test that every representation is written and every phase is timed.
+    """
+    file_path = tmp_path / "program.mv"
+    file_path.write_text(SOURCE)
+
+    output_path = tmp_path / "program"
+    emitter = Emitter(output_path=output_path, kinds=set(EMIT_KINDS))
+    timer = PhaseTimer()
+
+    compile_file(
+        file_path=file_path,
+        output_path=output_path,
+        toolchain=Toolchain(libs_dir_path=tmp_path / "libs", timer=timer),
+        timer=timer,
+        emitter=emitter
+    )
+
+    tokens = [json.loads(line) for line in emitter.get_path("tokens").read_text().splitlines()]
+    ast = json.loads(emitter.get_path("ast").read_text())
+    ir = json.loads(emitter.get_path("ir").read_text())
+
+    assert [line["line"] for line in tokens] == [1, 2, 3, 4]
+    assert [statement["node"] for statement in ast["statements"]] == ["Constant", "Constant", "Variable", "Syscall"]
+    assert "global _start\n" in ir["sections"]["text"]["no_label"]
+    assert "_start:" in emitter.get_path("asm").read_text()
+    assert emitter.get_path("obj").read_bytes()[:4] == b"\x7fELF"
+
+    assert list(timer.phases) == ["lexing", "parsing", "codegen", "assembly", "linking"]
+    assert all(phase.wall >= 0 and phase.peak_rss > 0 for phase in timer.phases.values())
+    assert subprocess.run([output_path]).returncode == 6
@@ -0,0 +1,30 @@
+import sys
+import pytest
+import subprocess
+
+# Test units
+def test_cli_imports_lazily() -> None:
+    """
+    Test that loading the CLI doesn't import the compiler.
+    """
+    out = subprocess.run(
+        [sys.executable, "-c", "import sys, manv.cli; print(sorted(m for m in sys.modules if m.startswith('manv.')))"],
+        stdout=subprocess.PIPE,
+        check=True
+    )
+
+    assert out.stdout.decode().strip() == "['manv.cli', 'manv.common', 'manv.utils']"
+
+def test_startup_profile() -> None:
+    """
+    Test that the startup profile reports the imported modules.
+    """
+    out = subprocess.run(
+        [sys.executable, "-c", "from manv.launcher import main; main()", "--startup-profile", "--help"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+
+    assert out.returncode == 0
+    assert b"Usage: " in out.stdout
+    assert b"manv.cli" in out.stderr
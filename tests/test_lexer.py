@@ -88,3 +88,39 @@ def test_variable_declaration() -> None:
     ]
 
     assert actual_tokens == expected_tokens
+
+def test_operation() -> None:
+    """
+    Test mathematical operations, with and without parentheses
+    around the operands.
+    """
+    raw_code_tokens_map = {
+        "add (v, 10) into w;\n": [
+            {"KEYWORD_TOKEN": "ADD_KEYWORD"},
+            {"IDENTIFIER_TOKEN": "v"},
+            {"OP_LEFT_ELEMENT_LITERAL": "10"},
+            {"INTO_KEYWORD": "into"},
+            {"IDENTIFIER_TOKEN": "w"},
+            {"SYMBOL_TOKEN": "SEMICOLON_SYMBOL"}
+        ],
+        "mul v, w into w;\n": [
+            {"KEYWORD_TOKEN": "MUL_KEYWORD"},
+            {"IDENTIFIER_TOKEN": "v"},
+            {"IDENTIFIER_TOKEN": "w"},
+            {"INTO_KEYWORD": "into"},
+            {"IDENTIFIER_TOKEN": "w"},
+            {"SYMBOL_TOKEN": "SEMICOLON_SYMBOL"}
+        ]
+    }
+    tokens_obj = lexer.generate_tokens(
+        data=[i for i in raw_code_tokens_map]
+    )
+
+    actual_tokens = [
+        token.tokens for token in tokens_obj.tokens
+    ][-2:]
+    expected_tokens = [
+        raw_code_tokens_map[token] for token in raw_code_tokens_map
+    ]
+
+    assert actual_tokens == expected_tokens
@@ -0,0 +1,117 @@
+import io
+import os
+import sys
+import pytest
+import subprocess
+
+# Assembler
+from manv.src.assembler.assembler import Assembler
+from manv.src.assembler.elf import write_object, read_object
+
+# Linker
+from manv.src.linker.linker import Linker
+from manv.src.linker.exceptions import LinkerError
+
+def assemble(source: list[str], source_name: str):
+    """
+    Assemble a source into an object file.
+    """
+    return Assembler().assemble(lines=source, source_name=source_name)
+
+PROGRAM = [
+    "section .data\n",
+    "\tcode dq 42\n",
+    "section .text\n",
+    "extern exit\n",
+    "global _start\n",
+    "_start:\n",
+    "\tmov rdi, [code]\n",
+    "\tcall exit\n",
+]
+
+LIBRARY = [
+    "section .text\n",
+    "global exit\n",
+    "exit:\n",
+    "\tmov rax, 60\n",
+    "\tsyscall\n",
+]
+
+# Test units
+def test_read_object() -> None:
+    """
+    Test that a written object file is read back as-is.
+    """
+    obj = assemble(PROGRAM, "program.asm")
+    output = io.BytesIO()
+
+    write_object(obj=obj, output=output)
+    read = read_object(data=output.getvalue(), source_name="program.o")
+
+    assert [(section.name, bytes(section.data)) for section in read.sections] == [(section.name, bytes(section.data)) for section in obj.sections]
+    assert {(symbol.name, symbol.section, symbol.value) for symbol in read.symbols} == {(symbol.name, symbol.section, symbol.value) for symbol in obj.symbols}
+    assert read.sections[1].relocations == obj.sections[1].relocations
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Runs a Linux executable")
+def test_link_executable(tmp_path) -> None:
+    """
+    Test that a program linked with a library runs.
+    """
+    linker = Linker()
+    linker.add_object(assemble(PROGRAM, "program.asm"))
+    linker.add_library(assemble(LIBRARY, "library.asm"))
+
+    executable_path = tmp_path / "program"
+
+    with open(executable_path, "wb") as output:
+        linker.link(output=output)
+
+    os.chmod(executable_path, 0o755)
+
+    assert subprocess.run([executable_path]).returncode == 42
+
+def test_undefined_reference() -> None:
+    """
+    Test that an unresolved symbol is an error.
+    """
+    linker = Linker()
+    linker.add_object(assemble(PROGRAM, "program.asm"))
+
+    with pytest.raises(LinkerError):
+        linker.link(output=io.BytesIO())
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Runs a Linux executable")
+def test_gc_sections(tmp_path) -> None:
+    """
+    Test that the functions sections that aren't reached are dropped.
+    """
+    library = [
+        "section .rodata.unused\n",
+        "\tmessage db \"unused\"\n",
+        "section .text.unused\n",
+        "global unused\n",
+        "unused:\n",
+        "\tmov rsi, message\n",
+        "\tret\n",
+        "section .text.exit\n",
+        *LIBRARY[1:],
+    ]
+
+    unused_count = []     # Occurrences of the unused function's name and message
+
+    for gc_sections in (False, True):
+        linker = Linker(gc_sections=gc_sections)
+        linker.add_object(assemble(PROGRAM, "program.asm"))
+        linker.add_library(assemble(library, "library.asm"))
+
+        executable_path = tmp_path / f"program-{gc_sections}"
+
+        with open(executable_path, "wb") as output:
+            linker.link(output=output)
+
+        os.chmod(executable_path, 0o755)
+
+        assert subprocess.run([executable_path]).returncode == 42
+        unused_count.append(executable_path.read_bytes().count(b"unused"))
+
+    assert unused_count[0] > 0 and unused_count[1] == 0
@@ -0,0 +1,101 @@
+import json
+import pytest
+
+# Lexer
+from manv.src.lexer.lexer import Lexer
+
+# Logs
+from manv.log import logger, configure, counters, log_counters
+
+SOURCE = [
+    "const SYS_EXIT: int = 60;\n",
+    "var ERRNO: int;\n",
+    "syscall SYS_EXIT, SYS_EXIT, ERRNO;\n",
+]
+
+@pytest.fixture
+def json_logs(capsys):
+    """
+    Log as JSON at the debug level, and restore the defaults after.
+    """
+    configure(level="debug", fmt="json")
+    counters.clear()
+
+    yield lambda: [json.loads(line) for line in capsys.readouterr().err.splitlines()]
+
+    configure()
+
+# Test units
+def test_json_records(json_logs) -> None:
+    """
+    Test that the JSON records have no markup and carry their fields.
+    """
+    logger.info("Restored [cyan]'program'[reset] from the build cache", extra={"fields": {"stage": "bin"}})
+
+    record, = json_logs()
+
+    assert record["level"] == "info"
+    assert record["message"] == "Restored 'program' from the build cache"
+    assert record["stage"] == "bin"
+
+def test_counters(json_logs) -> None:
+    """
+    Test that the lexer counts its lines and tokens, and that the counters
+    are logged and reset.
+    """
+    Lexer().generate_tokens(data=SOURCE)
+
+    assert counters["lines_lexed"] == 3
+    assert counters["tokens_made"] > 0
+
+    log_counters()
+
+    records = json_logs()
+
+    assert any(record["level"] == "debug" for record in records)
+    assert records[-1]["counters"]["lines_lexed"] == 3
+    assert not counters
+
+def test_debug_disabled(capsys) -> None:
+    """
+    Test that nothing is logged under the level.
+    """
+    configure(level="info", fmt="json")
+
+    try:
+        Lexer().generate_tokens(data=SOURCE)
+    finally:
+        configure()
+
+    assert capsys.readouterr().err == ""
+
+def test_text_escapes_arguments(capsys) -> None:
+    """
+    Test that the markup of the arguments is printed as is, while the one
+    of the message is rendered.
+    """
+    configure(level="debug", fmt="text")
+
+    try:
+        logger.error("The provided file path [cyan]'%s'[reset] doesn't exists.", "[bold]a[/bold][n].mv")
+        logger.debug("Current line '%d': %r", 1, "var y[n]: float; [/cyan]")
+        logger.info("Line %r", "x [/cyan]")
+    finally:
+        configure()
+
+    out = capsys.readouterr().out
+
+    assert "The provided file path '[bold]a[/bold][n].mv' doesn't exists." in out
+    assert "[cyan]" not in out.split("\n")[0]
+    assert "Current line '1': 'var y[n]: float; [/cyan]'" in out
+    assert "Line 'x [/cyan]'" in out
+
+def test_json_escapes_arguments(json_logs) -> None:
+    """
+    Test that the arguments of the JSON records keep their brackets.
+    """
+    logger.info("Restored [cyan]'%s'[reset] from the build cache", "[red]program")
+
+    record, = json_logs()
+
+    assert record["message"] == "Restored '[red]program' from the build cache"
@@ -0,0 +1,66 @@
+# Lexer
+from manv.src.lexer.lexer import Lexer
+
+# Parser
+from manv.src.parser.parser import Parser
+
+# AST
+from manv.src.ast.nodes import IfElse, Syscall
+
+def parse(source: list[str]) -> list:
+    """
+    Parse a program source, returns its statements.
+    """
+    return Parser().parse(tokens=Lexer().generate_tokens(data=source)).statements
+
+# Test units
+def test_else_if() -> None:
+    """
+    Test that an else-if is an if-else nested in the else block.
+    """
+    statements = parse([
+        "const SYS_EXIT: int = 60;\n",
+        "var x: int;\n",
+        "var ERRNO: int;\n",
+        "if (x == 1) {\n",
+        "syscall SYS_EXIT, 1, ERRNO;\n",
+        "} else if (x == 2) {\n",
+        "syscall SYS_EXIT, 2, ERRNO;\n",
+        "} else {\n",
+        "syscall SYS_EXIT, 3, ERRNO;\n",
+        "}\n",
+    ])
+
+    if_else = statements[-1]
+
+    assert isinstance(if_else, IfElse)
+    assert [type(statement) for statement in if_else.if_block_statements] == [Syscall]
+
+    else_if, = if_else.else_block_statements
+
+    assert isinstance(else_if, IfElse)
+    assert else_if.condition.right.value == "2"
+    assert [statement.args for statement in else_if.if_block_statements] == [[2]]
+    assert [statement.args for statement in else_if.else_block_statements] == [[3]]
+
+def test_if_without_else() -> None:
+    """
+    Test that an if without an else block is kept in the program, followed
+    by the next statements.
+    """
+    statements = parse([
+        "const SYS_EXIT: int = 60;\n",
+        "var x: int;\n",
+        "var ERRNO: int;\n",
+        "if (x == 0) {\n",
+        "syscall SYS_EXIT, 10, ERRNO;\n",
+        "}\n",
+        "syscall SYS_EXIT, 3, ERRNO;\n",
+    ])
+
+    if_else, syscall = statements[-2:]
+
+    assert isinstance(if_else, IfElse)
+    assert [statement.args for statement in if_else.if_block_statements] == [[10]]
+    assert if_else.else_block_statements == []
+    assert isinstance(syscall, Syscall) and syscall.args == [3]
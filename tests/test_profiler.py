@@ -0,0 +1,79 @@
+import sys
+import pytest
+import threading
+
+# Lexer
+from manv.src.lexer.lexer import Lexer
+
+# Parser
+from manv.src.parser.parser import Parser
+
+# Profiler
+from manv.profiler import Profiler
+
+SOURCE = [
+    "const SYS_EXIT: int = 60;\n",
+    "const CODE: int = 7;\n",
+    "var ERRNO: int;\n",
+    "syscall SYS_EXIT, CODE, ERRNO;\n",
+]
+
+def run_frontend(times: int) -> None:
+    """
+    Lex and parse the source a number of times.
+    """
+    for _ in range(times):
+        Parser().parse(tokens=Lexer().generate_tokens(data=SOURCE))
+
+def read_stacks(path) -> dict[str, int]:
+    """
+    Read collapsed stacks.
+    """
+    stacks = {}
+
+    for line in path.read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        stacks[stack] = int(count)
+
+    return stacks
+
+# Test units
+@pytest.mark.skipif(sys.platform != "linux", reason="Samples on SIGPROF")
+def test_sampling_profile(tmp_path) -> None:
+    """
+    Test that the sampled stacks show the annotated phases.
+    """
+    profiler = Profiler(output_path=tmp_path / "out.folded")
+
+    with profiler:
+        run_frontend(times=2000)
+
+    stacks = read_stacks(tmp_path / "out.folded")
+
+    assert profiler.mode == "sampling"
+    assert sum(stacks.values()) == profiler.total > 0
+    assert any("[lexing];manv.src.lexer.lexer:Lexer.generate_tokens" in stack for stack in stacks)
+
+def test_cprofile_fallback(tmp_path) -> None:
+    """
+    Test that a profile outside of the main thread falls back to cProfile.
+    """
+    profilers = []
+
+    def target() -> None:
+        profiler = Profiler(output_path=tmp_path / "out.folded")
+
+        with profiler:
+            run_frontend(times=50)
+
+        profilers.append(profiler)
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+
+    stacks = read_stacks(tmp_path / "out.folded")
+
+    assert profilers[0].mode == "cprofile"
+    assert any(stack.endswith("[lexing];lexer:generate_tokens") for stack in stacks)
+    assert any(stack.endswith("[parsing];parser:parse") for stack in stacks)
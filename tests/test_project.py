@@ -0,0 +1,59 @@
+import sys
+import pytest
+import subprocess
+
+# Toolchain
+from manv.toolchain import Toolchain
+
+# Multi-module projects
+from manv.project import Project, ProjectError
+
+MAIN = (
+    "const SYS_EXIT: int = 60;\n"
+    "var ERRNO: int;\n"
+    "syscall SYS_EXIT, CODE, ERRNO;\n"
+)
+
+def build(tmp_path) -> list[str]:
+    """
+    Build the project, returns the names of the recompiled modules.
+    """
+    project = Project(
+        entry_path=tmp_path / "main.mv",
+        module_paths=[tmp_path / "codes.mv"],
+        toolchain=Toolchain(libs_dir_path=tmp_path / "libs"),
+        build_dir_path=tmp_path / "build"
+    )
+
+    return [module.path.name for module in project.build(output_path=tmp_path / "main")]
+
+# Test units
+@pytest.mark.skipif(sys.platform != "linux", reason="Runs a Linux executable")
+def test_incremental_build(tmp_path) -> None:
+    """
+    Test that only the modules affected by a change are recompiled.
+    """
+    (tmp_path / "main.mv").write_text(MAIN)
+    (tmp_path / "codes.mv").write_text("const CODE: int = 7;\nconst OTHER: int = 1;\n")
+
+    assert build(tmp_path) == ["main.mv", "codes.mv"]
+    assert subprocess.run([tmp_path / "main"]).returncode == 7
+
+    # Nothing changed
+    assert build(tmp_path) == []
+
+    # A new value, or a declaration main doesn't use, doesn't change main
+    (tmp_path / "codes.mv").write_text("const CODE: int = 9;\n")
+
+    assert build(tmp_path) == ["codes.mv"]
+    assert subprocess.run([tmp_path / "main"]).returncode == 9
+
+def test_duplicate_declaration(tmp_path) -> None:
+    """
+    Test that a symbol declared by two modules is an error.
+    """
+    (tmp_path / "main.mv").write_text("const CODE: int = 1;\n" + MAIN)
+    (tmp_path / "codes.mv").write_text("const CODE: int = 7;\n")
+
+    with pytest.raises(ProjectError):
+        build(tmp_path)
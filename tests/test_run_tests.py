@@ -0,0 +1,122 @@
+import sys
+import pytest
+import subprocess
+
+# Test runner
+from scripts.run_tests import Test, Options, run_tests, assemble_file, run_test_file
+
+LIBRARY = """section .text
+global write_exit
+write_exit:
+\tmov rax, 1
+\tmov rdi, 1
+\tsyscall
+\tmov rax, 60
+\tmov rdi, 0
+\tsyscall
+"""
+
+PROGRAM = """section .data
+\tmsg db "hi {}", 0xA
+section .text
+extern write_exit
+global _start
+_start:
+\tmov rsi, msg
+\tmov rdx, 5
+\tcall write_exit
+"""
+
+def make_test(tmp_path, name: str, stdout: list[str], source: str) -> Test:
+    """
+    Write a test program next to the library.
+    """
+    (tmp_path / f"{name}.asm").write_text(source)
+
+    test = Test()
+    test.load_toml({"Test": {
+        "test_file_path": str(tmp_path / f"{name}.asm"),
+        "lib_file_path": str(tmp_path / "lib.asm"),
+        "stdout": stdout,
+        "timeout": 1,
+    }})
+
+    return test
+
+# Test units
+@pytest.mark.skipif(sys.platform != "linux", reason="Runs Linux executables")
+def test_run_tests(tmp_path) -> None:
+    """
+    Test that the tests sharing a library pass, fail or time out on their own.
+    """
+    (tmp_path / "lib.asm").write_text(LIBRARY)
+
+    tests = [
+        make_test(tmp_path, "first", ["hi 1"], PROGRAM.format(1)),
+        make_test(tmp_path, "second", ["hi 3"], PROGRAM.format(2)),
+        make_test(tmp_path, "loop", [], "section .text\nglobal _start\nextern write_exit\n_start:\n\tjmp _start\n"),
+    ]
+
+    results = run_tests(tests=tests, options=Options(use_cache=False, work_dir_path=tmp_path), jobs=2)
+    statuses = {result["test"].rsplit("/", 1)[-1]: result["status"] for result in results}
+
+    assert statuses == {"first.asm": "PASS", "second.asm": "FAIL", "loop.asm": "TIMEOUT"}
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Runs Linux executables")
+def test_performance_budgets(tmp_path) -> None:
+    """
+    Test that a passing test over one of its budgets fails.
+    """
+    (tmp_path / "lib.asm").write_text(LIBRARY)
+
+    within = make_test(tmp_path, "within", ["hi 1"], PROGRAM.format(1))
+    within.max_wall_time = 5.0
+    within.max_binary_size = 1 << 20
+
+    over = make_test(tmp_path, "over", ["hi 2"], PROGRAM.format(2))
+    over.max_binary_size = 16
+
+    results = {
+        result["test"].rsplit("/", 1)[-1]: result
+        for result in run_tests(tests=[within, over], options=Options(use_cache=False, work_dir_path=tmp_path), jobs=2)
+    }
+
+    assert results["within.asm"]["status"] == "PASS"
+    assert [budget["metric"] for budget in results["within.asm"]["budgets"]] == ["wall_time", "binary_size"]
+    assert results["over.asm"]["status"] == "BUDGET"
+    assert results["over.asm"]["budgets"][0]["over"]
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Runs Linux executables")
+def test_wall_time_rerun_timeout(tmp_path, monkeypatch) -> None:
+    """
+    Test that a rerun timing out while measuring the wall time is reported
+    as a timeout.
+    """
+    (tmp_path / "lib.asm").write_text(LIBRARY)
+
+    test = make_test(tmp_path, "slow", ["hi 1"], PROGRAM.format(1))
+    test.max_wall_time = 5.0
+
+    options = Options(use_cache=False, work_dir_path=tmp_path)
+    object_paths = {}
+
+    for source in (test.test_file_path, test.lib_file_path):
+        _, object_paths[source], _, _ = assemble_file(source, options)
+
+    run = subprocess.run
+    calls = []
+
+    def run_once(*args, **kwargs):
+        calls.append(args)
+
+        if len(calls) > 1:
+            raise subprocess.TimeoutExpired(cmd=args[0], timeout=kwargs["timeout"])
+
+        return run(*args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "run", run_once)
+
+    result = run_test_file(test, object_paths, options)
+
+    assert result["status"] == "TIMEOUT"
+    assert result["budgets"] == []
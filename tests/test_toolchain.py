@@ -0,0 +1,113 @@
+import os
+import sys
+import shutil
+import pytest
+import subprocess
+
+# Lexer
+from manv.src.lexer.lexer import Lexer
+
+# Parser
+from manv.src.parser.parser import Parser
+
+# Codegen
+from manv.src.codegen.codegen import Codegen
+
+# Toolchain
+from manv.toolchain import Toolchain, ToolchainError
+
+# Size metrics
+from manv.metrics import executable_size_metrics
+
+# Test units
+@pytest.mark.skipif(sys.platform != "linux", reason="Runs a Linux executable")
+def test_build_without_temporary_files(tmp_path, monkeypatch) -> None:
+    """
+    Test that a build only leaves the executable in the working directory.
+    """
+    monkeypatch.chdir(tmp_path)
+
+    source = [
+        "const SYS_EXIT: int = 60;\n",
+        "const CODE: int = 3;\n",
+        "var ERRNO: int;\n",
+        "syscall SYS_EXIT, CODE, ERRNO;\n",
+    ]
+
+    tokens = Lexer().generate_tokens(data=source)
+    asm = Codegen().codegen(program=Parser().parse(tokens=tokens))
+
+    toolchain = Toolchain(libs_dir_path=tmp_path / "libs")
+    toolchain.build(asm=asm, name="program", output_path=tmp_path / "program")
+
+    assert os.listdir(tmp_path) == ["program"]
+    assert set(toolchain.timings) == {"assembler", "linker"}
+    assert subprocess.run([tmp_path / "program"]).returncode == 3
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Runs a Linux executable")
+def test_optimize_size(tmp_path) -> None:
+    """
+    Test that a -Os executable runs and is smaller than the default one.
+    """
+    source = [
+        "const SYS_EXIT: int = 60;\n",
+        "const CODE: int = 3;\n",
+        "var ERRNO: int;\n",
+        "syscall SYS_EXIT, CODE, ERRNO;\n",
+    ]
+
+    sizes = []
+
+    for optimize_size in (False, True):
+        tokens = Lexer().generate_tokens(data=source)
+        asm = Codegen(optimize_size=optimize_size).codegen(program=Parser().parse(tokens=tokens))
+
+        executable_path = tmp_path / f"program-{optimize_size}"
+        Toolchain(libs_dir_path=tmp_path / "libs", optimize_size=optimize_size).build(asm=asm, name="program", output_path=executable_path)
+
+        assert subprocess.run([executable_path]).returncode == 3
+        sizes.append(executable_size_metrics(path=executable_path))
+
+    assert sizes[1]["file"] < sizes[0]["file"] // 4
+    assert sizes[1]["code"] < sizes[0]["code"]
+    assert sizes[1]["other"] < 16   # No symbols nor section headers
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Runs a Linux executable")
+@pytest.mark.parametrize("use_ld", [False, True])
+def test_link_replaces_executable(tmp_path, use_ld) -> None:
+    """
+    Test that a failed link leaves the previous executable and no temporary
+    file, and that the link timings add up over the links.
+    """
+    source = [
+        "const SYS_EXIT: int = 60;\n",
+        "const CODE: int = 3;\n",
+        "var ERRNO: int;\n",
+        "syscall SYS_EXIT, CODE, ERRNO;\n",
+    ]
+
+    if use_ld and shutil.which("ld") is None:
+        pytest.skip("ld isn't installed")
+
+    tokens = Lexer().generate_tokens(data=source)
+    asm = Codegen().codegen(program=Parser().parse(tokens=tokens))
+
+    (tmp_path / "out").mkdir()
+    output_path = tmp_path / "out" / "program"
+
+    toolchain = Toolchain(libs_dir_path=tmp_path / "libs", use_ld=use_ld)
+    toolchain.build(asm=asm, name="program", output_path=output_path)
+
+    (tmp_path / "broken.o").write_bytes(b"not an object")
+
+    with pytest.raises(ToolchainError):
+        toolchain.link(objects=[None], object_paths=[tmp_path / "broken.o"], output_path=output_path)
+
+    assert os.listdir(tmp_path / "out") == ["program"]
+    assert subprocess.run([output_path]).returncode == 3
+
+    if not use_ld:
+        toolchain.timings["linker"] = 1000.0
+        toolchain.build(asm=asm, name="program", output_path=output_path)
+
+        assert toolchain.timings["linker"] > 1000.0
@@ -0,0 +1,38 @@
+import os
+import sys
+import pytest
+
+# Watch mode
+from manv.watch import InotifyWatcher, PollingWatcher
+
+def save(path, content: str) -> None:
+    """
+    Save a file like an editor: write a new file and rename it over.
+    """
+    new_path = path.with_name(path.name + ".new")
+    new_path.write_text(content)
+    os.replace(new_path, path)
+
+# Test units
+@pytest.mark.parametrize("watcher_class", [
+    pytest.param(InotifyWatcher, marks=pytest.mark.skipif(sys.platform != "linux", reason="Uses inotify")),
+    PollingWatcher,
+])
+def test_watch_changes(tmp_path, watcher_class) -> None:
+    """
+    Test that only the watched files are reported as changed.
+    """
+    source = tmp_path / "program.mv"
+    source.write_text("var x: int;\n")
+
+    watcher = watcher_class(paths=[source])
+
+    try:
+        assert watcher.wait(timeout=0.1) == set()
+
+        (tmp_path / "program").write_bytes(b"\x7fELF")   # Not watched
+        save(source, "var y: int;\n")
+
+        assert watcher.wait(timeout=1) == {source.resolve()}
+    finally:
+        watcher.close()